@@ -0,0 +1,124 @@
+"""Benchmark: JSON backends (LambdaDB(json_codec=...)) on vector-heavy payloads.
+
+Compares the built-in pydantic-core codec, the stdlib json module and orjson
+(skipped when not installed) for:
+
+* marshalling an upsert body (embeddings as lists, and as NumPy arrays),
+* unmarshalling a query response that includes vectors,
+* parsing a presigned docs_url body, whole and incrementally (query_stream).
+
+Run: poetry run python benchmarks/bench_json_codecs.py [--docs N] [--dims D]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+import warnings
+from typing import Any, Callable, Dict, List
+
+from lambdadb import models
+from lambdadb.utils import get_codec, get_json_codec
+from lambdadb.utils.jsonstream import JSONArraySplitter
+from lambdadb.utils.serializers import marshal_json, unmarshal_json
+
+BACKENDS = ["pydantic", "json", "orjson"]
+
+
+def _vector(dims: int) -> List[float]:
+    return [random.uniform(-1.0, 1.0) for _ in range(dims)]
+
+
+def _docs(num_docs: int, dims: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": f"doc-{i}",
+            "title": f"Document {i}",
+            "tags": ["alpha", "beta"],
+            "embedding": _vector(dims),
+        }
+        for i in range(num_docs)
+    ]
+
+
+def _stream_parse(codec: Any, raw: bytes, chunk_size: int = 65536) -> List[Any]:
+    adapter = get_codec(models.QueryCollectionDoc)
+    splitter = JSONArraySplitter()
+    items = []
+    for i in range(0, len(raw), chunk_size):
+        items.extend(codec.unmarshal(adapter, e) for e in splitter.feed(raw[i : i + chunk_size]))
+    splitter.close()
+    return items
+
+
+def _ms(fn: Callable[[], Any], number: int) -> float:
+    fn()
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100)
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    docs = _docs(args.docs, args.dims)
+    upsert_body = models.UpsertDocsRequestBody(docs=docs)
+    default = get_json_codec()
+    hits = [
+        {"collection": "bench", "score": 1.0 / (i + 1), "doc": d}
+        for i, d in enumerate(docs)
+    ]
+    query_raw = default.dumps(
+        {"took": 5, "total": len(hits), "docs": hits, "isDocsInline": True}
+    )
+    docs_url_raw = default.dumps(hits)
+
+    upsert_typ = models.UpsertDocsRequestBody
+    query_typ = models.QueryCollectionResponse
+    cases: List[tuple] = [
+        ("marshal upsert (lists)", lambda c: marshal_json(upsert_body, upsert_typ, c)),
+        ("unmarshal query response", lambda c: unmarshal_json(query_raw, query_typ, c)),
+        ("parse docs_url body", lambda c: c.loads(docs_url_raw)),
+        ("stream-parse docs_url body (64 KiB)", lambda c: _stream_parse(c, docs_url_raw)),
+    ]
+    try:
+        import numpy as np
+
+        np_body = models.UpsertDocsRequestBody(
+            docs=[
+                {**d, "embedding": np.asarray(d["embedding"], dtype=np.float32)}
+                for d in docs
+            ]
+        )
+        cases.insert(
+            1,
+            (
+                "marshal upsert (float32 ndarray)",
+                lambda c: marshal_json(np_body, upsert_typ, c),
+            ),
+        )
+    except ImportError:
+        pass
+
+    codecs = {}
+    for name in BACKENDS:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            try:
+                codecs[name] = get_json_codec(name)
+            except RuntimeWarning:
+                print(f"({name} not installed; skipped)")
+
+    print(f"{args.docs} docs x {args.dims}d, {len(query_raw) / 1e6:.1f} MB query response")
+    print(f"{'case (ms per call)':<36}" + "".join(f"{n:>12}" for n in codecs))
+    for label, fn in cases:
+        row = "".join(f"{_ms(lambda: fn(c), args.number):>12.2f}" for c in codecs.values())
+        print(f"{label:<36}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark: docs/second parsed by query and fetch with response_mode="model" vs "raw".
+
+Requests are answered in-process by an httpx.MockTransport, so the numbers
+cover the SDK's own work: the HTTP client stack, JSON parsing and (in model
+mode) pydantic validation. Inline results and a presigned docs_url body are
+both measured.
+
+Run: poetry run python benchmarks/bench_response_modes.py [--docs N] [--dims D] [--json-codec NAME]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import timeit
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+from lambdadb import LambdaDB
+
+
+def _hits(num_docs: int, dims: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "collection": "bench",
+            "score": 1.0 / (i + 1),
+            "doc": {
+                "id": f"doc-{i}",
+                "title": f"Document {i}",
+                "tags": ["alpha", "beta"],
+                "embedding": [random.uniform(-1.0, 1.0) for _ in range(dims)],
+            },
+        }
+        for i in range(num_docs)
+    ]
+
+
+def _client(hits: List[Dict[str, Any]], inline: bool, json_codec: str) -> LambdaDB:
+    docs_body = json.dumps(hits).encode()
+    if inline:
+        body = {"took": 3, "total": len(hits), "docs": hits, "isDocsInline": True}
+    else:
+        body = {
+            "took": 3,
+            "total": len(hits),
+            "docs": [],
+            "isDocsInline": False,
+            "docsUrl": "https://s3.bench/docs",
+        }
+    api_body = json.dumps(body).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "s3.bench":
+            return httpx.Response(200, content=docs_body)
+        return httpx.Response(
+            200, content=api_body, headers={"content-type": "application/json"}
+        )
+
+    return LambdaDB(
+        project_api_key="bench",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        json_codec=json_codec,
+    )
+
+
+def _docs_per_sec(fn: Callable[[], Any], num_docs: int, number: int) -> float:
+    fn()
+    best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    return num_docs / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100)
+    parser.add_argument("--dims", type=int, default=768)
+    parser.add_argument("--number", type=int, default=10)
+    parser.add_argument("--json-codec", default="pydantic")
+    args = parser.parse_args()
+
+    random.seed(0)
+    hits = _hits(args.docs, args.dims)
+    query = {"queryString": {"query": "title:document"}}
+    print(f"{args.docs} docs x {args.dims}d per response, json_codec={args.json_codec!r}")
+    print(f"{'case (docs/s)':<28}{'model':>14}{'raw':>14}{'speedup':>10}")
+    for inline in (True, False):
+        coll = _client(hits, inline, args.json_codec).collection("bench")
+        label = "inline" if inline else "docs_url"
+        cases = [
+            (f"query ({label})", lambda mode: coll.query(query=query, response_mode=mode)),
+            (f"fetch ({label})", lambda mode: coll.docs.fetch(ids=["x"], response_mode=mode)),
+        ]
+        for name, call in cases:
+            rates = [
+                _docs_per_sec(lambda: call(mode), args.docs, args.number)
+                for mode in ("model", "raw")
+            ]
+            print(f"{name:<28}{rates[0]:>14,.0f}{rates[1]:>14,.0f}{rates[1] / rates[0]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Microbenchmark: per-call overhead of request/response (un)marshalling.
+
+Compares the previous implementation, which built a throwaway pydantic model
+with ``create_model`` on every call, against the cached per-type codecs in
+``lambdadb.utils.serializers``.
+
+Run: poetry run python benchmarks/bench_serializers.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict, List
+
+from pydantic import ConfigDict, create_model
+from pydantic_core import from_json
+
+from lambdadb import models
+from lambdadb.utils.serializers import marshal_json, unmarshal_json
+
+
+def legacy_unmarshal_json(raw: Any, typ: Any) -> Any:
+    unmarshaller = create_model(
+        "Unmarshaller",
+        body=(typ, ...),
+        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
+    )
+    return unmarshaller(body=from_json(raw)).body  # type: ignore[attr-defined]
+
+
+def legacy_marshal_json(val: Any, typ: Any) -> str:
+    marshaller = create_model(
+        "Marshaller",
+        body=(typ, ...),
+        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
+    )
+    d = marshaller(body=val).model_dump(by_alias=True, mode="json", exclude_none=True)
+    if len(d) == 0:
+        return ""
+    return json.dumps(d[next(iter(d))], separators=(",", ":"))
+
+
+def _query_response_body(num_docs: int) -> str:
+    docs = [
+        {
+            "collection": "bench",
+            "score": 1.0 / (i + 1),
+            "doc": {"id": str(i), "title": f"doc {i}", "tags": ["a", "b"]},
+        }
+        for i in range(num_docs)
+    ]
+    return json.dumps(
+        {"took": 3, "total": num_docs, "maxScore": 1.0, "docs": docs, "isDocsInline": True}
+    )
+
+
+def _upsert_body(num_docs: int, dims: int) -> models.UpsertDocsRequestBody:
+    docs: List[Dict[str, Any]] = [
+        {"id": str(i), "text": f"doc {i}", "vector": [0.1] * dims}
+        for i in range(num_docs)
+    ]
+    return models.UpsertDocsRequestBody(docs=docs)
+
+
+def _numpy_upsert_body(num_docs: int, dims: int) -> Any:
+    """Upsert body with ndarray vectors; None when NumPy is not installed."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    vec = np.random.default_rng(0).random(dims, dtype=np.float32)
+    docs = [{"id": str(i), "text": f"doc {i}", "vector": vec} for i in range(num_docs)]
+    return models.UpsertDocsRequestBody(docs=docs)
+
+
+def _tolist_body(body: models.UpsertDocsRequestBody) -> models.UpsertDocsRequestBody:
+    """What callers had to do before ndarray support: .tolist() every vector."""
+    return models.UpsertDocsRequestBody(
+        docs=[{**d, "vector": d["vector"].tolist()} for d in body.docs]
+    )
+
+
+def _per_call_us(fn: Callable[[], Any], number: int) -> float:
+    fn()  # warm up (first call builds the cached codec)
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    cases = [
+        ("QueryCollectionResponse (10 docs)", "unmarshal", _query_response_body(10)),
+        ("QueryCollectionResponse (100 docs)", "unmarshal", _query_response_body(100)),
+        ("UpsertDocsRequestBody (1 doc)", "marshal", _upsert_body(1, 8)),
+        ("UpsertDocsRequestBody (100 docs x 128d)", "marshal", _upsert_body(100, 128)),
+    ]
+    numpy_body = _numpy_upsert_body(100, 1536)
+    if numpy_body is not None:
+        cases.append(("Upsert ndarray float32 (100 x 1536d)", "numpy", numpy_body))
+
+    print(f"{'case':<42}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for name, kind, payload in cases:
+        if kind == "unmarshal":
+            typ = models.QueryCollectionResponse
+            before = _per_call_us(
+                lambda: legacy_unmarshal_json(payload, typ), args.number
+            )
+            after = _per_call_us(lambda: unmarshal_json(payload, typ), args.number)
+        elif kind == "numpy":
+            typ = models.UpsertDocsRequestBody
+            before = _per_call_us(
+                lambda: legacy_marshal_json(_tolist_body(payload), typ), args.number
+            )
+            after = _per_call_us(lambda: marshal_json(payload, typ), args.number)
+        else:
+            typ = models.UpsertDocsRequestBody
+            before = _per_call_us(lambda: legacy_marshal_json(payload, typ), args.number)
+            after = _per_call_us(lambda: marshal_json(payload, typ), args.number)
+        print(f"{name:<42}{before:>14.1f}{after:>14.1f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
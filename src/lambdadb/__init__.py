@@ -9,7 +9,17 @@ from .version import (
 )
 from .sdk import *
 from .sdkconfiguration import *
-from .collection import RequestOptions
+from .batching import BatchOutcome, BatchResult
+from .collection import (
+    FetchManyResult,
+    LazyResults,
+    QueryManyResult,
+    QueryOutcome,
+    RequestOptions,
+)
+from .doccache import DocCache, DocCacheStats
+from .querycache import QueryCache, QueryCacheStats
+from .writer import AsyncBufferedWriter, BufferedWriter
 from .models import (
     FetchDocsResponse,
     ListDocsResponse,
@@ -0,0 +1,58 @@
+"""Invalidates LambdaDB(query_cache=..., doc_cache=...) entries when the client writes to a collection."""
+
+from typing import Optional, Tuple
+from urllib.parse import unquote
+
+import httpx
+
+from .types import AfterErrorContext, AfterErrorHook, AfterSuccessContext, AfterSuccessHook, HookContext
+
+# Operations that change what a query or fetch on the collection can return.
+WRITE_OPERATIONS = frozenset(
+    {
+        "upsertDocs",
+        "updateDocs",
+        "deleteDocs",
+        "bulkUpsertDocs",
+        "updateCollection",
+        "deleteCollection",
+    }
+)
+
+
+def _collection_of(request: Optional[httpx.Request]) -> Optional[str]:
+    """Collection name from a /collections/{collectionName}/... request path."""
+    if request is None:
+        return None
+    parts = request.url.path.split("/")
+    try:
+        return unquote(parts[parts.index("collections") + 1]) or None
+    except (ValueError, IndexError):
+        return None
+
+
+class CacheInvalidationHook(AfterSuccessHook, AfterErrorHook):
+    def _invalidate(self, hook_ctx: HookContext, response: Optional[httpx.Response]) -> None:
+        if hook_ctx.operation_id not in WRITE_OPERATIONS:
+            return
+        # Without a response the collection is unknown; drop everything.
+        collection_name = _collection_of(response.request) if response is not None else None
+        for cache in (hook_ctx.config.query_cache, hook_ctx.config.doc_cache):
+            if cache is not None:
+                cache.invalidate(collection_name)
+
+    def after_success(
+        self, hook_ctx: AfterSuccessContext, response: httpx.Response
+    ) -> httpx.Response:
+        self._invalidate(hook_ctx, response)
+        return response
+
+    def after_error(
+        self,
+        hook_ctx: AfterErrorContext,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> Tuple[Optional[httpx.Response], Optional[Exception]]:
+        # A write that failed or timed out may still have been applied.
+        self._invalidate(hook_ctx, response)
+        return response, error
@@ -1,3 +1,4 @@
+from .cache_invalidation import CacheInvalidationHook
 from .types import Hooks
 
 
@@ -7,7 +8,9 @@ from .types import Hooks
 
 
 def init_hooks(hooks: Hooks):
-    # pylint: disable=unused-argument
     """Add hooks by calling hooks.register{sdk_init/before_request/after_success/after_error}Hook
     with an instance of a hook that implements that specific Hook interface
     Hooks are registered per SDK instance, and are valid for the lifetime of the SDK instance"""
+    cache_hook = CacheInvalidationHook()
+    hooks.register_after_success_hook(cache_hook)
+    hooks.register_after_error_hook(cache_hook)
@@ -13,6 +13,7 @@ from .types import (
 )
 from typing import List, Optional, Tuple
 from lambdadb.sdkconfiguration import SDKConfiguration
+from .registration import init_hooks
 
 
 class SDKHooks(Hooks):
@@ -21,6 +22,7 @@ class SDKHooks(Hooks):
         self.before_request_hooks: List[BeforeRequestHook] = []
         self.after_success_hooks: List[AfterSuccessHook] = []
         self.after_error_hooks: List[AfterErrorHook] = []
+        init_hooks(self)
 
     def register_sdk_init_hook(self, hook: SDKInitHook) -> None:
         self.sdk_init_hooks.append(hook)
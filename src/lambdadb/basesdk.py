@@ -3,11 +3,16 @@
 from .sdkconfiguration import SDKConfiguration
 import httpx
 from lambdadb import errors, models, utils
+from lambdadb.httpclient import default_timeout
 from lambdadb._hooks import AfterErrorContext, AfterSuccessContext, BeforeRequestContext
+from lambdadb.utils.deadlines import bound_request, remaining
+from lambdadb.utils.resilience import Circuit
+from lambdadb.utils.singleflight import request_key
 from lambdadb.utils import (
     RetryConfig,
     SerializedRequestBody,
     get_body_content,
+    get_response_content,
     run_sync_in_thread,
 )
 from typing import Callable, List, Mapping, Optional, Tuple
@@ -216,7 +221,9 @@ class BaseSDK:
             for header, value in http_headers.items():
                 headers[header] = value
 
-        timeout = timeout_ms / 1000 if timeout_ms is not None else None
+        timeout = (
+            timeout_ms / 1000 if timeout_ms is not None else default_timeout(client)
+        )
 
         return client.build_request(
             method,
@@ -229,6 +236,12 @@ class BaseSDK:
             timeout=timeout,
         )
 
+    def _circuit(self, hook_ctx, request) -> Optional[Circuit]:
+        breaker = self.sdk_configuration.circuit_breaker
+        if breaker is None:
+            return None
+        return breaker.circuit(hook_ctx.operation_id, request.url.host)
+
     def do_request(
         self,
         hook_ctx,
@@ -239,6 +252,7 @@ class BaseSDK:
     ) -> httpx.Response:
         client = self.sdk_configuration.client
         logger = self.sdk_configuration.debug_logger
+        rate_limiter = self.sdk_configuration.rate_limiter
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
 
@@ -257,7 +271,15 @@ class BaseSDK:
                 if client is None:
                     raise ValueError("client is required")
 
+                # A limiter wait that would outlast the deadline fails right away.
+                if rate_limiter is not None and not rate_limiter.acquire(
+                    hook_ctx.operation_id, remaining()
+                ):
+                    raise errors.DeadlineExceededError(hook_ctx.operation_id)
+                bound_request(req, hook_ctx.operation_id)
                 http_res = client.send(req, stream=stream)
+                if rate_limiter is not None:
+                    rate_limiter.record(hook_ctx.operation_id, http_res)
             except Exception as e:
                 _, e = hooks.after_error(AfterErrorContext(hook_ctx), None, e)
                 if e is not None:
@@ -273,7 +295,7 @@ class BaseSDK:
                 http_res.status_code,
                 http_res.url,
                 http_res.headers,
-                "<streaming response>" if stream else http_res.text,
+                "<streaming response>" if stream else get_response_content(http_res),
             )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
@@ -291,15 +313,45 @@ class BaseSDK:
 
             return http_res
 
-        if retry_config is not None:
-            http_res = utils.retry(do, utils.Retries(retry_config[0], retry_config[1]))
-        else:
-            http_res = do()
+        circuit = self._circuit(hook_ctx, request)
+        hedge_policy = self.sdk_configuration.hedge_policy
+        if stream or (
+            hedge_policy is not None and not hedge_policy.applies(hook_ctx.operation_id)
+        ):
+            hedge_policy = None
+
+        def attempt():
+            if hedge_policy is not None:
+                return hedge_policy.call(hook_ctx.operation_id, do)
+            return do()
+
+        def do_with_retries():
+            if retry_config is not None:
+                http_res = utils.retry(
+                    attempt,
+                    utils.Retries(
+                        retry_config[0],
+                        retry_config[1],
+                        self.sdk_configuration.retry_budget,
+                        circuit,
+                    ),
+                )
+            elif circuit is not None:
+                http_res = circuit.call(attempt)
+            else:
+                http_res = attempt()
+
+            if not utils.match_status_codes(error_status_codes, http_res.status_code):
+                http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
 
-        if not utils.match_status_codes(error_status_codes, http_res.status_code):
-            http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
+            return http_res
 
-        return http_res
+        singleflight = self.sdk_configuration.singleflight
+        if singleflight is not None and not stream:
+            key = request_key(hook_ctx.operation_id, request)
+            if key is not None:
+                return singleflight.do(key, do_with_retries)
+        return do_with_retries()
 
     async def do_request_async(
         self,
@@ -311,6 +363,7 @@ class BaseSDK:
     ) -> httpx.Response:
         client = self.sdk_configuration.async_client
         logger = self.sdk_configuration.debug_logger
+        rate_limiter = self.sdk_configuration.rate_limiter
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
 
@@ -332,7 +385,15 @@ class BaseSDK:
                 if client is None:
                     raise ValueError("client is required")
 
+                # A limiter wait that would outlast the deadline fails right away.
+                if rate_limiter is not None and not await rate_limiter.acquire_async(
+                    hook_ctx.operation_id, remaining()
+                ):
+                    raise errors.DeadlineExceededError(hook_ctx.operation_id)
+                bound_request(req, hook_ctx.operation_id)
                 http_res = await client.send(req, stream=stream)
+                if rate_limiter is not None:
+                    rate_limiter.record(hook_ctx.operation_id, http_res)
             except Exception as e:
                 _, e = await run_sync_in_thread(
                     hooks.after_error, AfterErrorContext(hook_ctx), None, e
@@ -351,7 +412,7 @@ class BaseSDK:
                 http_res.status_code,
                 http_res.url,
                 http_res.headers,
-                "<streaming response>" if stream else http_res.text,
+                "<streaming response>" if stream else get_response_content(http_res),
             )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
@@ -370,16 +431,44 @@ class BaseSDK:
 
             return http_res
 
-        if retry_config is not None:
-            http_res = await utils.retry_async(
-                do, utils.Retries(retry_config[0], retry_config[1])
-            )
-        else:
-            http_res = await do()
+        circuit = self._circuit(hook_ctx, request)
+        hedge_policy = self.sdk_configuration.hedge_policy
+        if stream or (
+            hedge_policy is not None and not hedge_policy.applies(hook_ctx.operation_id)
+        ):
+            hedge_policy = None
+
+        async def attempt():
+            if hedge_policy is not None:
+                return await hedge_policy.call_async(hook_ctx.operation_id, do)
+            return await do()
+
+        async def do_with_retries():
+            if retry_config is not None:
+                http_res = await utils.retry_async(
+                    attempt,
+                    utils.Retries(
+                        retry_config[0],
+                        retry_config[1],
+                        self.sdk_configuration.retry_budget,
+                        circuit,
+                    ),
+                )
+            elif circuit is not None:
+                http_res = await circuit.call_async(attempt)
+            else:
+                http_res = await attempt()
+
+            if not utils.match_status_codes(error_status_codes, http_res.status_code):
+                http_res = await run_sync_in_thread(
+                    hooks.after_success, AfterSuccessContext(hook_ctx), http_res
+                )
 
-        if not utils.match_status_codes(error_status_codes, http_res.status_code):
-            http_res = await run_sync_in_thread(
-                hooks.after_success, AfterSuccessContext(hook_ctx), http_res
-            )
+            return http_res
 
-        return http_res
+        singleflight = self.sdk_configuration.singleflight
+        if singleflight is not None and not stream:
+            key = request_key(hook_ctx.operation_id, request)
+            if key is not None:
+                return await singleflight.do_async(key, do_with_retries)
+        return await do_with_retries()
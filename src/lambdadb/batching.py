@@ -0,0 +1,61 @@
+"""Upsert body encoding and batch outcomes shared by collection.py and writer.py."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from lambdadb import models, utils
+
+# Max request payload for upsert/update (6MB)
+_UPSERT_MAX_PAYLOAD_BYTES = 6000000
+# Framing of a bulk upsert object: {"docs":[<doc>,<doc>,...]}
+_BULK_BODY_PREFIX = b'{"docs":['
+_BULK_BODY_SUFFIX = b"]}"
+
+
+def _encode_doc(doc: Dict[str, Any], json_codec: Optional[utils.JSONCodec] = None) -> bytes:
+    """Encode a single document as compact UTF-8 JSON (NumPy vectors are accepted as-is)."""
+    return (json_codec or utils.default_json_codec()).dumps(doc)
+
+
+@dataclass
+class BatchOutcome:
+    """Outcome of one batch sent by a *_many operation."""
+
+    index: int
+    """Position of the batch in send order."""
+    num_items: int
+    response: Optional[models.MessageResponse] = None
+    error: Optional[Exception] = None
+    items: Optional[List[Any]] = None
+    """The batch's docs or IDs; kept only for failed batches so they can be retried."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchResult:
+    """Aggregate result of a *_many operation, with one outcome per batch in send order."""
+
+    batches: List[BatchOutcome] = field(default_factory=list)
+
+    @property
+    def failures(self) -> List[BatchOutcome]:
+        return [b for b in self.batches if not b.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(b.ok for b in self.batches)
+
+    @property
+    def num_succeeded(self) -> int:
+        """Number of items (docs or IDs) in batches that succeeded."""
+        return sum(b.num_items for b in self.batches if b.ok)
+
+    @property
+    def num_failed(self) -> int:
+        """Number of items (docs or IDs) in batches that failed."""
+        return sum(b.num_items for b in self.batches if not b.ok)
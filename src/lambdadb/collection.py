@@ -4,18 +4,86 @@ Aligns with REST: document operations under .docs, collection-level query at .qu
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import contextvars
+import functools
+import heapq
+import itertools
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 from lambdadb import models, utils
+from lambdadb.batching import (
+    BatchOutcome,
+    BatchResult,
+    _BULK_BODY_PREFIX,
+    _BULK_BODY_SUFFIX,
+    _UPSERT_MAX_PAYLOAD_BYTES,
+    _encode_doc,
+)
 from lambdadb.docs import Docs
+from lambdadb.httpclient import default_timeout
 from lambdadb.collections import Collections
 from lambdadb.sdkconfiguration import SDKConfiguration
+from lambdadb.doccache import _doc_cache_variant, _doc_id, _doc_size, _merge_cached
+from lambdadb.querycache import _query_cache_key
 from lambdadb.types import OptionalNullable, UNSET
+from lambdadb.utils.deadlines import (
+    aiter_within_deadline,
+    bound_request,
+    deadline,
+    iter_within_deadline,
+)
+from lambdadb.utils.jsonstream import JSONArraySplitter
+from lambdadb.writer import AsyncBufferedWriter, BufferedWriter
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+_F = TypeVar("_F", bound=Callable[..., Any])
 
 # API max page size for list_docs
 _LIST_DOCS_MAX_SIZE = 100
+# API max number of IDs per fetch request
+_FETCH_MAX_IDS = 100
+# IDs delete_many holds across partial per-partition groups before sending the oldest early
+_DELETE_MAX_BUFFERED_IDS = 10000
+# Default bulk upsert object size limit (200MB), used when the API does not report one
+_BULK_SIZE_LIMIT_BYTES = 209715200
+
+
+def _client_timeout(timeout_sec: Optional[float], client: Any) -> Any:
+    """Timeout for a presigned transfer request: timeout_sec, else the client's default."""
+    return default_timeout(client) if timeout_sec is None else timeout_sec
+
+
+def _presigned_error(res: Any) -> RuntimeError:
+    return RuntimeError(
+        f"Failed to fetch documents from presigned URL: HTTP {res.status_code} - {res.text}"
+    )
 
 
 def _fetch_bytes_from_presigned_url(
@@ -24,13 +92,16 @@ def _fetch_bytes_from_presigned_url(
     timeout_sec: Optional[float],
 ) -> bytes:
     """GET presigned URL and return response body. Raises RuntimeError on non-2xx."""
-    req = client.build_request("GET", url, timeout=timeout_sec)
-    res = client.send(req)
-    if res.status_code < 200 or res.status_code >= 300:
-        raise RuntimeError(
-            f"Failed to fetch documents from presigned URL: HTTP {res.status_code} - {res.text}"
-        )
-    return res.content
+    req = client.build_request("GET", url, timeout=_client_timeout(timeout_sec, client))
+    bound_request(req, "presigned download")
+    res = client.send(req, stream=True)
+    try:
+        if res.status_code < 200 or res.status_code >= 300:
+            res.read()
+            raise _presigned_error(res)
+        return b"".join(iter_within_deadline(res.iter_bytes(), "presigned download"))
+    finally:
+        res.close()
 
 
 async def _fetch_bytes_from_presigned_url_async(
@@ -39,28 +110,290 @@ async def _fetch_bytes_from_presigned_url_async(
     timeout_sec: Optional[float],
 ) -> bytes:
     """GET presigned URL (async) and return response body. Raises RuntimeError on non-2xx."""
-    req = async_client.build_request("GET", url, timeout=timeout_sec)
-    res = await async_client.send(req)
-    if res.status_code < 200 or res.status_code >= 300:
-        raise RuntimeError(
-            f"Failed to fetch documents from presigned URL: HTTP {res.status_code} - {res.text}"
-        )
-    return res.content
+    req = async_client.build_request("GET", url, timeout=_client_timeout(timeout_sec, async_client))
+    bound_request(req, "presigned download")
+    res = await async_client.send(req, stream=True)
+    try:
+        if res.status_code < 200 or res.status_code >= 300:
+            await res.aread()
+            raise _presigned_error(res)
+        chunks = aiter_within_deadline(res.aiter_bytes(), "presigned download")
+        return b"".join([chunk async for chunk in chunks])
+    finally:
+        await res.aclose()
+
+
+def _load_json_array(body: bytes, json_codec: Optional[utils.JSONCodec]) -> List[Any]:
+    """Parse a presigned docs_url body, which must be a JSON array."""
+    data = (json_codec or utils.default_json_codec()).loads(body)
+    if not isinstance(data, list):
+        raise RuntimeError("Expected JSON array from docs_url")
+    return data
+
+
+def _stream_presigned_items(
+    url: str,
+    client: Any,
+    timeout_sec: Optional[float],
+    item_type: Any,
+    json_codec: Optional[utils.JSONCodec] = None,
+) -> Iterator[Any]:
+    """GET a presigned docs_url with a streamed body and yield each array element, validated
+    as item_type, as soon as it has downloaded. Raises RuntimeError on non-2xx or a malformed body."""
+    codec = json_codec or utils.default_json_codec()
+    adapter = utils.get_codec(item_type)
+    splitter = JSONArraySplitter()
+    req = client.build_request("GET", url, timeout=_client_timeout(timeout_sec, client))
+    bound_request(req, "presigned download")
+    res = client.send(req, stream=True)
+    try:
+        if res.status_code < 200 or res.status_code >= 300:
+            res.read()
+            raise _presigned_error(res)
+        for chunk in iter_within_deadline(res.iter_bytes(), "presigned download"):
+            for raw in _split_docs(splitter, chunk):
+                yield codec.unmarshal(adapter, raw)
+        _split_docs(splitter, None)
+    finally:
+        res.close()
+
+
+async def _stream_presigned_items_async(
+    url: str,
+    async_client: Any,
+    timeout_sec: Optional[float],
+    item_type: Any,
+    json_codec: Optional[utils.JSONCodec] = None,
+) -> AsyncIterator[Any]:
+    """Async variant of _stream_presigned_items."""
+    codec = json_codec or utils.default_json_codec()
+    adapter = utils.get_codec(item_type)
+    splitter = JSONArraySplitter()
+    req = async_client.build_request("GET", url, timeout=_client_timeout(timeout_sec, async_client))
+    bound_request(req, "presigned download")
+    res = await async_client.send(req, stream=True)
+    try:
+        if res.status_code < 200 or res.status_code >= 300:
+            await res.aread()
+            raise _presigned_error(res)
+        async for chunk in aiter_within_deadline(res.aiter_bytes(), "presigned download"):
+            for raw in _split_docs(splitter, chunk):
+                yield codec.unmarshal(adapter, raw)
+        _split_docs(splitter, None)
+    finally:
+        await res.aclose()
+
+
+def _split_docs(splitter: JSONArraySplitter, chunk: Optional[bytes]) -> List[bytes]:
+    """Feed a chunk (None at end of body) to splitter, reporting malformed bodies as RuntimeError."""
+    try:
+        if chunk is None:
+            splitter.close()
+            return []
+        return splitter.feed(chunk)
+    except ValueError as e:
+        raise RuntimeError(f"Invalid JSON array from docs_url: {e}") from e
+
+
+def _resolve_raw_response(
+    data: Dict[str, Any],
+    client: Any,
+    timeout_sec: Optional[float],
+    json_codec: Optional[utils.JSONCodec] = None,
+) -> Dict[str, Any]:
+    """response_mode="raw" counterpart of the _resolve_*_response helpers: if the body has docsUrl and
+    not isDocsInline, return it with "docs" filled from the URL (plain JSON data, no validation)."""
+    if data.get("isDocsInline", True) or not data.get("docsUrl"):
+        return data
+    body = _fetch_bytes_from_presigned_url(data["docsUrl"], client, timeout_sec)
+    return {**data, "docs": _load_json_array(body, json_codec)}
+
+
+async def _resolve_raw_response_async(
+    data: Dict[str, Any],
+    async_client: Any,
+    timeout_sec: Optional[float],
+    json_codec: Optional[utils.JSONCodec] = None,
+) -> Dict[str, Any]:
+    if data.get("isDocsInline", True) or not data.get("docsUrl"):
+        return data
+    body = await _fetch_bytes_from_presigned_url_async(
+        data["docsUrl"], async_client, timeout_sec
+    )
+    return {**data, "docs": _load_json_array(body, json_codec)}
+
+
+class LazyResults(list):
+    """Results of a query/fetch/list response made with lazy=True whose documents are behind a
+    presigned docs_url. The documents are downloaded on first read (iteration, len, indexing,
+    `in`, comparisons and the other read-only list methods) or explicitly with load() / await load_async(); .total, .took and the other response
+    fields never need the download. Call load() before serializing the response; model_dump() and
+    model_dump_json() raise while the documents are not loaded rather than emit an empty list.
+    """
+
+    def __init__(
+        self,
+        docs_url: str,
+        item_type: Any,
+        client: Any,
+        async_client: Any,
+        timeout_sec: Optional[float],
+        json_codec: Optional[utils.JSONCodec] = None,
+    ) -> None:
+        super().__init__()
+        self.docs_url = docs_url
+        self._item_type = item_type
+        self._client = client
+        self._async_client = async_client
+        self._timeout_sec = timeout_sec
+        self._json_codec = json_codec
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the documents have been downloaded."""
+        return self._loaded
+
+    def load(self) -> "LazyResults":
+        """Download the documents now, if not done yet. Returns self."""
+        with self._lock:
+            if not self._loaded:
+                if self._client is None:
+                    raise RuntimeError(
+                        "No sync HTTP client to download docs_url; use `await results.load_async()`"
+                    )
+                self._fill(
+                    _fetch_bytes_from_presigned_url(self.docs_url, self._client, self._timeout_sec)
+                )
+        return self
+
+    async def load_async(self) -> "LazyResults":
+        """Download the documents now (async), if not done yet. Returns self."""
+        if not self._loaded:
+            if self._async_client is None:
+                raise RuntimeError("No async HTTP client to download docs_url; use results.load()")
+            body = await _fetch_bytes_from_presigned_url_async(
+                self.docs_url, self._async_client, self._timeout_sec
+            )
+            with self._lock:
+                if not self._loaded:
+                    self._fill(body)
+        return self
+
+    def _fill(self, body: bytes) -> None:
+        data: List[Any] = _load_json_array(body, self._json_codec)
+        if self._item_type is not None:
+            # The item type is only known at runtime, so subscript List through Any.
+            data = utils.unmarshal(data, cast(Any, List)[self._item_type])
+        list.extend(self, data)
+        self._loaded = True
+
+    def __iter__(self):
+        return list.__iter__(self.load())
+
+    def __reversed__(self):
+        return list.__reversed__(self.load())
+
+    def __len__(self) -> int:
+        return list.__len__(self.load())
+
+    def __getitem__(self, index):
+        return list.__getitem__(self.load(), index)
+
+    def __contains__(self, item: Any) -> bool:
+        return list.__contains__(self.load(), item)
+
+    def __eq__(self, other: Any) -> bool:
+        return list.__eq__(self.load(), other)
+
+    def __ne__(self, other: Any) -> bool:
+        return list.__ne__(self.load(), other)
+
+    def __lt__(self, other: Any) -> bool:
+        return list.__lt__(self.load(), other)
+
+    def __le__(self, other: Any) -> bool:
+        return list.__le__(self.load(), other)
+
+    def __gt__(self, other: Any) -> bool:
+        return list.__gt__(self.load(), other)
+
+    def __ge__(self, other: Any) -> bool:
+        return list.__ge__(self.load(), other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    # list's C implementations of these read the (still empty) storage directly.
+    def count(self, value: Any) -> int:
+        return list.count(self.load(), value)
+
+    def index(self, value: Any, *args: Any) -> int:
+        return list.index(self.load(), value, *args)
+
+    def copy(self) -> List[Any]:
+        return list.copy(self.load())
+
+    def __add__(self, other: Any) -> Any:
+        return list.__add__(self.load(), other)
+
+    def __radd__(self, other: Any) -> Any:
+        return other + list.copy(self.load())
+
+    def __iadd__(self, other: Any) -> Any:
+        return list.__iadd__(self.load(), other)
+
+    def __mul__(self, n: Any) -> Any:
+        return list.__mul__(self.load(), n)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, n: Any) -> Any:
+        return list.__imul__(self.load(), n)
+
+    def __repr__(self) -> str:
+        if not self._loaded:
+            return f"LazyResults(<not loaded: {self.docs_url}>)"
+        return f"LazyResults({list.__repr__(self)})"
+
+
+def _with_lazy_results(
+    response: _R,
+    item_type: Any,
+    sdk_configuration: SDKConfiguration,
+    timeout_ms: Optional[int],
+) -> _R:
+    """If response has docs_url and not is_docs_inline, return a copy whose results download on first access."""
+    if response.is_docs_inline or not response.docs_url:  # type: ignore[attr-defined]
+        return response
+    timeout_sec = _timeout_sec(timeout_ms, sdk_configuration)
+    results = LazyResults(
+        response.docs_url,  # type: ignore[attr-defined]
+        item_type,
+        sdk_configuration.get_transfer_client(),
+        sdk_configuration.get_transfer_async_client(),
+        timeout_sec,
+        sdk_configuration.json_codec,
+    )
+    # model_construct keeps the LazyResults instance (validation would copy it into a plain list).
+    return type(response).model_construct(  # type: ignore[attr-defined]
+        _fields_set=response.model_fields_set,  # type: ignore[attr-defined]
+        **{**dict(response), "results": results},  # type: ignore[call-overload]
+    )
 
 
 def _resolve_query_response(
     response: models.QueryCollectionResponse,
     client: Any,
     timeout_sec: Optional[float],
+    json_codec: Optional[utils.JSONCodec] = None,
 ) -> models.QueryCollectionResponse:
     """If response has docs_url and not is_docs_inline, fetch from URL and return response with results populated."""
     if response.is_docs_inline or not response.docs_url:
         return response
     body = _fetch_bytes_from_presigned_url(response.docs_url, client, timeout_sec)
-    data = json.loads(body)
-    if not isinstance(data, list):
-        raise RuntimeError("Expected JSON array from docs_url")
-    parsed = [models.QueryCollectionDoc.model_validate(item) for item in data]
+    data = _load_json_array(body, json_codec)
+    parsed = utils.unmarshal(data, List[models.QueryCollectionDoc])
     return models.QueryCollectionResponse(
         took=response.took,
         total=response.total,
@@ -75,15 +408,14 @@ def _resolve_fetch_response(
     response: models.FetchDocsResponse,
     client: Any,
     timeout_sec: Optional[float],
+    json_codec: Optional[utils.JSONCodec] = None,
 ) -> models.FetchDocsResponse:
     """If response has docs_url and not is_docs_inline, fetch from URL and return response with results populated."""
     if response.is_docs_inline or not response.docs_url:
         return response
     body = _fetch_bytes_from_presigned_url(response.docs_url, client, timeout_sec)
-    data = json.loads(body)
-    if not isinstance(data, list):
-        raise RuntimeError("Expected JSON array from docs_url")
-    parsed = [models.FetchDocsDoc.model_validate(item) for item in data]
+    data = _load_json_array(body, json_codec)
+    parsed = utils.unmarshal(data, List[models.FetchDocsDoc])
     return models.FetchDocsResponse(
         total=response.total,
         took=response.took,
@@ -97,16 +429,15 @@ async def _resolve_query_response_async(
     response: models.QueryCollectionResponse,
     async_client: Any,
     timeout_sec: Optional[float],
+    json_codec: Optional[utils.JSONCodec] = None,
 ) -> models.QueryCollectionResponse:
     if response.is_docs_inline or not response.docs_url:
         return response
     body = await _fetch_bytes_from_presigned_url_async(
         response.docs_url, async_client, timeout_sec
     )
-    data = json.loads(body)
-    if not isinstance(data, list):
-        raise RuntimeError("Expected JSON array from docs_url")
-    parsed = [models.QueryCollectionDoc.model_validate(item) for item in data]
+    data = _load_json_array(body, json_codec)
+    parsed = utils.unmarshal(data, List[models.QueryCollectionDoc])
     return models.QueryCollectionResponse(
         took=response.took,
         total=response.total,
@@ -121,16 +452,15 @@ async def _resolve_fetch_response_async(
     response: models.FetchDocsResponse,
     async_client: Any,
     timeout_sec: Optional[float],
+    json_codec: Optional[utils.JSONCodec] = None,
 ) -> models.FetchDocsResponse:
     if response.is_docs_inline or not response.docs_url:
         return response
     body = await _fetch_bytes_from_presigned_url_async(
         response.docs_url, async_client, timeout_sec
     )
-    data = json.loads(body)
-    if not isinstance(data, list):
-        raise RuntimeError("Expected JSON array from docs_url")
-    parsed = [models.FetchDocsDoc.model_validate(item) for item in data]
+    data = _load_json_array(body, json_codec)
+    parsed = utils.unmarshal(data, List[models.FetchDocsDoc])
     return models.FetchDocsResponse(
         total=response.total,
         took=response.took,
@@ -144,14 +474,13 @@ def _resolve_list_docs_response(
     response: models.ListDocsResponse,
     client: Any,
     timeout_sec: Optional[float],
+    json_codec: Optional[utils.JSONCodec] = None,
 ) -> models.ListDocsResponse:
     """If response has docs_url and not is_docs_inline, fetch from URL and return response with results populated."""
     if response.is_docs_inline or not response.docs_url:
         return response
     body = _fetch_bytes_from_presigned_url(response.docs_url, client, timeout_sec)
-    data = json.loads(body)
-    if not isinstance(data, list):
-        raise RuntimeError("Expected JSON array from docs_url")
+    data = _load_json_array(body, json_codec)
     return models.ListDocsResponse(
         total=response.total,
         results=data,
@@ -165,15 +494,14 @@ async def _resolve_list_docs_response_async(
     response: models.ListDocsResponse,
     async_client: Any,
     timeout_sec: Optional[float],
+    json_codec: Optional[utils.JSONCodec] = None,
 ) -> models.ListDocsResponse:
     if response.is_docs_inline or not response.docs_url:
         return response
     body = await _fetch_bytes_from_presigned_url_async(
         response.docs_url, async_client, timeout_sec
     )
-    data = json.loads(body)
-    if not isinstance(data, list):
-        raise RuntimeError("Expected JSON array from docs_url")
+    data = _load_json_array(body, json_codec)
     return models.ListDocsResponse(
         total=response.total,
         results=data,
@@ -183,6 +511,386 @@ async def _resolve_list_docs_response_async(
     )
 
 
+def _bulk_body_size(parts: List[bytes], parts_size: int) -> int:
+    """Size in bytes of a bulk object built from encoded docs totalling parts_size bytes."""
+    separators = max(len(parts) - 1, 0)
+    return len(_BULK_BODY_PREFIX) + parts_size + separators + len(_BULK_BODY_SUFFIX)
+
+
+class _DocBatcher:
+    """Groups docs into batches whose {"docs":[...]} body stays within size_limit bytes
+    and, optionally, max_docs documents. Batches hold the encoded docs, or the docs
+    themselves when keep_encoded is False."""
+
+    def __init__(
+        self,
+        size_limit: int,
+        max_docs: Optional[int] = None,
+        keep_encoded: bool = True,
+        json_codec: Optional[utils.JSONCodec] = None,
+    ) -> None:
+        self._size_limit = size_limit
+        self._max_docs = max_docs
+        self._keep_encoded = keep_encoded
+        self._json_codec = json_codec
+        self._items: List[Any] = []
+        self._parts_size = 0
+
+    def add(self, doc: Dict[str, Any]) -> Optional[List[Any]]:
+        """Buffer a doc. Returns the previous batch when the doc does not fit into it."""
+        encoded = _encode_doc(doc, self._json_codec)
+        if _bulk_body_size([encoded], len(encoded)) > self._size_limit:
+            raise ValueError(
+                f"Document of {len(encoded)} bytes exceeds size limit {self._size_limit} bytes"
+            )
+        full: Optional[List[Any]] = None
+        if self._items and (
+            _bulk_body_size(self._items, self._parts_size) + 1 + len(encoded)
+            > self._size_limit
+            or (self._max_docs is not None and len(self._items) >= self._max_docs)
+        ):
+            full = self.flush()
+        self._items.append(encoded if self._keep_encoded else doc)
+        self._parts_size += len(encoded)
+        return full
+
+    def flush(self) -> Optional[List[Any]]:
+        """Return the buffered batch (if any) and start a new one."""
+        if not self._items:
+            return None
+        items = self._items
+        self._items = []
+        self._parts_size = 0
+        return items
+
+
+def _iter_doc_batches(
+    docs: Iterable[Dict[str, Any]],
+    size_limit: int,
+    max_docs: Optional[int] = None,
+    keep_encoded: bool = False,
+    json_codec: Optional[utils.JSONCodec] = None,
+) -> Iterator[List[Any]]:
+    """Split docs into batches whose {"docs":[...]} body fits size_limit and max_docs."""
+    batcher = _DocBatcher(size_limit, max_docs, keep_encoded, json_codec)
+    for doc in docs:
+        full = batcher.add(doc)
+        if full is not None:
+            yield full
+    rest = batcher.flush()
+    if rest is not None:
+        yield rest
+
+
+def _iter_bulk_body(encoded_docs: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield a bulk object body from encoded docs without joining them in memory."""
+    yield _BULK_BODY_PREFIX
+    first = True
+    for part in encoded_docs:
+        if not first:
+            yield b","
+        first = False
+        yield part
+    yield _BULK_BODY_SUFFIX
+
+
+def _iter_encoded_docs(
+    docs: Iterable[Dict[str, Any]], json_codec: Optional[utils.JSONCodec] = None
+) -> Iterator[bytes]:
+    for doc in docs:
+        yield _encode_doc(doc, json_codec)
+
+
+def _measure_bulk_body(
+    docs: Iterable[Dict[str, Any]],
+    size_limit: int,
+    json_codec: Optional[utils.JSONCodec] = None,
+) -> int:
+    """Size in bytes of the bulk object for docs, encoding one doc at a time.
+    Raises ValueError as soon as the running size exceeds size_limit."""
+    size = len(_BULK_BODY_PREFIX) + len(_BULK_BODY_SUFFIX)
+    for i, doc in enumerate(docs):
+        size += len(_encode_doc(doc, json_codec)) + (1 if i else 0)
+        if size > size_limit:
+            raise ValueError(
+                f"Documents payload size exceeds limit {size_limit} bytes "
+                f"(reached {size} bytes after {i + 1} documents)"
+            )
+    return size
+
+
+def _checked_body(chunks: Iterable[bytes], size: int) -> Iterator[bytes]:
+    """Pass chunks through, failing if they produce more than the announced Content-Length."""
+    sent = 0
+    for chunk in chunks:
+        sent += len(chunk)
+        if sent > size:
+            raise RuntimeError(
+                "Documents changed while being uploaded: body exceeds announced Content-Length"
+            )
+        yield chunk
+
+
+async def _aiter_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _put_bulk_object(
+    url: str,
+    chunks: Iterable[bytes],
+    size: int,
+    client: Any,
+    timeout_sec: Optional[float],
+) -> None:
+    """Stream a bulk object body of known size to a presigned URL. Raises RuntimeError on non-2xx."""
+    # Presigned PUTs need a Content-Length; setting it keeps httpx from using chunked encoding.
+    req = client.build_request(
+        "PUT",
+        url,
+        content=_checked_body(chunks, size),
+        headers={"Content-Type": "application/json", "Content-Length": str(size)},
+        timeout=_client_timeout(timeout_sec, client),
+    )
+    bound_request(req, "presigned upload")
+    upload_res = client.send(req)
+    if upload_res.status_code < 200 or upload_res.status_code >= 300:
+        raise RuntimeError(
+            f"Bulk upload to S3 failed: HTTP {upload_res.status_code} - {upload_res.text}"
+        )
+
+
+async def _put_bulk_object_async(
+    url: str,
+    chunks: Iterable[bytes],
+    size: int,
+    async_client: Any,
+    timeout_sec: Optional[float],
+) -> None:
+    """Stream a bulk object body of known size to a presigned URL (async). Raises RuntimeError on non-2xx."""
+    req = async_client.build_request(
+        "PUT",
+        url,
+        content=_aiter_chunks(_checked_body(chunks, size)),
+        headers={"Content-Type": "application/json", "Content-Length": str(size)},
+        timeout=_client_timeout(timeout_sec, async_client),
+    )
+    bound_request(req, "presigned upload")
+    upload_res = await async_client.send(req)
+    if upload_res.status_code < 200 or upload_res.status_code >= 300:
+        raise RuntimeError(
+            f"Bulk upload to S3 failed: HTTP {upload_res.status_code} - {upload_res.text}"
+        )
+
+
+async def _aiter(items: Union[Iterable[_T], AsyncIterable[_T]]) -> AsyncIterator[_T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _chunk_pages(
+    batches: Iterable[List[Dict[str, Any]]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Re-chunk per-response document batches into pages of exactly `size` (the last may be
+    shorter). An empty collection yields a single empty page."""
+    buffer: List[Dict[str, Any]] = []
+    yielded = False
+    for batch in batches:
+        buffer.extend(batch)
+        while len(buffer) >= size:
+            yield buffer[:size]
+            buffer = buffer[size:]
+            yielded = True
+    if buffer or not yielded:
+        yield buffer
+
+
+def _prefetch(source: Iterator[_T], depth: int) -> Iterator[_T]:
+    """Drive source from a background thread, keeping up to `depth` items ready ahead of
+    the consumer. Items keep their order; an exception in source is re-raised to the
+    consumer, and closing the returned iterator stops the thread."""
+    items: "queue.Queue[Tuple[bool, Any]]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: Tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run() -> None:
+        try:
+            for item in source:
+                if not put((True, item)):
+                    return
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            put((False, e))
+            return
+        put((False, None))
+
+    # Run in a copy of the caller's context so its contextvars (deadline, tracing) apply.
+    threading.Thread(
+        target=contextvars.copy_context().run, args=(run,), name="lambdadb-prefetch", daemon=True
+    ).start()
+    try:
+        while True:
+            ok, value = items.get()
+            if ok:
+                yield value
+            elif value is None:
+                return
+            else:
+                raise value
+    finally:
+        stop.set()
+
+
+async def _chunk_pages_async(
+    batches: AsyncIterator[List[Dict[str, Any]]], size: int
+) -> AsyncGenerator[List[Dict[str, Any]], None]:
+    """Async variant of _chunk_pages."""
+    buffer: List[Dict[str, Any]] = []
+    yielded = False
+    async for batch in batches:
+        buffer.extend(batch)
+        while len(buffer) >= size:
+            yield buffer[:size]
+            buffer = buffer[size:]
+            yielded = True
+    if buffer or not yielded:
+        yield buffer
+
+
+async def _prefetch_async(source: AsyncIterator[_T], depth: int) -> AsyncGenerator[_T, None]:
+    """Drive source from a background task, keeping up to `depth` items ready ahead of
+    the consumer. Same ordering and error semantics as _prefetch; closing the returned
+    iterator cancels the task."""
+    items: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue(maxsize=depth)
+
+    async def run() -> None:
+        try:
+            async for item in source:
+                await items.put((True, item))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            await items.put((False, e))
+            return
+        await items.put((False, None))
+
+    task = asyncio.ensure_future(run())
+    try:
+        while True:
+            ok, value = await items.get()
+            if ok:
+                yield value
+            elif value is None:
+                return
+            else:
+                raise value
+    finally:
+        # Wait for the cancelled task, then close source, so that an abandoned scan
+        # leaves neither a pending task nor an unfinished async generator behind.
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _map_bounded(
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    concurrency: int,
+    stop_on_error: bool = True,
+) -> List["Future[_R]"]:
+    """Run fn over items on a thread pool with at most `concurrency` calls in flight.
+    Items are pulled lazily, so at most `concurrency` of them are held at once. With
+    stop_on_error, no new calls start after one fails. Returns futures in item order,
+    all of them finished."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    slots = threading.BoundedSemaphore(concurrency)
+    failed = threading.Event()
+    futures: List["Future[_R]"] = []
+
+    def on_done(fut: "Future[_R]") -> None:
+        if fut.cancelled() or fut.exception() is not None:
+            failed.set()
+        slots.release()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        try:
+            for item in items:
+                slots.acquire()
+                if stop_on_error and failed.is_set():
+                    slots.release()
+                    break
+                # Run in a copy of the caller's context so its deadline applies.
+                fut = pool.submit(contextvars.copy_context().run, fn, item)
+                futures.append(fut)
+                fut.add_done_callback(on_done)
+        except BaseException:
+            for fut in futures:
+                fut.cancel()
+            raise
+    return futures
+
+
+async def _map_bounded_async(
+    fn: Callable[[_T], Awaitable[_R]],
+    items: Union[Iterable[_T], AsyncIterable[_T]],
+    concurrency: int,
+    stop_on_error: bool = True,
+) -> List["asyncio.Future[_R]"]:
+    """Async twin of _map_bounded: runs fn over items as tasks with at most `concurrency` in flight."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    slots = asyncio.Semaphore(concurrency)
+    failed = False
+    tasks: List["asyncio.Future[_R]"] = []
+
+    async def run(item: _T) -> _R:
+        nonlocal failed
+        try:
+            return await fn(item)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            slots.release()
+
+    try:
+        async for item in _aiter(items):
+            await slots.acquire()
+            if stop_on_error and failed:
+                slots.release()
+                break
+            tasks.append(asyncio.ensure_future(run(item)))
+        if tasks:
+            await asyncio.wait(tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancelled tasks to unwind so none outlives the call.
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return tasks
+
+
+def _timeout_sec(timeout_ms: Optional[int], config: SDKConfiguration) -> Optional[float]:
+    """Per-request timeout in seconds: explicit timeout_ms, else the SDK default."""
+    if timeout_ms is not None:
+        return timeout_ms / 1000.0
+    return config.timeout_ms / 1000.0 if config.timeout_ms else None
+
+
 def _doc_from_item(item: Any) -> Dict[str, Any]:
     """Normalize list_docs item: return item['doc'] if present else item."""
     if isinstance(item, dict) and "doc" in item:
@@ -198,6 +906,273 @@ class RequestOptions:
     server_url: Optional[str] = None
     timeout_ms: Optional[int] = None
     http_headers: Optional[Mapping[str, str]] = None
+    total_timeout_ms: Optional[int] = None
+    """Time allowed for the whole call, including retries, backoff and presigned transfers;
+    timeout_ms still bounds each attempt. Iterators and streams ignore it (use utils.deadline)."""
+
+
+@dataclass
+class FetchManyResult:
+    """Documents returned by fetch_many, in the order their IDs were first requested."""
+
+    results: List[models.FetchDocsDoc] = field(default_factory=list)
+    """Found items (each has .doc, .collection), in input order with duplicate IDs removed."""
+    missing: List[str] = field(default_factory=list)
+    """Requested IDs that were not found, in input order."""
+
+    @property
+    def documents(self) -> List[Dict[str, Any]]:
+        """Convenience: list of document bodies only. Use .results when you need .collection."""
+        return [d.doc for d in self.results]
+
+
+@dataclass
+class QueryOutcome:
+    """Outcome of one query sent by query_many."""
+
+    index: int
+    """Position of the query in the input."""
+    response: Optional[models.QueryCollectionResponse] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class QueryManyResult:
+    """Result of query_many, with one outcome per query in input order."""
+
+    outcomes: List[QueryOutcome] = field(default_factory=list)
+
+    @property
+    def responses(self) -> List[Optional[models.QueryCollectionResponse]]:
+        """Responses in input order; None for queries that failed."""
+        return [o.response for o in self.outcomes]
+
+    @property
+    def failures(self) -> List[QueryOutcome]:
+        return [o for o in self.outcomes if not o.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(o.ok for o in self.outcomes)
+
+
+def _query_many_result(done: Iterable[Any]) -> QueryManyResult:
+    """Collect finished futures or tasks (in input order) into a QueryManyResult."""
+    result = QueryManyResult()
+    for index, fut in enumerate(done):
+        error = fut.exception()
+        result.outcomes.append(
+            QueryOutcome(index, None if error is not None else fut.result(), error)
+        )
+    return result
+
+
+def _shard_ids(ids: Iterable[str], shard_size: int) -> Tuple[List[str], List[List[str]]]:
+    """Dedupe ids (keeping first occurrences) and split them into shards of shard_size."""
+    unique = list(dict.fromkeys(ids))
+    return unique, [unique[i : i + shard_size] for i in range(0, len(unique), shard_size)]
+
+
+def _fields_with_id(
+    fields: Optional[Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]],
+) -> Tuple[Optional[models.FieldsSelectorUnion], bool]:
+    """Fields selector that always returns "id" (needed to match results to IDs), and
+    whether "id" has to be stripped from the results because the caller left it out."""
+    if fields is None:
+        return None, False
+    selector: Dict[str, Any] = (
+        dict(fields) if isinstance(fields, dict) else fields.model_dump(exclude_none=True)
+    )
+    strip_id = False
+    include = selector.get("include")
+    if include is not None and "id" not in include:
+        selector["include"] = [*include, "id"]
+        strip_id = True
+    exclude = selector.get("exclude")
+    if exclude is not None and "id" in exclude:
+        selector["exclude"] = [f for f in exclude if f != "id"]
+        strip_id = True
+    if "include" in selector:
+        return models.FieldsSelector1(**selector), strip_id
+    return models.FieldsSelector2(**selector), strip_id
+
+
+def _order_fetched(
+    ids: List[str], responses: Iterable[models.FetchDocsResponse], strip_id: bool = False
+) -> FetchManyResult:
+    """Arrange fetched items in the order of ids and list the IDs that were not returned.
+    With strip_id, "id" is removed from copies of the returned docs."""
+    by_id: Dict[Any, models.FetchDocsDoc] = {}
+    for response in responses:
+        for item in response.results:
+            by_id.setdefault(item.doc.get("id"), item)
+    result = FetchManyResult()
+    for doc_id in ids:
+        found = by_id.get(doc_id)
+        if found is None:
+            result.missing.append(doc_id)
+        elif strip_id:
+            # Copies: the items may be shared with the client's doc_cache.
+            doc = {k: v for k, v in found.doc.items() if k != "id"}
+            result.results.append(found.model_copy(update={"doc": doc}))
+        else:
+            result.results.append(found)
+    return result
+
+
+class _DeleteBatcher:
+    """Groups IDs into delete batches of batch_size. With partition_field, items are
+    (id, partition_value) pairs and each batch holds IDs of a single partition value,
+    sent with a matching partition_filter. At most max_buffered IDs are held across all
+    partial groups; past that, the oldest group is sent early as a partial batch."""
+
+    def __init__(
+        self,
+        batch_size: int,
+        partition_field: Optional[str] = None,
+        max_buffered: int = _DELETE_MAX_BUFFERED_IDS,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._batch_size = batch_size
+        self._partition_field = partition_field
+        self._max_buffered = max(max_buffered, batch_size)
+        self._groups: Dict[Any, List[Any]] = {}
+        self._buffered = 0
+
+    def _batch(
+        self, key: Any, items: List[Any]
+    ) -> Tuple[List[Any], Optional[models.PartitionFilter]]:
+        if self._partition_field is None:
+            return items, None
+        return items, models.PartitionFilter(field=self._partition_field, in_=[key])
+
+    def add(
+        self, item: Any
+    ) -> Optional[Tuple[List[Any], Optional[models.PartitionFilter]]]:
+        """Buffer an ID (or pair). Returns a batch once its group reaches batch_size, or
+        the oldest group once max_buffered IDs are held."""
+        if self._partition_field is None:
+            key = None
+        else:
+            try:
+                _, key = item
+            except (TypeError, ValueError):
+                raise ValueError(
+                    "Expected (id, partition_value) pairs when grouping by partition"
+                ) from None
+        group = self._groups.setdefault(key, [])
+        group.append(item)
+        self._buffered += 1
+        if len(group) < self._batch_size:
+            if self._buffered < self._max_buffered:
+                return None
+            key = next(iter(self._groups))  # dicts keep insertion order: the oldest group
+        items = self._groups.pop(key)
+        self._buffered -= len(items)
+        return self._batch(key, items)
+
+    def flush(self) -> List[Tuple[List[Any], Optional[models.PartitionFilter]]]:
+        """Return the remaining partial batches."""
+        batches = [self._batch(key, items) for key, items in self._groups.items()]
+        self._groups = {}
+        self._buffered = 0
+        return batches
+
+
+def _iter_delete_batches(
+    ids: Iterable[Any], batch_size: int, partition_field: Optional[str]
+) -> Iterator[Tuple[List[Any], Optional[models.PartitionFilter]]]:
+    batcher = _DeleteBatcher(batch_size, partition_field)
+    for item in ids:
+        batch = batcher.add(item)
+        if batch is not None:
+            yield batch
+    yield from batcher.flush()
+
+
+def _partition_field_of(response: models.GetCollectionResponse, collection_name: str) -> str:
+    config = response.collection.partition_config
+    if config is None or not config.field_name:
+        raise ValueError(
+            f"Collection '{collection_name}' has no partition_config; "
+            "pass partition_field= or do not group by partition"
+        )
+    return config.field_name
+
+
+class _MergeKey:
+    """Orders query hits by (value, descending) components; missing values sort last."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: List[Tuple[Any, bool]]) -> None:
+        self.parts = parts
+
+    def __lt__(self, other: "_MergeKey") -> bool:
+        for (a, desc), (b, _) in zip(self.parts, other.parts):
+            if a == b:
+                continue
+            if a is None or b is None:
+                return b is None
+            return a > b if desc else a < b
+        return False
+
+
+def _doc_value(doc: Dict[str, Any], path: str) -> Any:
+    value: Any = doc
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _parse_sort(sort: List[Dict[str, Any]]) -> List[Tuple[str, bool]]:
+    """[{"field": "desc"}, {"other": {"order": "asc"}}] -> [("field", True), ("other", False)]."""
+    keys: List[Tuple[str, bool]] = []
+    for entry in sort:
+        for name, direction in entry.items():
+            if isinstance(direction, dict):
+                direction = direction.get("order", "asc")
+            keys.append((name, str(direction).lower() == "desc"))
+    return keys
+
+
+def _merge_query_responses(
+    responses: List[models.QueryCollectionResponse],
+    size: Optional[int],
+    sort: Optional[List[Dict[str, Any]]] = None,
+) -> models.QueryCollectionResponse:
+    """k-way merge of per-partition results (each already ordered by the server) into one response.
+    Hits are ordered by score (descending), or by the sort keys when given."""
+    if sort:
+        keys = _parse_sort(sort)
+
+        def key(item: models.QueryCollectionDoc) -> _MergeKey:
+            return _MergeKey([(_doc_value(item.doc, name), desc) for name, desc in keys])
+
+    else:
+
+        def key(item: models.QueryCollectionDoc) -> _MergeKey:
+            return _MergeKey([(item.score, True)])
+
+    limit = size if size is not None else max((len(r.results) for r in responses), default=0)
+    merged = list(
+        itertools.islice(heapq.merge(*(r.results for r in responses), key=key), limit)
+    )
+    scores = [r.max_score for r in responses if r.max_score is not None]
+    return models.QueryCollectionResponse(
+        took=max((r.took for r in responses), default=0),
+        total=sum(r.total for r in responses),
+        results=merged,
+        is_docs_inline=True,
+        max_score=max(scores) if scores else None,
+    )
 
 
 def _merge_options(
@@ -217,6 +1192,27 @@ def _merge_options(
     return r, s, t, h
 
 
+def _with_total_timeout(func: _F) -> _F:
+    """Run a method under the deadline set by its options.total_timeout_ms, if any."""
+    if asyncio.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def run_async(*args: Any, **kwargs: Any) -> Any:
+            options = kwargs.get("options")
+            with deadline(options.total_timeout_ms if options is not None else None):
+                return await func(*args, **kwargs)
+
+        return cast(_F, run_async)
+
+    @functools.wraps(func)
+    def run(*args: Any, **kwargs: Any) -> Any:
+        options = kwargs.get("options")
+        with deadline(options.total_timeout_ms if options is not None else None):
+            return func(*args, **kwargs)
+
+    return cast(_F, run)
+
+
 class CollectionDocs:
     """Document operations scoped to a single collection.
     Use via client.collection(name).docs (e.g. .list(), .fetch(), .upsert()).
@@ -226,18 +1222,51 @@ class CollectionDocs:
         self._docs = docs
         self._collection_name = collection_name
 
+    @overload
+    def list(
+        self,
+        *,
+        size: Optional[int] = None,
+        page_token: Optional[str] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Literal["raw"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    def list(
+        self,
+        *,
+        size: Optional[int] = None,
+        page_token: Optional[str] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[Literal["model"]] = None,
+    ) -> models.ListDocsResponse: ...
+
+    @_with_total_timeout
     def list(
         self,
         *,
         size: Optional[int] = None,
         page_token: Optional[str] = None,
+        lazy: bool = False,
         options: Optional[RequestOptions] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.ListDocsResponse:
-        """List documents in this collection. When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url. For advanced options use options=RequestOptions(...)."""
+        response_mode: Optional[str] = None,
+    ) -> Union[models.ListDocsResponse, Dict[str, Any]]:
+        """List documents in this collection. When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url (on first access to .results with lazy=True; see LazyResults). response_mode="raw" returns the response body as a plain dict (presigned docs resolved into "docs") without model validation. For advanced options use options=RequestOptions(...)."""
         r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
         response = self._docs.list_docs(
             collection_name=self._collection_name,
@@ -247,82 +1276,189 @@ class CollectionDocs:
             server_url=s,
             timeout_ms=t,
             http_headers=h,
+            response_mode=response_mode,
         )
-        client = self._docs.sdk_configuration.client
-        if client is not None:
-            timeout_sec = (t / 1000.0) if t is not None else (self._docs.sdk_configuration.timeout_ms / 1000.0 if self._docs.sdk_configuration.timeout_ms else None)
-            response = _resolve_list_docs_response(response, client, timeout_sec)
+        client = self._docs.sdk_configuration.get_transfer_client()
+        if self._docs.sdk_configuration.raw_responses(response_mode):
+            if lazy or client is None:
+                return cast(Dict[str, Any], response)
+            timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+            return _resolve_raw_response(cast(Dict[str, Any], response), client, timeout_sec, self._docs.sdk_configuration.json_codec)
+        if lazy:
+            response = _with_lazy_results(response, None, self._docs.sdk_configuration, t)
+        elif client is not None:
+            timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+            response = _resolve_list_docs_response(response, client, timeout_sec, self._docs.sdk_configuration.json_codec)
         return response
 
-    def list_pages(
-        self,
-        *,
-        size: int = 100,
-        options: Optional[RequestOptions] = None,
+    def _iter_list_batches(
+        self, size: int, r: Any, s: Any, t: Any, h: Any
     ) -> Iterator[List[Dict[str, Any]]]:
-        """Iterate pages of up to `size` documents each. Aggregates API responses so each
-        yielded page has up to `size` documents (LambdaDB may return fewer per request due to payload limits).
-        """
-        r, s, t, h = _merge_options(options, UNSET, None, None, None)
+        """Yield the documents of each list_docs response, following next_page_token."""
         page_token: Optional[str] = None
-        buffer: List[Dict[str, Any]] = []
         while True:
-            need = size - len(buffer)
-            if need <= 0:
-                page = buffer[:size]
-                buffer = buffer[size:]
-                yield page
-                if not buffer and page_token is None:
-                    return
-                continue
-            resp = self._docs.list_docs(
+            # Raw mode: the docs are plain dicts anyway, so skip building response models.
+            data = cast(Dict[str, Any], self._docs.list_docs(
                 collection_name=self._collection_name,
-                size=min(need, _LIST_DOCS_MAX_SIZE),
+                size=min(size, _LIST_DOCS_MAX_SIZE),
                 page_token=page_token,
                 retries=r,
                 server_url=s,
                 timeout_ms=t,
                 http_headers=h,
-            )
-            client = self._docs.sdk_configuration.client
+                response_mode="raw",
+            ))
+            client = self._docs.sdk_configuration.get_transfer_client()
             if client is not None:
-                timeout_sec = (t / 1000.0) if t is not None else (self._docs.sdk_configuration.timeout_ms / 1000.0 if self._docs.sdk_configuration.timeout_ms else None)
-                resp = _resolve_list_docs_response(resp, client, timeout_sec)
-            for item in resp.results:
-                buffer.append(_doc_from_item(item))
-            page_token = resp.next_page_token
-            if len(buffer) >= size or page_token is None:
-                page = buffer[:size]
-                buffer = buffer[size:]
-                yield page
-                if page_token is None:
-                    if buffer:
-                        yield buffer
-                    return
+                timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+                data = _resolve_raw_response(data, client, timeout_sec, self._docs.sdk_configuration.json_codec)
+            yield [_doc_from_item(item) for item in data.get("docs") or []]
+            page_token = data.get("nextPageToken")
+            if page_token is None:
+                return
+
+    def list_pages(
+        self,
+        *,
+        size: int = 100,
+        prefetch: int = 0,
+        options: Optional[RequestOptions] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate pages of up to `size` documents each. Aggregates API responses so each
+        yielded page has up to `size` documents (LambdaDB may return fewer per request due to payload limits).
+        With prefetch=N, a background thread keeps up to N responses (presigned docs_url already resolved)
+        fetched ahead of the consumer, in next_page_token order.
+        """
+        r, s, t, h = _merge_options(options, UNSET, None, None, None)
+        batches = self._iter_list_batches(size, r, s, t, h)
+        if prefetch > 0:
+            batches = _prefetch(batches, prefetch)
+        return _chunk_pages(batches, size)
 
     def iter_all(
         self,
         *,
         page_size: int = 100,
+        prefetch: int = 0,
         options: Optional[RequestOptions] = None,
     ) -> Iterator[Dict[str, Any]]:
-        """Iterate over all documents in the collection. Handles pagination internally."""
-        for page in self.list_pages(size=page_size, options=options):
+        """Iterate over all documents in the collection. Handles pagination internally.
+        With prefetch=N, up to N responses are fetched ahead in a background thread."""
+        for page in self.list_pages(size=page_size, prefetch=prefetch, options=options):
             for doc in page:
                 yield doc
 
+    async def _iter_list_batches_async(
+        self, size: int, r: Any, s: Any, t: Any, h: Any
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Async variant of _iter_list_batches."""
+        page_token: Optional[str] = None
+        while True:
+            data = cast(Dict[str, Any], await self._docs.list_docs_async(
+                collection_name=self._collection_name,
+                size=min(size, _LIST_DOCS_MAX_SIZE),
+                page_token=page_token,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+                response_mode="raw",
+            ))
+            async_client = self._docs.sdk_configuration.get_transfer_async_client()
+            if async_client is not None:
+                timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+                data = await _resolve_raw_response_async(data, async_client, timeout_sec, self._docs.sdk_configuration.json_codec)
+            yield [_doc_from_item(item) for item in data.get("docs") or []]
+            page_token = data.get("nextPageToken")
+            if page_token is None:
+                return
+
+    async def list_pages_async(
+        self,
+        *,
+        size: int = 100,
+        prefetch: int = 0,
+        options: Optional[RequestOptions] = None,
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Iterate pages of up to `size` documents each (async). Same page aggregation as list_pages.
+        With prefetch=N, a background task keeps up to N responses fetched ahead of the consumer.
+        """
+        r, s, t, h = _merge_options(options, UNSET, None, None, None)
+        batches = self._iter_list_batches_async(size, r, s, t, h)
+        if prefetch > 0:
+            batches = _prefetch_async(batches, prefetch)
+        pages = _chunk_pages_async(batches, size)
+        try:
+            async for page in pages:
+                yield page
+        finally:
+            # Closing an async generator does not close the ones it iterates; close the
+            # chain now so an abandoned scan stops its read-ahead task right away.
+            await pages.aclose()
+            await batches.aclose()
+
+    async def iter_all_async(
+        self,
+        *,
+        page_size: int = 100,
+        prefetch: int = 0,
+        options: Optional[RequestOptions] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all documents in the collection (async). Handles pagination internally.
+        With prefetch=N, up to N responses are fetched ahead in a background task."""
+        pages = self.list_pages_async(size=page_size, prefetch=prefetch, options=options)
+        try:
+            async for page in pages:
+                for doc in page:
+                    yield doc
+        finally:
+            await pages.aclose()
+
+    @overload
+    async def list_async(
+        self,
+        *,
+        size: Optional[int] = None,
+        page_token: Optional[str] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Literal["raw"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def list_async(
+        self,
+        *,
+        size: Optional[int] = None,
+        page_token: Optional[str] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[Literal["model"]] = None,
+    ) -> models.ListDocsResponse: ...
+
+    @_with_total_timeout
     async def list_async(
         self,
         *,
         size: Optional[int] = None,
         page_token: Optional[str] = None,
+        lazy: bool = False,
         options: Optional[RequestOptions] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.ListDocsResponse:
-        """List documents in this collection (async). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url. For advanced options use options=RequestOptions(...)."""
+        response_mode: Optional[str] = None,
+    ) -> Union[models.ListDocsResponse, Dict[str, Any]]:
+        """List documents in this collection (async). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url (on first access to .results with lazy=True; see LazyResults). response_mode="raw" returns the response body as a plain dict (presigned docs resolved into "docs") without model validation. For advanced options use options=RequestOptions(...)."""
         r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
         response = await self._docs.list_docs_async(
             collection_name=self._collection_name,
@@ -332,13 +1468,22 @@ class CollectionDocs:
             server_url=s,
             timeout_ms=t,
             http_headers=h,
+            response_mode=response_mode,
         )
-        async_client = self._docs.sdk_configuration.async_client
-        if async_client is not None:
-            timeout_sec = (t / 1000.0) if t is not None else (self._docs.sdk_configuration.timeout_ms / 1000.0 if self._docs.sdk_configuration.timeout_ms else None)
-            response = await _resolve_list_docs_response_async(response, async_client, timeout_sec)
+        async_client = self._docs.sdk_configuration.get_transfer_async_client()
+        if self._docs.sdk_configuration.raw_responses(response_mode):
+            if lazy or async_client is None:
+                return cast(Dict[str, Any], response)
+            timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+            return await _resolve_raw_response_async(cast(Dict[str, Any], response), async_client, timeout_sec, self._docs.sdk_configuration.json_codec)
+        if lazy:
+            response = _with_lazy_results(response, None, self._docs.sdk_configuration, t)
+        elif async_client is not None:
+            timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+            response = await _resolve_list_docs_response_async(response, async_client, timeout_sec, self._docs.sdk_configuration.json_codec)
         return response
 
+    @_with_total_timeout
     def upsert(
         self,
         *,
@@ -360,6 +1505,7 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
     async def upsert_async(
         self,
         *,
@@ -381,6 +1527,178 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
+    def upsert_many(
+        self,
+        docs: Iterable[Dict[str, Any]],
+        *,
+        max_docs_per_request: int = 1000,
+        max_bytes_per_request: int = _UPSERT_MAX_PAYLOAD_BYTES,
+        concurrency: int = 4,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> BatchResult:
+        """Upsert an iterable of any size by splitting it into requests of at most max_docs_per_request
+        docs and max_bytes_per_request serialized bytes, sending up to `concurrency` requests at once.
+        A failed batch does not stop the others; check result.failures (each keeps its docs for retry).
+        For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+
+        def send(batch: Tuple[int, List[Dict[str, Any]]]) -> BatchOutcome:
+            index, batch_docs = batch
+            try:
+                res = self._docs.upsert(
+                    collection_name=self._collection_name,
+                    docs=batch_docs,
+                    retries=r,
+                    server_url=s,
+                    timeout_ms=t,
+                    http_headers=h,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return BatchOutcome(index, len(batch_docs), error=e, items=batch_docs)
+            return BatchOutcome(index, len(batch_docs), response=res)
+
+        batches = enumerate(
+            _iter_doc_batches(
+                docs,
+                max_bytes_per_request,
+                max_docs_per_request,
+                json_codec=self._docs.sdk_configuration.json_codec,
+            )
+        )
+        futures = _map_bounded(send, batches, concurrency, stop_on_error=False)
+        return BatchResult([fut.result() for fut in futures])
+
+    @_with_total_timeout
+    async def upsert_many_async(
+        self,
+        docs: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        *,
+        max_docs_per_request: int = 1000,
+        max_bytes_per_request: int = _UPSERT_MAX_PAYLOAD_BYTES,
+        concurrency: int = 4,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> BatchResult:
+        """Upsert an iterable or async iterable of any size in concurrent, size-limited batches (async).
+        Same splitting and failure reporting as upsert_many. For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+
+        async def send(batch: Tuple[int, List[Dict[str, Any]]]) -> BatchOutcome:
+            index, batch_docs = batch
+            try:
+                res = await self._docs.upsert_async(
+                    collection_name=self._collection_name,
+                    docs=batch_docs,
+                    retries=r,
+                    server_url=s,
+                    timeout_ms=t,
+                    http_headers=h,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return BatchOutcome(index, len(batch_docs), error=e, items=batch_docs)
+            return BatchOutcome(index, len(batch_docs), response=res)
+
+        async def batches() -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+            batcher = _DocBatcher(
+                max_bytes_per_request,
+                max_docs_per_request,
+                keep_encoded=False,
+                json_codec=self._docs.sdk_configuration.json_codec,
+            )
+            index = 0
+            async for doc in _aiter(docs):
+                full = batcher.add(doc)
+                if full is not None:
+                    yield index, full
+                    index += 1
+            rest = batcher.flush()
+            if rest is not None:
+                yield index, rest
+
+        tasks = await _map_bounded_async(send, batches(), concurrency, stop_on_error=False)
+        return BatchResult([task.result() for task in tasks])
+
+    def writer(
+        self,
+        *,
+        max_docs: int = 1000,
+        max_bytes: int = _UPSERT_MAX_PAYLOAD_BYTES,
+        flush_interval: float = 1.0,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> BufferedWriter:
+        """Return a write-behind buffer: writer.write(doc) buffers upserts (same id: last write wins)
+        and a background thread sends them once max_docs or max_bytes is reached or flush_interval
+        seconds have passed. Use as a context manager so pending docs are flushed on exit.
+        For advanced options use options=RequestOptions(...)."""
+
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+
+        def send(docs: List[Dict[str, Any]]) -> models.MessageResponse:
+            return self._docs.upsert(
+                collection_name=self._collection_name,
+                docs=docs,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+            )
+
+        return BufferedWriter(
+            send,
+            max_docs=max_docs,
+            max_bytes=max_bytes,
+            flush_interval=flush_interval,
+            json_codec=self._docs.sdk_configuration.json_codec,
+        )
+
+    def writer_async(
+        self,
+        *,
+        max_docs: int = 1000,
+        max_bytes: int = _UPSERT_MAX_PAYLOAD_BYTES,
+        flush_interval: float = 1.0,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> AsyncBufferedWriter:
+        """Return an async write-behind buffer flushed by a background task; use with `async with`.
+        Same buffering as writer(). For advanced options use options=RequestOptions(...)."""
+
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+
+        async def send(docs: List[Dict[str, Any]]) -> models.MessageResponse:
+            return await self._docs.upsert_async(
+                collection_name=self._collection_name,
+                docs=docs,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+            )
+
+        return AsyncBufferedWriter(
+            send,
+            max_docs=max_docs,
+            max_bytes=max_bytes,
+            flush_interval=flush_interval,
+            json_codec=self._docs.sdk_configuration.json_codec,
+        )
+
+    @_with_total_timeout
     def get_bulk_upsert(
         self,
         *,
@@ -400,6 +1718,7 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
     async def get_bulk_upsert_async(
         self,
         *,
@@ -419,6 +1738,7 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
     def bulk_upsert(
         self,
         *,
@@ -440,6 +1760,7 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
     async def bulk_upsert_async(
         self,
         *,
@@ -461,6 +1782,7 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
     def bulk_upsert_docs(
         self,
         *,
@@ -473,6 +1795,7 @@ class CollectionDocs:
     ) -> models.MessageResponse:
         """One-step bulk upsert: gets presigned URL, uploads documents to S3, then triggers bulk_upsert.
         Use this instead of calling get_bulk_upsert + manual upload + bulk_upsert. Max payload 200MB.
+        Docs are encoded one at a time and streamed to S3, so no serialized copy of the whole payload is held in memory.
         Accepts either docs=[...] or docs={"docs":[...]}."""
         r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
         info = self._docs.get_bulk_upsert(
@@ -482,30 +1805,20 @@ class CollectionDocs:
             timeout_ms=t,
             http_headers=h,
         )
-        payload = docs if isinstance(docs, dict) else {"docs": docs}
-        body = json.dumps(payload).encode("utf-8")
-        size_limit = info.size_limit_bytes or 209715200
-        if len(body) > size_limit:
-            raise ValueError(
-                f"Documents payload size {len(body)} bytes exceeds limit {size_limit} bytes"
-            )
+        doc_list = docs["docs"] if isinstance(docs, dict) else docs
+        size_limit = info.size_limit_bytes or _BULK_SIZE_LIMIT_BYTES
         config = self._docs.sdk_configuration
-        client = config.client
+        size = _measure_bulk_body(doc_list, size_limit, config.json_codec)
+        client = config.get_transfer_client()
         if client is None:
             raise ValueError("HTTP client is required for bulk_upsert_docs")
-        timeout_sec = (t / 1000.0) if t is not None else (config.timeout_ms / 1000.0 if config.timeout_ms else None)
-        req = client.build_request(
-            "PUT",
+        _put_bulk_object(
             info.url,
-            content=body,
-            headers={"Content-Type": "application/json"},
-            timeout=timeout_sec,
+            _iter_bulk_body(_iter_encoded_docs(doc_list, config.json_codec)),
+            size,
+            client,
+            _timeout_sec(t, config),
         )
-        upload_res = client.send(req)
-        if upload_res.status_code < 200 or upload_res.status_code >= 300:
-            raise RuntimeError(
-                f"Bulk upload to S3 failed: HTTP {upload_res.status_code} - {upload_res.text}"
-            )
         return self._docs.bulk_upsert(
             collection_name=self._collection_name,
             object_key=info.object_key,
@@ -515,6 +1828,7 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
     async def bulk_upsert_docs_async(
         self,
         *,
@@ -535,30 +1849,20 @@ class CollectionDocs:
             timeout_ms=t,
             http_headers=h,
         )
-        payload = docs if isinstance(docs, dict) else {"docs": docs}
-        body = json.dumps(payload).encode("utf-8")
-        size_limit = info.size_limit_bytes or 209715200
-        if len(body) > size_limit:
-            raise ValueError(
-                f"Documents payload size {len(body)} bytes exceeds limit {size_limit} bytes"
-            )
+        doc_list = docs["docs"] if isinstance(docs, dict) else docs
+        size_limit = info.size_limit_bytes or _BULK_SIZE_LIMIT_BYTES
         config = self._docs.sdk_configuration
-        async_client = config.async_client
+        size = _measure_bulk_body(doc_list, size_limit, config.json_codec)
+        async_client = config.get_transfer_async_client()
         if async_client is None:
             raise ValueError("Async HTTP client is required for bulk_upsert_docs_async")
-        timeout_sec = (t / 1000.0) if t is not None else (config.timeout_ms / 1000.0 if config.timeout_ms else None)
-        req = async_client.build_request(
-            "PUT",
+        await _put_bulk_object_async(
             info.url,
-            content=body,
-            headers={"Content-Type": "application/json"},
-            timeout=timeout_sec,
+            _iter_bulk_body(_iter_encoded_docs(doc_list, config.json_codec)),
+            size,
+            async_client,
+            _timeout_sec(t, config),
         )
-        upload_res = await async_client.send(req)
-        if upload_res.status_code < 200 or upload_res.status_code >= 300:
-            raise RuntimeError(
-                f"Bulk upload to S3 failed: HTTP {upload_res.status_code} - {upload_res.text}"
-            )
         return await self._docs.bulk_upsert_async(
             collection_name=self._collection_name,
             object_key=info.object_key,
@@ -568,6 +1872,148 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
+    def bulk_load(
+        self,
+        docs: Iterable[Dict[str, Any]],
+        *,
+        max_in_flight: int = 2,
+        size_limit_bytes: Optional[int] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> List[models.MessageResponse]:
+        """Stream documents from any iterable or generator into as many bulk upsert objects as needed.
+        Docs are encoded one at a time and a new object is started whenever the next doc would exceed
+        the size limit (the limit reported by get_bulk_upsert, or size_limit_bytes if smaller). Each object
+        goes through get_bulk_upsert -> PUT -> bulk_upsert with at most max_in_flight uploads running
+        concurrently, so memory stays bounded by roughly max_in_flight + 1 objects regardless of input size.
+        Returns one MessageResponse per object, in upload order. For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        config = self._docs.sdk_configuration
+        if config.get_transfer_client() is None:
+            raise ValueError("HTTP client is required for bulk_load")
+        timeout_sec = _timeout_sec(t, config)
+
+        first_info = self._docs.get_bulk_upsert(
+            collection_name=self._collection_name,
+            retries=r,
+            server_url=s,
+            timeout_ms=t,
+            http_headers=h,
+        )
+        size_limit = first_info.size_limit_bytes or _BULK_SIZE_LIMIT_BYTES
+        if size_limit_bytes is not None:
+            size_limit = min(size_limit, size_limit_bytes)
+        unused_info = [first_info]
+
+        def upload(parts: List[bytes]) -> models.MessageResponse:
+            try:
+                info = unused_info.pop()
+            except IndexError:
+                info = self._docs.get_bulk_upsert(
+                    collection_name=self._collection_name,
+                    retries=r,
+                    server_url=s,
+                    timeout_ms=t,
+                    http_headers=h,
+                )
+            client = config.get_transfer_client()
+            if client is None:
+                raise ValueError("HTTP client is required for bulk_load")
+            size = _bulk_body_size(parts, sum(len(p) for p in parts))
+            _put_bulk_object(info.url, _iter_bulk_body(parts), size, client, timeout_sec)
+            return self._docs.bulk_upsert(
+                collection_name=self._collection_name,
+                object_key=info.object_key,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+            )
+
+        batches = _iter_doc_batches(
+            docs, size_limit, keep_encoded=True, json_codec=config.json_codec
+        )
+        futures = _map_bounded(upload, batches, max_in_flight)
+        return [fut.result() for fut in futures]
+
+    @_with_total_timeout
+    async def bulk_load_async(
+        self,
+        docs: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        *,
+        max_in_flight: int = 2,
+        size_limit_bytes: Optional[int] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> List[models.MessageResponse]:
+        """Stream documents from any iterable or async iterable into bulk upsert objects (async).
+        Same chunking and bounded in-flight uploads as bulk_load. For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        config = self._docs.sdk_configuration
+        if config.get_transfer_async_client() is None:
+            raise ValueError("Async HTTP client is required for bulk_load_async")
+        timeout_sec = _timeout_sec(t, config)
+
+        first_info = await self._docs.get_bulk_upsert_async(
+            collection_name=self._collection_name,
+            retries=r,
+            server_url=s,
+            timeout_ms=t,
+            http_headers=h,
+        )
+        size_limit = first_info.size_limit_bytes or _BULK_SIZE_LIMIT_BYTES
+        if size_limit_bytes is not None:
+            size_limit = min(size_limit, size_limit_bytes)
+        unused_info = [first_info]
+
+        async def upload(parts: List[bytes]) -> models.MessageResponse:
+            if unused_info:
+                info = unused_info.pop()
+            else:
+                info = await self._docs.get_bulk_upsert_async(
+                    collection_name=self._collection_name,
+                    retries=r,
+                    server_url=s,
+                    timeout_ms=t,
+                    http_headers=h,
+                )
+            async_client = config.get_transfer_async_client()
+            if async_client is None:
+                raise ValueError("Async HTTP client is required for bulk_load_async")
+            size = _bulk_body_size(parts, sum(len(p) for p in parts))
+            await _put_bulk_object_async(
+                info.url, _iter_bulk_body(parts), size, async_client, timeout_sec
+            )
+            return await self._docs.bulk_upsert_async(
+                collection_name=self._collection_name,
+                object_key=info.object_key,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+            )
+
+        async def batches() -> AsyncIterator[List[bytes]]:
+            batcher = _DocBatcher(size_limit, json_codec=config.json_codec)
+            async for doc in _aiter(docs):
+                full = batcher.add(doc)
+                if full is not None:
+                    yield full
+            rest = batcher.flush()
+            if rest is not None:
+                yield rest
+
+        tasks = await _map_bounded_async(upload, batches(), max_in_flight)
+        return [task.result() for task in tasks]
+
+    @_with_total_timeout
     def update(
         self,
         *,
@@ -589,6 +2035,7 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
     async def update_async(
         self,
         *,
@@ -610,6 +2057,7 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
     def delete(
         self,
         *,
@@ -639,6 +2087,7 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
     async def delete_async(
         self,
         *,
@@ -668,6 +2117,164 @@ class CollectionDocs:
             http_headers=h,
         )
 
+    @_with_total_timeout
+    def delete_many(
+        self,
+        ids: Iterable[Any],
+        *,
+        batch_size: int = 100,
+        concurrency: int = 4,
+        group_by_partition: bool = False,
+        partition_field: Optional[str] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> BatchResult:
+        """Delete any number of documents by ID in batches of batch_size, sending up to `concurrency`
+        requests at once (each retried on 429/5XX per the retry config). With group_by_partition, ids
+        must be (id, partition_value) pairs: each batch then holds a single partition value and carries
+        a partition_filter on the collection's partition_config field (or partition_field).
+        A failed batch does not stop the others; check result.failures (each keeps its ids for retry).
+        For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        if group_by_partition and partition_field is None:
+            collections = Collections(
+                self._docs.sdk_configuration, parent_ref=self._docs.parent_ref
+            )
+            info = collections.get(
+                collection_name=self._collection_name,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+            )
+            partition_field = _partition_field_of(info, self._collection_name)
+
+        def send(
+            batch: Tuple[int, Tuple[List[Any], Optional[models.PartitionFilter]]]
+        ) -> BatchOutcome:
+            index, (items, partition_filter) = batch
+            batch_ids = [item[0] for item in items] if group_by_partition else items
+            try:
+                res = self._docs.delete(
+                    collection_name=self._collection_name,
+                    ids=batch_ids,
+                    partition_filter=partition_filter,
+                    retries=r,
+                    server_url=s,
+                    timeout_ms=t,
+                    http_headers=h,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return BatchOutcome(index, len(items), error=e, items=items)
+            return BatchOutcome(index, len(items), response=res)
+
+        batches = enumerate(
+            _iter_delete_batches(
+                ids, batch_size, partition_field if group_by_partition else None
+            )
+        )
+        futures = _map_bounded(send, batches, concurrency, stop_on_error=False)
+        return BatchResult([fut.result() for fut in futures])
+
+    @_with_total_timeout
+    async def delete_many_async(
+        self,
+        ids: Union[Iterable[Any], AsyncIterable[Any]],
+        *,
+        batch_size: int = 100,
+        concurrency: int = 4,
+        group_by_partition: bool = False,
+        partition_field: Optional[str] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> BatchResult:
+        """Delete an iterable or async iterable of IDs in concurrent batches (async).
+        Same batching, partition grouping and failure reporting as delete_many. For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        if group_by_partition and partition_field is None:
+            collections = Collections(
+                self._docs.sdk_configuration, parent_ref=self._docs.parent_ref
+            )
+            info = await collections.get_async(
+                collection_name=self._collection_name,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+            )
+            partition_field = _partition_field_of(info, self._collection_name)
+
+        async def send(
+            batch: Tuple[int, Tuple[List[Any], Optional[models.PartitionFilter]]]
+        ) -> BatchOutcome:
+            index, (items, partition_filter) = batch
+            batch_ids = [item[0] for item in items] if group_by_partition else items
+            try:
+                res = await self._docs.delete_async(
+                    collection_name=self._collection_name,
+                    ids=batch_ids,
+                    partition_filter=partition_filter,
+                    retries=r,
+                    server_url=s,
+                    timeout_ms=t,
+                    http_headers=h,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return BatchOutcome(index, len(items), error=e, items=items)
+            return BatchOutcome(index, len(items), response=res)
+
+        async def batches() -> AsyncIterator[
+            Tuple[int, Tuple[List[Any], Optional[models.PartitionFilter]]]
+        ]:
+            batcher = _DeleteBatcher(
+                batch_size, partition_field if group_by_partition else None
+            )
+            index = 0
+            async for item in _aiter(ids):
+                batch = batcher.add(item)
+                if batch is not None:
+                    yield index, batch
+                    index += 1
+            for batch in batcher.flush():
+                yield index, batch
+                index += 1
+
+        tasks = await _map_bounded_async(send, batches(), concurrency, stop_on_error=False)
+        return BatchResult([task.result() for task in tasks])
+
+    def _doc_cache_variant(
+        self,
+        *,
+        lazy: bool,
+        consistent_read: Optional[bool],
+        partition_filter: Any,
+        server_url: Optional[str],
+        raw: bool,
+        include_vectors: Optional[bool],
+        fields: Any,
+    ) -> Optional[Hashable]:
+        """Doc cache key part for this fetch, or None when there is no cache or it must be bypassed."""
+        if (
+            self._docs.sdk_configuration.doc_cache is None
+            or lazy
+            or consistent_read
+            or partition_filter is not None
+        ):
+            return None
+        return _doc_cache_variant(
+            utils.get_pydantic_model(fields, Optional[models.FieldsSelectorUnion]),
+            include_vectors,
+            server_url,
+            raw,
+        )
+
+    @overload
     def fetch(
         self,
         *,
@@ -680,33 +2287,17 @@ class CollectionDocs:
         partition_filter: Optional[
             Union[models.PartitionFilter, models.PartitionFilterTypedDict]
         ] = None,
+        lazy: bool = False,
         options: Optional[RequestOptions] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.FetchDocsResponse:
-        """Fetch documents by IDs (max 100). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url. For advanced options use options=RequestOptions(...)."""
-        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
-        response = self._docs.fetch(
-            collection_name=self._collection_name,
-            ids=ids,
-            consistent_read=consistent_read,
-            include_vectors=include_vectors,
-            fields=fields,
-            partition_filter=partition_filter,
-            retries=r,
-            server_url=s,
-            timeout_ms=t,
-            http_headers=h,
-        )
-        client = self._docs.sdk_configuration.client
-        if client is not None:
-            timeout_sec = (t / 1000.0) if t is not None else (self._docs.sdk_configuration.timeout_ms / 1000.0 if self._docs.sdk_configuration.timeout_ms else None)
-            response = _resolve_fetch_response(response, client, timeout_sec)
-        return response
+        response_mode: Literal["raw"],
+    ) -> Dict[str, Any]: ...
 
-    async def fetch_async(
+    @overload
+    def fetch(
         self,
         *,
         ids: List[str],
@@ -718,32 +2309,395 @@ class CollectionDocs:
         partition_filter: Optional[
             Union[models.PartitionFilter, models.PartitionFilterTypedDict]
         ] = None,
+        lazy: bool = False,
         options: Optional[RequestOptions] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.FetchDocsResponse:
-        """Fetch documents by IDs (async). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url. For advanced options use options=RequestOptions(...)."""
-        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
-        response = await self._docs.fetch_async(
-            collection_name=self._collection_name,
-            ids=ids,
-            consistent_read=consistent_read,
-            include_vectors=include_vectors,
-            fields=fields,
+        response_mode: Optional[Literal["model"]] = None,
+    ) -> models.FetchDocsResponse: ...
+
+    @_with_total_timeout
+    def fetch(
+        self,
+        *,
+        ids: List[str],
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
+    ) -> Union[models.FetchDocsResponse, Dict[str, Any]]:
+        """Fetch documents by IDs (max 100). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url (on first access to .results with lazy=True; see LazyResults). response_mode="raw" returns the response body as a plain dict (presigned docs resolved into "docs") without model validation. With the client's doc_cache, only IDs that are not cached are requested from the server (except with consistent_read=True, partition_filter or lazy=True). For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        raw = self._docs.sdk_configuration.raw_responses(response_mode)
+        cache = self._docs.sdk_configuration.doc_cache
+        variant = self._doc_cache_variant(
+            lazy=lazy,
+            consistent_read=consistent_read,
+            partition_filter=partition_filter,
+            server_url=s,
+            raw=raw,
+            include_vectors=include_vectors,
+            fields=fields,
+        )
+        cached: Dict[str, Any] = {}
+        fetch_ids = ids
+        if cache is not None and variant is not None:
+            fetch_ids = list(dict.fromkeys(ids))
+            cached, token = cache.lookup(self._collection_name, variant, fetch_ids)
+            if cached:
+                fetch_ids = [i for i in fetch_ids if i not in cached]
+                if not fetch_ids:
+                    return _merge_cached(ids, cached, [], 0, raw)
+        response: Any = self._docs.fetch(
+            collection_name=self._collection_name,
+            ids=fetch_ids,
+            consistent_read=consistent_read,
+            include_vectors=include_vectors,
+            fields=fields,
             partition_filter=partition_filter,
             retries=r,
             server_url=s,
             timeout_ms=t,
             http_headers=h,
+            response_mode=response_mode,
         )
-        async_client = self._docs.sdk_configuration.async_client
-        if async_client is not None:
-            timeout_sec = (t / 1000.0) if t is not None else (self._docs.sdk_configuration.timeout_ms / 1000.0 if self._docs.sdk_configuration.timeout_ms else None)
-            response = await _resolve_fetch_response_async(response, async_client, timeout_sec)
+        client = self._docs.sdk_configuration.get_transfer_client()
+        if raw:
+            if not lazy and client is not None:
+                timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+                response = _resolve_raw_response(response, client, timeout_sec, self._docs.sdk_configuration.json_codec)
+        elif lazy:
+            response = _with_lazy_results(response, models.FetchDocsDoc, self._docs.sdk_configuration, t)
+        elif client is not None:
+            timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+            response = _resolve_fetch_response(response, client, timeout_sec, self._docs.sdk_configuration.json_codec)
+        if cache is not None and variant is not None:
+            items = (response.get("docs") or []) if raw else response.results
+            codec = self._docs.sdk_configuration.json_codec
+            entries = []
+            for item in items:
+                doc_id = _doc_id(item)
+                if doc_id is not None:
+                    entries.append((doc_id, item, _doc_size(item, codec)))
+            cache.store(self._collection_name, variant, entries, token)
+            if cached:
+                took = response.get("took", 0) if raw else response.took
+                return _merge_cached(ids, cached, items, took, raw)
         return response
 
+    @overload
+    async def fetch_async(
+        self,
+        *,
+        ids: List[str],
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Literal["raw"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def fetch_async(
+        self,
+        *,
+        ids: List[str],
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[Literal["model"]] = None,
+    ) -> models.FetchDocsResponse: ...
+
+    @_with_total_timeout
+    async def fetch_async(
+        self,
+        *,
+        ids: List[str],
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
+    ) -> Union[models.FetchDocsResponse, Dict[str, Any]]:
+        """Fetch documents by IDs (async). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url (on first access to .results with lazy=True; see LazyResults). response_mode="raw" returns the response body as a plain dict (presigned docs resolved into "docs") without model validation. With the client's doc_cache, only IDs that are not cached are requested from the server (except with consistent_read=True, partition_filter or lazy=True). For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        raw = self._docs.sdk_configuration.raw_responses(response_mode)
+        cache = self._docs.sdk_configuration.doc_cache
+        variant = self._doc_cache_variant(
+            lazy=lazy,
+            consistent_read=consistent_read,
+            partition_filter=partition_filter,
+            server_url=s,
+            raw=raw,
+            include_vectors=include_vectors,
+            fields=fields,
+        )
+        cached: Dict[str, Any] = {}
+        fetch_ids = ids
+        if cache is not None and variant is not None:
+            fetch_ids = list(dict.fromkeys(ids))
+            cached, token = cache.lookup(self._collection_name, variant, fetch_ids)
+            if cached:
+                fetch_ids = [i for i in fetch_ids if i not in cached]
+                if not fetch_ids:
+                    return _merge_cached(ids, cached, [], 0, raw)
+        response: Any = await self._docs.fetch_async(
+            collection_name=self._collection_name,
+            ids=fetch_ids,
+            consistent_read=consistent_read,
+            include_vectors=include_vectors,
+            fields=fields,
+            partition_filter=partition_filter,
+            retries=r,
+            server_url=s,
+            timeout_ms=t,
+            http_headers=h,
+            response_mode=response_mode,
+        )
+        async_client = self._docs.sdk_configuration.get_transfer_async_client()
+        if raw:
+            if not lazy and async_client is not None:
+                timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+                response = await _resolve_raw_response_async(response, async_client, timeout_sec, self._docs.sdk_configuration.json_codec)
+        elif lazy:
+            response = _with_lazy_results(response, models.FetchDocsDoc, self._docs.sdk_configuration, t)
+        elif async_client is not None:
+            timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+            response = await _resolve_fetch_response_async(response, async_client, timeout_sec, self._docs.sdk_configuration.json_codec)
+        if cache is not None and variant is not None:
+            items = (response.get("docs") or []) if raw else response.results
+            codec = self._docs.sdk_configuration.json_codec
+            entries = []
+            for item in items:
+                doc_id = _doc_id(item)
+                if doc_id is not None:
+                    entries.append((doc_id, item, _doc_size(item, codec)))
+            cache.store(self._collection_name, variant, entries, token)
+            if cached:
+                took = response.get("took", 0) if raw else response.took
+                return _merge_cached(ids, cached, items, took, raw)
+        return response
+
+    def fetch_stream(
+        self,
+        *,
+        ids: List[str],
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> Iterator[models.FetchDocsDoc]:
+        """Fetch documents by IDs (max 100) and yield result items one by one. When the results are
+        behind a presigned docs_url, the download is parsed incrementally, so items are yielded as they
+        arrive and the full body is never held in memory. The request is sent when iteration starts."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        response = self._docs.fetch(
+            collection_name=self._collection_name,
+            ids=ids,
+            consistent_read=consistent_read,
+            include_vectors=include_vectors,
+            fields=fields,
+            partition_filter=partition_filter,
+            retries=r,
+            server_url=s,
+            timeout_ms=t,
+            http_headers=h,
+            response_mode="model",
+        )
+        client = self._docs.sdk_configuration.get_transfer_client()
+        if response.is_docs_inline or not response.docs_url or client is None:
+            yield from response.results
+            return
+        timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+        yield from _stream_presigned_items(
+            response.docs_url, client, timeout_sec, models.FetchDocsDoc, self._docs.sdk_configuration.json_codec
+        )
+
+    async def fetch_stream_async(
+        self,
+        *,
+        ids: List[str],
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> AsyncIterator[models.FetchDocsDoc]:
+        """Fetch documents by IDs and yield result items one by one (async). See fetch_stream."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        response = await self._docs.fetch_async(
+            collection_name=self._collection_name,
+            ids=ids,
+            consistent_read=consistent_read,
+            include_vectors=include_vectors,
+            fields=fields,
+            partition_filter=partition_filter,
+            retries=r,
+            server_url=s,
+            timeout_ms=t,
+            http_headers=h,
+            response_mode="model",
+        )
+        async_client = self._docs.sdk_configuration.get_transfer_async_client()
+        if response.is_docs_inline or not response.docs_url or async_client is None:
+            for item in response.results:
+                yield item
+            return
+        timeout_sec = _timeout_sec(t, self._docs.sdk_configuration)
+        async for item in _stream_presigned_items_async(
+            response.docs_url, async_client, timeout_sec, models.FetchDocsDoc, self._docs.sdk_configuration.json_codec
+        ):
+            yield item
+
+    @_with_total_timeout
+    def fetch_many(
+        self,
+        ids: Iterable[str],
+        *,
+        concurrency: int = 4,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> FetchManyResult:
+        """Fetch any number of documents by ID. IDs are deduplicated and sent as 100-ID requests,
+        up to `concurrency` at once (presigned docs_url results are resolved per request).
+        Returns the found documents in input order plus the IDs that were not found; raises the
+        first request error. For advanced options use options=RequestOptions(...)."""
+        unique, shards = _shard_ids(ids, _FETCH_MAX_IDS)
+        shard_fields, strip_id = _fields_with_id(fields)
+
+        def fetch_shard(shard: List[str]) -> models.FetchDocsResponse:
+            return self.fetch(
+                ids=shard,
+                consistent_read=consistent_read,
+                include_vectors=include_vectors,
+                fields=shard_fields,
+                partition_filter=partition_filter,
+                options=options,
+                retries=retries,
+                server_url=server_url,
+                timeout_ms=timeout_ms,
+                http_headers=http_headers,
+                response_mode="model",
+            )
+
+        futures = _map_bounded(fetch_shard, shards, concurrency)
+        return _order_fetched(unique, [fut.result() for fut in futures], strip_id)
+
+    @_with_total_timeout
+    async def fetch_many_async(
+        self,
+        ids: Iterable[str],
+        *,
+        concurrency: int = 4,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> FetchManyResult:
+        """Fetch any number of documents by ID with concurrent 100-ID requests (async).
+        Same ordering and missing-ID reporting as fetch_many. For advanced options use options=RequestOptions(...)."""
+        unique, shards = _shard_ids(ids, _FETCH_MAX_IDS)
+        shard_fields, strip_id = _fields_with_id(fields)
+
+        async def fetch_shard(shard: List[str]) -> models.FetchDocsResponse:
+            return await self.fetch_async(
+                ids=shard,
+                consistent_read=consistent_read,
+                include_vectors=include_vectors,
+                fields=shard_fields,
+                partition_filter=partition_filter,
+                options=options,
+                retries=retries,
+                server_url=server_url,
+                timeout_ms=timeout_ms,
+                http_headers=http_headers,
+                response_mode="model",
+            )
+
+        tasks = await _map_bounded_async(fetch_shard, shards, concurrency)
+        return _order_fetched(unique, [task.result() for task in tasks], strip_id)
+
 
 class Collection:
     """Handle for a single collection. Use client.collection(name) to obtain.
@@ -764,6 +2718,39 @@ class Collection:
         self.docs = CollectionDocs(self._docs_instance, collection_name)
         self._collections = Collections(sdk_configuration, parent_ref=parent_ref)
 
+    def _query_cache_key(
+        self,
+        *,
+        lazy: bool,
+        consistent_read: Optional[bool],
+        server_url: Optional[str],
+        response_mode: Optional[str],
+        query: Dict[str, Any],
+        size: Optional[int],
+        include_vectors: Optional[bool],
+        sort: Optional[List[Dict[str, Any]]],
+        fields: Any,
+        partition_filter: Any,
+    ) -> Optional[Hashable]:
+        """Query cache key for this request, or None when there is no cache or it must be bypassed."""
+        if self._sdk_configuration.query_cache is None or lazy or consistent_read:
+            return None
+        body = models.QueryCollectionRequestBody(
+            size=size,
+            query=query,
+            consistent_read=False,
+            include_vectors=include_vectors,
+            sort=sort,
+            fields=utils.get_pydantic_model(fields, Optional[models.FieldsSelectorUnion]),
+            partition_filter=utils.get_pydantic_model(
+                partition_filter, Optional[models.PartitionFilter]
+            ),
+        )
+        return _query_cache_key(
+            self._collection_name, body, server_url, self._sdk_configuration.raw_responses(response_mode)
+        )
+
+    @overload
     def query(
         self,
         *,
@@ -778,15 +2765,82 @@ class Collection:
         partition_filter: Optional[
             Union[models.PartitionFilter, models.PartitionFilterTypedDict]
         ] = None,
+        lazy: bool = False,
         options: Optional[RequestOptions] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.QueryCollectionResponse:
-        """Search this collection with a query (vector/keyword/hybrid). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url. For advanced options use options=RequestOptions(...)."""
+        response_mode: Literal["raw"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    def query(
+        self,
+        *,
+        query: Dict[str, Any],
+        size: Optional[int] = None,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        sort: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[Literal["model"]] = None,
+    ) -> models.QueryCollectionResponse: ...
+
+    @_with_total_timeout
+    def query(
+        self,
+        *,
+        query: Dict[str, Any],
+        size: Optional[int] = None,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        sort: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
+    ) -> Union[models.QueryCollectionResponse, Dict[str, Any]]:
+        """Search this collection with a query (vector/keyword/hybrid). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url (on first access to .results with lazy=True; see LazyResults). response_mode="raw" returns the response body as a plain dict (presigned docs resolved into "docs") without model validation. Served from the client's query_cache when one is configured, except with consistent_read=True or lazy=True. For advanced options use options=RequestOptions(...)."""
         r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
-        response = self._collections.query(
+        cache = self._sdk_configuration.query_cache
+        cache_key = self._query_cache_key(
+            lazy=lazy,
+            consistent_read=consistent_read,
+            server_url=s,
+            response_mode=response_mode,
+            query=query,
+            size=size,
+            include_vectors=include_vectors,
+            sort=sort,
+            fields=fields,
+            partition_filter=partition_filter,
+        )
+        if cache is not None and cache_key is not None:
+            hit, cached, token = cache.lookup(cache_key, self._collection_name)
+            if hit:
+                return cast(Any, cached)
+        response: Any = self._collections.query(
             collection_name=self._collection_name,
             query=query,
             size=size,
@@ -799,13 +2853,23 @@ class Collection:
             server_url=s,
             timeout_ms=t,
             http_headers=h,
+            response_mode=response_mode,
         )
-        client = self._sdk_configuration.client
-        if client is not None:
-            timeout_sec = (t / 1000.0) if t is not None else (self._sdk_configuration.timeout_ms / 1000.0 if self._sdk_configuration.timeout_ms else None)
-            response = _resolve_query_response(response, client, timeout_sec)
+        client = self._sdk_configuration.get_transfer_client()
+        if self._sdk_configuration.raw_responses(response_mode):
+            if not lazy and client is not None:
+                timeout_sec = _timeout_sec(t, self._sdk_configuration)
+                response = _resolve_raw_response(response, client, timeout_sec, self._sdk_configuration.json_codec)
+        elif lazy:
+            response = _with_lazy_results(response, models.QueryCollectionDoc, self._sdk_configuration, t)
+        elif client is not None:
+            timeout_sec = _timeout_sec(t, self._sdk_configuration)
+            response = _resolve_query_response(response, client, timeout_sec, self._sdk_configuration.json_codec)
+        if cache is not None and cache_key is not None:
+            cache.store(cache_key, self._collection_name, response, token)
         return response
 
+    @overload
     async def query_async(
         self,
         *,
@@ -820,15 +2884,82 @@ class Collection:
         partition_filter: Optional[
             Union[models.PartitionFilter, models.PartitionFilterTypedDict]
         ] = None,
+        lazy: bool = False,
         options: Optional[RequestOptions] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.QueryCollectionResponse:
-        """Search this collection (async). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url. For advanced options use options=RequestOptions(...)."""
+        response_mode: Literal["raw"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def query_async(
+        self,
+        *,
+        query: Dict[str, Any],
+        size: Optional[int] = None,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        sort: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[Literal["model"]] = None,
+    ) -> models.QueryCollectionResponse: ...
+
+    @_with_total_timeout
+    async def query_async(
+        self,
+        *,
+        query: Dict[str, Any],
+        size: Optional[int] = None,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        sort: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        lazy: bool = False,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
+    ) -> Union[models.QueryCollectionResponse, Dict[str, Any]]:
+        """Search this collection (async). When is_docs_inline is false, the SDK automatically fetches documents from the presigned docs_url (on first access to .results with lazy=True; see LazyResults). response_mode="raw" returns the response body as a plain dict (presigned docs resolved into "docs") without model validation. Served from the client's query_cache when one is configured, except with consistent_read=True or lazy=True. For advanced options use options=RequestOptions(...)."""
         r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
-        response = await self._collections.query_async(
+        cache = self._sdk_configuration.query_cache
+        cache_key = self._query_cache_key(
+            lazy=lazy,
+            consistent_read=consistent_read,
+            server_url=s,
+            response_mode=response_mode,
+            query=query,
+            size=size,
+            include_vectors=include_vectors,
+            sort=sort,
+            fields=fields,
+            partition_filter=partition_filter,
+        )
+        if cache is not None and cache_key is not None:
+            hit, cached, token = cache.lookup(cache_key, self._collection_name)
+            if hit:
+                return cast(Any, cached)
+        response: Any = await self._collections.query_async(
             collection_name=self._collection_name,
             query=query,
             size=size,
@@ -841,9 +2972,313 @@ class Collection:
             server_url=s,
             timeout_ms=t,
             http_headers=h,
+            response_mode=response_mode,
         )
-        async_client = self._sdk_configuration.async_client
-        if async_client is not None:
-            timeout_sec = (t / 1000.0) if t is not None else (self._sdk_configuration.timeout_ms / 1000.0 if self._sdk_configuration.timeout_ms else None)
-            response = await _resolve_query_response_async(response, async_client, timeout_sec)
+        async_client = self._sdk_configuration.get_transfer_async_client()
+        if self._sdk_configuration.raw_responses(response_mode):
+            if not lazy and async_client is not None:
+                timeout_sec = _timeout_sec(t, self._sdk_configuration)
+                response = await _resolve_raw_response_async(response, async_client, timeout_sec, self._sdk_configuration.json_codec)
+        elif lazy:
+            response = _with_lazy_results(response, models.QueryCollectionDoc, self._sdk_configuration, t)
+        elif async_client is not None:
+            timeout_sec = _timeout_sec(t, self._sdk_configuration)
+            response = await _resolve_query_response_async(response, async_client, timeout_sec, self._sdk_configuration.json_codec)
+        if cache is not None and cache_key is not None:
+            cache.store(cache_key, self._collection_name, response, token)
         return response
+
+    def query_stream(
+        self,
+        *,
+        query: Dict[str, Any],
+        size: Optional[int] = None,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        sort: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> Iterator[models.QueryCollectionDoc]:
+        """Search this collection and yield result items one by one. When the results are behind a
+        presigned docs_url, the download is parsed incrementally, so items are yielded as they arrive
+        and the full body is never held in memory. The request is sent when iteration starts."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        response = self._collections.query(
+            collection_name=self._collection_name,
+            query=query,
+            size=size,
+            consistent_read=consistent_read,
+            include_vectors=include_vectors,
+            sort=sort,
+            fields=fields,
+            partition_filter=partition_filter,
+            retries=r,
+            server_url=s,
+            timeout_ms=t,
+            http_headers=h,
+            response_mode="model",
+        )
+        client = self._sdk_configuration.get_transfer_client()
+        if response.is_docs_inline or not response.docs_url or client is None:
+            yield from response.results
+            return
+        timeout_sec = _timeout_sec(t, self._sdk_configuration)
+        yield from _stream_presigned_items(
+            response.docs_url, client, timeout_sec, models.QueryCollectionDoc, self._sdk_configuration.json_codec
+        )
+
+    async def query_stream_async(
+        self,
+        *,
+        query: Dict[str, Any],
+        size: Optional[int] = None,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        sort: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        partition_filter: Optional[
+            Union[models.PartitionFilter, models.PartitionFilterTypedDict]
+        ] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> AsyncIterator[models.QueryCollectionDoc]:
+        """Search this collection and yield result items one by one (async). See query_stream."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        response = await self._collections.query_async(
+            collection_name=self._collection_name,
+            query=query,
+            size=size,
+            consistent_read=consistent_read,
+            include_vectors=include_vectors,
+            sort=sort,
+            fields=fields,
+            partition_filter=partition_filter,
+            retries=r,
+            server_url=s,
+            timeout_ms=t,
+            http_headers=h,
+            response_mode="model",
+        )
+        async_client = self._sdk_configuration.get_transfer_async_client()
+        if response.is_docs_inline or not response.docs_url or async_client is None:
+            for item in response.results:
+                yield item
+            return
+        timeout_sec = _timeout_sec(t, self._sdk_configuration)
+        async for item in _stream_presigned_items_async(
+            response.docs_url, async_client, timeout_sec, models.QueryCollectionDoc, self._sdk_configuration.json_codec
+        ):
+            yield item
+
+    @_with_total_timeout
+    def query_partitions(
+        self,
+        *,
+        query: Dict[str, Any],
+        partition_values: Iterable[str],
+        size: Optional[int] = None,
+        concurrency: int = 4,
+        partitions_per_request: int = 1,
+        partition_field: Optional[str] = None,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        sort: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> models.QueryCollectionResponse:
+        """Scatter-gather query: run the query once per group of partitions_per_request partition values
+        (each with a partition_filter on the collection's partition_config field, or partition_field),
+        up to `concurrency` at once, and merge the hits by score (or by `sort`) into the top `size`.
+        For advanced options use options=RequestOptions(...)."""
+        if partitions_per_request < 1:
+            raise ValueError("partitions_per_request must be at least 1")
+        groups = _shard_ids(partition_values, partitions_per_request)[1]
+        if not groups:
+            raise ValueError("partition_values must not be empty")
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        if partition_field is None:
+            info = self._collections.get(
+                collection_name=self._collection_name,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+            )
+            partition_field = _partition_field_of(info, self._collection_name)
+
+        def query_group(values: List[str]) -> models.QueryCollectionResponse:
+            return self.query(
+                query=query,
+                size=size,
+                consistent_read=consistent_read,
+                include_vectors=include_vectors,
+                sort=sort,
+                fields=fields,
+                partition_filter=models.PartitionFilter(field=partition_field, in_=values),
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+                response_mode="model",
+            )
+
+        futures = _map_bounded(query_group, groups, concurrency)
+        return _merge_query_responses([fut.result() for fut in futures], size, sort)
+
+    @_with_total_timeout
+    async def query_partitions_async(
+        self,
+        *,
+        query: Dict[str, Any],
+        partition_values: Iterable[str],
+        size: Optional[int] = None,
+        concurrency: int = 4,
+        partitions_per_request: int = 1,
+        partition_field: Optional[str] = None,
+        consistent_read: Optional[bool] = False,
+        include_vectors: Optional[bool] = False,
+        sort: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[
+            Union[models.FieldsSelectorUnion, models.FieldsSelectorUnionTypedDict]
+        ] = None,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> models.QueryCollectionResponse:
+        """Scatter-gather query over partition values with a client-side top-k merge (async).
+        Same fan-out and merge as query_partitions. For advanced options use options=RequestOptions(...)."""
+        if partitions_per_request < 1:
+            raise ValueError("partitions_per_request must be at least 1")
+        groups = _shard_ids(partition_values, partitions_per_request)[1]
+        if not groups:
+            raise ValueError("partition_values must not be empty")
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+        if partition_field is None:
+            info = await self._collections.get_async(
+                collection_name=self._collection_name,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+            )
+            partition_field = _partition_field_of(info, self._collection_name)
+
+        async def query_group(values: List[str]) -> models.QueryCollectionResponse:
+            return await self.query_async(
+                query=query,
+                size=size,
+                consistent_read=consistent_read,
+                include_vectors=include_vectors,
+                sort=sort,
+                fields=fields,
+                partition_filter=models.PartitionFilter(field=partition_field, in_=values),
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+                response_mode="model",
+            )
+
+        tasks = await _map_bounded_async(query_group, groups, concurrency)
+        return _merge_query_responses([task.result() for task in tasks], size, sort)
+
+    @_with_total_timeout
+    def query_many(
+        self,
+        queries: Iterable[
+            Union[models.QueryCollectionRequestBody, models.QueryCollectionRequestBodyTypedDict]
+        ],
+        *,
+        concurrency: int = 4,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> QueryManyResult:
+        """Run independent queries on this collection, up to `concurrency` at once. Each query is a
+        request body (query, size, sort, fields, consistent_read, include_vectors, partition_filter)
+        and is sent through query(), so retries, presigned docs_url resolution and the query cache
+        apply as usual. Returns one outcome per query in input order; a failing query is recorded
+        in its outcome instead of aborting the others. For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+
+        def run(body: Any) -> models.QueryCollectionResponse:
+            body = utils.get_pydantic_model(body, models.QueryCollectionRequestBody)
+            return self.query(
+                query=body.query,
+                size=body.size,
+                consistent_read=body.consistent_read,
+                include_vectors=body.include_vectors,
+                sort=body.sort,
+                fields=body.fields,
+                partition_filter=body.partition_filter,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+                response_mode="model",
+            )
+
+        return _query_many_result(_map_bounded(run, queries, concurrency, stop_on_error=False))
+
+    @_with_total_timeout
+    async def query_many_async(
+        self,
+        queries: Union[
+            Iterable[Union[models.QueryCollectionRequestBody, models.QueryCollectionRequestBodyTypedDict]],
+            AsyncIterable[Union[models.QueryCollectionRequestBody, models.QueryCollectionRequestBodyTypedDict]],
+        ],
+        *,
+        concurrency: int = 4,
+        options: Optional[RequestOptions] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> QueryManyResult:
+        """Run independent queries concurrently (async). Same ordering and per-query error
+        capture as query_many. For advanced options use options=RequestOptions(...)."""
+        r, s, t, h = _merge_options(options, retries, server_url, timeout_ms, http_headers)
+
+        async def run(body: Any) -> models.QueryCollectionResponse:
+            body = utils.get_pydantic_model(body, models.QueryCollectionRequestBody)
+            return await self.query_async(
+                query=body.query,
+                size=body.size,
+                consistent_read=body.consistent_read,
+                include_vectors=body.include_vectors,
+                sort=body.sort,
+                fields=body.fields,
+                partition_filter=body.partition_filter,
+                retries=r,
+                server_url=s,
+                timeout_ms=t,
+                http_headers=h,
+                response_mode="model",
+            )
+
+        tasks = await _map_bounded_async(run, queries, concurrency, stop_on_error=False)
+        return _query_many_result(tasks)
@@ -100,7 +100,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.ListCollectionsResponse, http_res)
+            return unmarshal_json_response(
+                models.ListCollectionsResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.UnauthenticatedErrorData, http_res
@@ -251,7 +255,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.ListCollectionsResponse, http_res)
+            return unmarshal_json_response(
+                models.ListCollectionsResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.UnauthenticatedErrorData, http_res
@@ -400,7 +408,12 @@ class Collections(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.CreateCollectionRequest
+                request,
+                False,
+                False,
+                "json",
+                models.CreateCollectionRequest,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -435,7 +448,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.CreateCollectionResponse, http_res)
+            return unmarshal_json_response(
+                models.CreateCollectionResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -544,7 +561,12 @@ class Collections(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.CreateCollectionRequest
+                request,
+                False,
+                False,
+                "json",
+                models.CreateCollectionRequest,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -579,7 +601,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.CreateCollectionResponse, http_res)
+            return unmarshal_json_response(
+                models.CreateCollectionResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -691,7 +717,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.UnauthenticatedErrorData, http_res
@@ -798,7 +828,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.UnauthenticatedErrorData, http_res
@@ -905,7 +939,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.GetCollectionResponse, http_res)
+            return unmarshal_json_response(
+                models.GetCollectionResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.UnauthenticatedErrorData, http_res
@@ -1012,7 +1050,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.GetCollectionResponse, http_res)
+            return unmarshal_json_response(
+                models.GetCollectionResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.UnauthenticatedErrorData, http_res
@@ -1102,6 +1144,7 @@ class Collections(BaseSDK):
                 False,
                 "json",
                 models.UpdateCollectionRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1136,7 +1179,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.UpdateCollectionResponse, http_res)
+            return unmarshal_json_response(
+                models.UpdateCollectionResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -1231,6 +1278,7 @@ class Collections(BaseSDK):
                 False,
                 "json",
                 models.UpdateCollectionRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1265,7 +1313,11 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.UpdateCollectionResponse, http_res)
+            return unmarshal_json_response(
+                models.UpdateCollectionResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -1319,6 +1371,7 @@ class Collections(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
     ) -> models.QueryCollectionResponse:
         r"""Search a collection with a query and return the most similar documents.
 
@@ -1334,6 +1387,7 @@ class Collections(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param response_mode: "model" (validated response model) or "raw" (the JSON body as plain dicts and lists, without validation). Defaults to the client's response_mode.
         """
         base_url = None
         url_variables = None
@@ -1381,6 +1435,7 @@ class Collections(BaseSDK):
                 False,
                 "json",
                 models.QueryCollectionRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1415,7 +1470,12 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.QueryCollectionResponse, http_res)
+            return unmarshal_json_response(
+                models.QueryCollectionResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+                raw=self.sdk_configuration.raw_responses(response_mode),
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -1469,6 +1529,7 @@ class Collections(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
     ) -> models.QueryCollectionResponse:
         r"""Search a collection with a query and return the most similar documents.
 
@@ -1484,6 +1545,7 @@ class Collections(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param response_mode: "model" (validated response model) or "raw" (the JSON body as plain dicts and lists, without validation). Defaults to the client's response_mode.
         """
         base_url = None
         url_variables = None
@@ -1531,6 +1593,7 @@ class Collections(BaseSDK):
                 False,
                 "json",
                 models.QueryCollectionRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1565,7 +1628,12 @@ class Collections(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.QueryCollectionResponse, http_res)
+            return unmarshal_json_response(
+                models.QueryCollectionResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+                raw=self.sdk_configuration.raw_responses(response_mode),
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
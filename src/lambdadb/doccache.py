@@ -0,0 +1,207 @@
+"""Read-through cache for CollectionDocs.fetch: LambdaDB(doc_cache=DocCache(...)).
+
+Documents are cached one by one, keyed on the collection, the document ID and
+the shape of the request (fields selector, include_vectors, response mode), so
+a fetch only asks the server for the IDs that are not cached. The cache is
+bounded by an approximate byte budget (the JSON-encoded size of each
+document; least recently used documents are evicted first) and entries expire
+after ttl seconds. Writes made through the same client (upsert, update,
+delete, bulk upsert, collection update/delete) drop the collection's entries.
+Fetches with consistent_read=True, a partition_filter or lazy=True bypass it.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from lambdadb import models, utils
+
+
+@dataclass
+class DocCacheStats:
+    """Counters of a DocCache since it was created. hits and misses count document IDs."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    """Documents dropped to stay within max_bytes."""
+    expirations: int = 0
+    """Documents dropped because they outlived ttl."""
+    invalidations: int = 0
+    """Documents dropped by writes to their collection or invalidate()."""
+    size: int = 0
+    """Documents currently cached."""
+    bytes: int = 0
+    """Approximate size of the cached documents."""
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DocCache:
+    """Thread-safe LRU + TTL cache of fetched documents bounded by max_bytes, shared by the
+    sync and async methods of a client. Vectors make up most of a document's size when
+    include_vectors=True; size max_bytes accordingly. Cached result items are returned
+    as-is to every caller that hits them; treat them as read-only.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: float = 30.0) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # (collection_name, variant, doc_id) -> (expires_at, item, nbytes)
+        self._entries: "OrderedDict[Tuple[str, Hashable, str], Tuple[float, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        # Bumped on every invalidation of a collection, so a fetch that was in flight
+        # during a write does not store its (possibly stale) documents afterwards.
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._stats = DocCacheStats()
+        self._lock = threading.Lock()
+
+    def stats(self) -> DocCacheStats:
+        """Snapshot of the hit/miss/eviction counters."""
+        with self._lock:
+            return replace(self._stats, size=len(self._entries), bytes=self._bytes)
+
+    def invalidate(self, collection_name: Optional[str] = None) -> int:
+        """Drop the cached documents of a collection (all collections when None). Returns the number dropped."""
+        with self._lock:
+            if collection_name is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                self._epoch += 1
+            else:
+                keys = [k for k in self._entries if k[0] == collection_name]
+                for k in keys:
+                    self._bytes -= self._entries.pop(k)[2]
+                dropped = len(keys)
+                self._generations[collection_name] = (
+                    self._generations.get(collection_name, 0) + 1
+                )
+            self._stats.invalidations += dropped
+            return dropped
+
+    def clear(self) -> None:
+        """Drop every entry (counted as invalidations)."""
+        self.invalidate()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(
+        self, collection_name: str, variant: Hashable, ids: List[str]
+    ) -> Tuple[Dict[str, Any], Tuple[int, int]]:
+        """Return (cached items of the distinct ids, token); pass token to store() with the fetched misses."""
+        now = time.monotonic()
+        found: Dict[str, Any] = {}
+        with self._lock:
+            token = (self._epoch, self._generations.get(collection_name, 0))
+            for doc_id in ids:
+                key = (collection_name, variant, doc_id)
+                entry = self._entries.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        self._entries.move_to_end(key)
+                        found[doc_id] = entry[1]
+                        continue
+                    del self._entries[key]
+                    self._bytes -= entry[2]
+                    self._stats.expirations += 1
+            self._stats.hits += len(found)
+            self._stats.misses += len(ids) - len(found)
+            return found, token
+
+    def store(
+        self,
+        collection_name: str,
+        variant: Hashable,
+        items: Iterable[Tuple[str, Any, int]],
+        token: Tuple[int, int],
+    ) -> None:
+        """Add (doc_id, item, nbytes) entries; items larger than max_bytes are not cached."""
+        with self._lock:
+            if token != (self._epoch, self._generations.get(collection_name, 0)):
+                return  # the collection was written to while the fetch was in flight
+            expires_at = time.monotonic() + self.ttl
+            for doc_id, item, nbytes in items:
+                if nbytes > self.max_bytes:
+                    continue
+                key = (collection_name, variant, doc_id)
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self._bytes -= old[2]
+                self._entries[key] = (expires_at, item, nbytes)
+                self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                self._bytes -= self._entries.popitem(last=False)[1][2]
+                self._stats.evictions += 1
+
+    def __repr__(self) -> str:
+        return f"DocCache(max_bytes={self.max_bytes}, ttl={self.ttl})"
+
+
+def _doc_cache_variant(
+    fields: Optional[models.FieldsSelectorUnion],
+    include_vectors: Optional[bool],
+    server_url: Optional[str],
+    raw: bool,
+) -> Hashable:
+    """Part of the key shared by every document of one fetch request; equal fields
+    selectors map to the same variant whether given as models or dicts."""
+    canonical = (
+        json.dumps(
+            fields.model_dump(by_alias=True, exclude_none=True, mode="json", fallback=utils.json_fallback),
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        if fields is not None
+        else None
+    )
+    return (canonical, bool(include_vectors), server_url, raw)
+
+
+def _doc_id(item: Any) -> Optional[str]:
+    """ID of a fetched result item (a FetchDocsDoc, or a dict in raw mode)."""
+    doc = item.get("doc") if isinstance(item, dict) else getattr(item, "doc", None)
+    doc_id = doc.get("id") if isinstance(doc, dict) else None
+    return doc_id if isinstance(doc_id, str) else None
+
+
+def _doc_size(item: Any, json_codec: utils.JSONCodec) -> int:
+    doc = item.get("doc") if isinstance(item, dict) else item.doc
+    return len(json_codec.dumps(doc))
+
+
+def _merge_cached(
+    ids: List[str], cached: Dict[str, Any], fetched: List[Any], took: int, raw: bool
+) -> Any:
+    """A fetch response with cached and fetched items in the order of ids
+    (fetched items without a recognizable ID go last)."""
+    by_id = dict(cached)
+    rest = []
+    for item in fetched:
+        doc_id = _doc_id(item)
+        if doc_id is None:
+            rest.append(item)
+        else:
+            by_id[doc_id] = item
+    # A repeated ID is requested, and returned, once.
+    items = [by_id[i] for i in dict.fromkeys(ids) if i in by_id] + rest
+    if raw:
+        return {"total": len(items), "took": took, "docs": items, "isDocsInline": True}
+    return models.FetchDocsResponse(
+        total=len(items), took=took, results=items, is_docs_inline=True
+    )
@@ -20,6 +20,7 @@ class Docs(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
     ) -> models.ListDocsResponse:
         r"""List documents in a collection.
 
@@ -30,6 +31,7 @@ class Docs(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param response_mode: "model" (validated response model) or "raw" (the JSON body as plain dicts and lists, without validation). Defaults to the client's response_mode.
         """
         base_url = None
         url_variables = None
@@ -93,7 +95,12 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.ListDocsResponse, http_res)
+            return unmarshal_json_response(
+                models.ListDocsResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+                raw=self.sdk_configuration.raw_responses(response_mode),
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -138,6 +145,7 @@ class Docs(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
     ) -> models.ListDocsResponse:
         r"""List documents in a collection.
 
@@ -148,6 +156,7 @@ class Docs(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param response_mode: "model" (validated response model) or "raw" (the JSON body as plain dicts and lists, without validation). Defaults to the client's response_mode.
         """
         base_url = None
         url_variables = None
@@ -211,7 +220,12 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.ListDocsResponse, http_res)
+            return unmarshal_json_response(
+                models.ListDocsResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+                raw=self.sdk_configuration.raw_responses(response_mode),
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -296,7 +310,12 @@ class Docs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.UpsertDocsRequestBody
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.UpsertDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -331,7 +350,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -416,7 +439,12 @@ class Docs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.UpsertDocsRequestBody
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.UpsertDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -451,7 +479,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -563,7 +595,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.GetBulkUpsertDocsResponse, http_res)
+            return unmarshal_json_response(
+                models.GetBulkUpsertDocsResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.UnauthenticatedErrorData, http_res
@@ -670,7 +706,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.GetBulkUpsertDocsResponse, http_res)
+            return unmarshal_json_response(
+                models.GetBulkUpsertDocsResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.UnauthenticatedErrorData, http_res
@@ -755,6 +795,7 @@ class Docs(BaseSDK):
                 False,
                 "json",
                 models.BulkUpsertDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -789,7 +830,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -879,6 +924,7 @@ class Docs(BaseSDK):
                 False,
                 "json",
                 models.BulkUpsertDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -913,7 +959,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -998,7 +1048,12 @@ class Docs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.UpdateDocsRequestBody
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.UpdateDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1033,7 +1088,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -1118,7 +1177,12 @@ class Docs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.UpdateDocsRequestBody
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.UpdateDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1153,7 +1217,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -1248,7 +1316,12 @@ class Docs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.DeleteDocsRequestBody
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.DeleteDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1283,7 +1356,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -1378,7 +1455,12 @@ class Docs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.DeleteDocsRequestBody
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.DeleteDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1413,7 +1495,11 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "202", "application/json"):
-            return unmarshal_json_response(models.MessageResponse, http_res)
+            return unmarshal_json_response(
+                models.MessageResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -1465,6 +1551,7 @@ class Docs(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
     ) -> models.FetchDocsResponse:
         r"""Lookup and return documents by document IDs from a collection.
 
@@ -1478,6 +1565,7 @@ class Docs(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param response_mode: "model" (validated response model) or "raw" (the JSON body as plain dicts and lists, without validation). Defaults to the client's response_mode.
         """
         base_url = None
         url_variables = None
@@ -1518,7 +1606,12 @@ class Docs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.FetchDocsRequestBody
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.FetchDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1553,7 +1646,12 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.FetchDocsResponse, http_res)
+            return unmarshal_json_response(
+                models.FetchDocsResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+                raw=self.sdk_configuration.raw_responses(response_mode),
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
@@ -1605,6 +1703,7 @@ class Docs(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[str] = None,
     ) -> models.FetchDocsResponse:
         r"""Lookup and return documents by document IDs from a collection.
 
@@ -1618,6 +1717,7 @@ class Docs(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param response_mode: "model" (validated response model) or "raw" (the JSON body as plain dicts and lists, without validation). Defaults to the client's response_mode.
         """
         base_url = None
         url_variables = None
@@ -1658,7 +1758,12 @@ class Docs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.FetchDocsRequestBody
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.FetchDocsRequestBody,
+                json_codec=self.sdk_configuration.json_codec,
             ),
             allow_empty_value=None,
             timeout_ms=timeout_ms,
@@ -1693,7 +1798,12 @@ class Docs(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.FetchDocsResponse, http_res)
+            return unmarshal_json_response(
+                models.FetchDocsResponse,
+                http_res,
+                json_codec=self.sdk_configuration.json_codec,
+                raw=self.sdk_configuration.raw_responses(response_mode),
+            )
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.BadRequestErrorData, http_res
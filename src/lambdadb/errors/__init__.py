@@ -9,6 +9,8 @@ import sys
 if TYPE_CHECKING:
     from .apierror import APIError
     from .badrequest_error import BadRequestError, BadRequestErrorData
+    from .circuit_open_error import CircuitOpenError
+    from .deadline_exceeded_error import DeadlineExceededError
     from .internalservererror import InternalServerError, InternalServerErrorData
     from .no_response_error import NoResponseError
     from .resourcealreadyexists_error import (
@@ -24,6 +26,8 @@ __all__ = [
     "APIError",
     "BadRequestError",
     "BadRequestErrorData",
+    "CircuitOpenError",
+    "DeadlineExceededError",
     "InternalServerError",
     "InternalServerErrorData",
     "LambdaDBError",
@@ -43,6 +47,8 @@ _dynamic_imports: dict[str, str] = {
     "APIError": ".apierror",
     "BadRequestError": ".badrequest_error",
     "BadRequestErrorData": ".badrequest_error",
+    "CircuitOpenError": ".circuit_open_error",
+    "DeadlineExceededError": ".deadline_exceeded_error",
     "InternalServerError": ".internalservererror",
     "InternalServerErrorData": ".internalservererror",
     "NoResponseError": ".no_response_error",
@@ -0,0 +1,29 @@
+"""Error raised when a circuit breaker rejects a request without sending it."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(unsafe_hash=True)
+class CircuitOpenError(Exception):
+    """Error raised without sending the request because the circuit breaker for the
+    operation and host is open after repeated failures."""
+
+    operation_id: str
+    host: str
+    retry_after: Optional[float]
+    """Seconds until the circuit lets a trial request through, if known."""
+    message: str
+
+    def __init__(self, operation_id: str, host: str, retry_after: Optional[float] = None):
+        message = f"Circuit open for {operation_id} on {host}"
+        if retry_after is not None:
+            message += f"; retry in {retry_after:.1f}s"
+        object.__setattr__(self, "operation_id", operation_id)
+        object.__setattr__(self, "host", host)
+        object.__setattr__(self, "retry_after", retry_after)
+        object.__setattr__(self, "message", message)
+        super().__init__(message)
+
+    def __str__(self):
+        return self.message
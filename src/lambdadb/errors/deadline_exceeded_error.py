@@ -0,0 +1,21 @@
+"""Error raised when a request would start after the operation's deadline."""
+
+from dataclasses import dataclass
+
+
+@dataclass(unsafe_hash=True)
+class DeadlineExceededError(Exception):
+    """Error raised without sending a request because the total time allowed for the
+    operation (RequestOptions.total_timeout_ms or utils.deadline) has run out."""
+
+    operation_id: str
+    message: str
+
+    def __init__(self, operation_id: str):
+        message = f"Deadline exceeded before {operation_id} could be sent"
+        object.__setattr__(self, "operation_id", operation_id)
+        object.__setattr__(self, "message", message)
+        super().__init__(message)
+
+    def __str__(self):
+        return self.message
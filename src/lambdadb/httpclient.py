@@ -2,9 +2,25 @@
 
 # pyright: reportReturnType = false
 import asyncio
+import importlib.util
+import warnings
+import weakref
 from typing_extensions import Protocol, runtime_checkable
 import httpx
-from typing import Any, Optional, Union
+from typing import Any, Dict, Optional, TypeVar, Union
+
+# Connection pool and timeout defaults of the clients LambdaDB creates, sized for
+# many concurrent queries: every pooled connection may stay open between bursts
+# (avoiding a new TCP+TLS handshake per request), idle connections are kept for
+# 30s, connecting fails fast, and reads/writes are unbounded so long queries and
+# large transfers are limited only by timeout_ms.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_CONNECT_TIMEOUT = 5.0
+# Presigned object-storage transfers get their own, smaller pool: it caps how many
+# large downloads/uploads run at once without taking connections from API calls.
+DEFAULT_TRANSFER_MAX_CONNECTIONS = 16
 
 
 @runtime_checkable
@@ -85,6 +101,63 @@ class AsyncHttpClient(Protocol):
         pass
 
 
+def client_options(
+    *,
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: Optional[float] = None,
+    write_timeout: Optional[float] = None,
+    pool_timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Keyword arguments for httpx.Client / httpx.AsyncClient with the given pool limits
+    and per-phase timeouts (seconds; None means no limit). HTTP/2 needs the h2 package
+    (pip install "lambdadb[http2]"); without it a warning is issued and HTTP/1.1 is used."""
+    if http2 and importlib.util.find_spec("h2") is None:
+        warnings.warn(
+            "http2=True needs the h2 package (pip install \"lambdadb[http2]\"); using HTTP/1.1",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        http2 = False
+    return {
+        "follow_redirects": True,
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        "timeout": httpx.Timeout(
+            connect=connect_timeout,
+            read=read_timeout,
+            write=write_timeout,
+            pool=pool_timeout,
+        ),
+    }
+
+
+_C = TypeVar("_C")
+
+# Clients created by LambdaDB itself, as opposed to ones passed in by the caller.
+_sdk_clients: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def sdk_created(client: _C) -> _C:
+    """Record client as created by the SDK (see default_timeout) and return it."""
+    _sdk_clients.add(client)
+    return client
+
+
+def default_timeout(client: Any) -> Any:
+    """Timeout of a request sent through client without timeout_ms. Clients created by the
+    SDK apply their configured timeouts; a user-supplied client gets no timeout, as before
+    the timeout options existed, so its own defaults (5s for a bare httpx client) don't apply."""
+    return httpx.USE_CLIENT_DEFAULT if client in _sdk_clients else None
+
+
 class ClientOwner(Protocol):
     client: Union[HttpClient, None]
     async_client: Union[AsyncHttpClient, None]
@@ -96,12 +169,24 @@ def close_clients(
     sync_client_supplied: bool,
     async_client: Union[AsyncHttpClient, None],
     async_client_supplied: bool,
+    transfer_client: Union[HttpClient, None] = None,
+    transfer_client_supplied: bool = True,
+    transfer_async_client: Union[AsyncHttpClient, None] = None,
+    transfer_async_client_supplied: bool = True,
 ) -> None:
     """
     A finalizer function that is meant to be used with weakref.finalize to close
     httpx clients used by an SDK so that underlying resources can be garbage
     collected.
     """
+    if transfer_client is not None or transfer_async_client is not None:
+        close_clients(
+            owner,
+            transfer_client,
+            transfer_client_supplied,
+            transfer_async_client,
+            transfer_async_client_supplied,
+        )
 
     # Unset the client/async_client properties so there are no more references
     # to them from the owning SDK instance and they can be reaped.
@@ -148,6 +148,7 @@ class FetchDocsResponse(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
+        self._require_loaded(self.results)
         optional_fields = set(["docsUrl"])
         serialized = handler(self)
         m = {}
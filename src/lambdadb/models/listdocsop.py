@@ -103,6 +103,7 @@ class ListDocsResponse(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
+        self._require_loaded(self.results)
         optional_fields = set(["nextPageToken", "docsUrl"])
         serialized = handler(self)
         m = {}
@@ -193,6 +193,7 @@ class QueryCollectionResponse(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
+        self._require_loaded(self.results)
         optional_fields = set(["maxScore", "docsUrl"])
         serialized = handler(self)
         m = {}
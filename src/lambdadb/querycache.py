@@ -0,0 +1,143 @@
+"""Client-side cache for Collection.query results: LambdaDB(query_cache=QueryCache(...)).
+
+Entries are keyed on the collection and the canonicalized query request body
+(query, size, sort, fields, partition_filter, include_vectors), bounded by
+max_entries (least recently used entries are evicted first) and expire after
+ttl seconds. Writes made through the same client (upsert, update, delete,
+bulk upsert, collection update/delete) drop the collection's entries.
+Queries with consistent_read=True are never served from or stored in the cache.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from lambdadb import models, utils
+
+
+@dataclass
+class QueryCacheStats:
+    """Counters of a QueryCache since it was created."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    """Entries dropped to stay within max_entries."""
+    expirations: int = 0
+    """Entries dropped because they outlived ttl."""
+    invalidations: int = 0
+    """Entries dropped by writes to their collection or invalidate()."""
+    size: int = 0
+    """Entries currently cached."""
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class QueryCache:
+    """Thread-safe LRU + TTL cache of query responses, shared by the sync and async methods of a client.
+    Cached responses are returned as-is to every caller that hits them; treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (expires_at, collection_name, response)
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, Any]]" = OrderedDict()
+        # Bumped on every invalidation of a collection, so a query that was in flight
+        # during a write does not store its (possibly stale) response afterwards.
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._stats = QueryCacheStats()
+        self._lock = threading.Lock()
+
+    def stats(self) -> QueryCacheStats:
+        """Snapshot of the hit/miss/eviction counters."""
+        with self._lock:
+            return replace(self._stats, size=len(self._entries))
+
+    def invalidate(self, collection_name: Optional[str] = None) -> int:
+        """Drop the cached responses of a collection (all collections when None). Returns the number dropped."""
+        with self._lock:
+            if collection_name is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._epoch += 1
+            else:
+                keys = [k for k, e in self._entries.items() if e[1] == collection_name]
+                for k in keys:
+                    del self._entries[k]
+                dropped = len(keys)
+                self._generations[collection_name] = (
+                    self._generations.get(collection_name, 0) + 1
+                )
+            self._stats.invalidations += dropped
+            return dropped
+
+    def clear(self) -> None:
+        """Drop every entry (counted as invalidations)."""
+        self.invalidate()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(self, key: Hashable, collection_name: str) -> Tuple[bool, Any, Tuple[int, int]]:
+        """Return (hit, response, token); pass token to store() after a miss."""
+        now = time.monotonic()
+        with self._lock:
+            token = (self._epoch, self._generations.get(collection_name, 0))
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return True, entry[2], token
+                del self._entries[key]
+                self._stats.expirations += 1
+            self._stats.misses += 1
+            return False, None, token
+
+    def store(
+        self, key: Hashable, collection_name: str, response: Any, token: Tuple[int, int]
+    ) -> None:
+        with self._lock:
+            if token != (self._epoch, self._generations.get(collection_name, 0)):
+                return  # the collection was written to while the query was in flight
+            self._entries[key] = (time.monotonic() + self.ttl, collection_name, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def __repr__(self) -> str:
+        return f"QueryCache(max_entries={self.max_entries}, ttl={self.ttl})"
+
+
+def _query_cache_key(
+    collection_name: str,
+    body: models.QueryCollectionRequestBody,
+    server_url: Optional[str],
+    raw: bool,
+) -> Hashable:
+    """Canonical key: equal request bodies map to the same key regardless of dict order
+    or whether fields/partition_filter were given as models or dicts."""
+    canonical = json.dumps(
+        body.model_dump(
+            by_alias=True, exclude_none=True, mode="json", fallback=utils.json_fallback
+        ),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return (collection_name, server_url, raw, canonical)
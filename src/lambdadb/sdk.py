@@ -2,14 +2,32 @@
 
 import asyncio
 from .basesdk import BaseSDK
-from .httpclient import AsyncHttpClient, ClientOwner, HttpClient, close_clients
+from .httpclient import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_TRANSFER_MAX_CONNECTIONS,
+    AsyncHttpClient,
+    ClientOwner,
+    HttpClient,
+    client_options,
+    close_clients,
+    sdk_created,
+)
 from .sdkconfiguration import (
     DEFAULT_BASE_URL,
     DEFAULT_PROJECT_NAME,
+    RESPONSE_MODES,
     SDKConfiguration,
 )
+from .utils.jsoncodec import JSONCodec
 from .utils.logger import Logger, get_default_logger
+from .utils.hedging import HedgePolicy
+from .utils.ratelimit import RateLimiter
+from .utils.resilience import CircuitBreaker, RetryBudget
 from .utils.retries import RetryConfig
+from .utils.singleflight import SingleFlight
 import httpx
 import importlib
 import sys
@@ -18,11 +36,14 @@ import weakref
 from lambdadb import models, utils
 from lambdadb._hooks import SDKHooks
 from lambdadb.types import OptionalNullable, UNSET
+from lambdadb.types.basemodel import Unset
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Union, cast
 
 if TYPE_CHECKING:
     from lambdadb.collections import Collections
     from lambdadb.collection import Collection
+    from lambdadb.doccache import DocCache
+    from lambdadb.querycache import QueryCache
 
 
 class LambdaDB(BaseSDK):
@@ -49,6 +70,30 @@ class LambdaDB(BaseSDK):
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = None,
         debug_logger: Optional[Logger] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        response_mode: str = "model",
+        query_cache: Optional["QueryCache"] = None,
+        doc_cache: Optional["DocCache"] = None,
+        coalesce_reads: bool = False,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        transfer_client: Optional[HttpClient] = None,
+        transfer_async_client: Optional[AsyncHttpClient] = None,
+        transfer_max_connections: Optional[int] = DEFAULT_TRANSFER_MAX_CONNECTIONS,
+        transfer_connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        transfer_read_timeout: Optional[float] = None,
+        transfer_write_timeout: Optional[float] = None,
+        transfer_pool_timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: OptionalNullable[RetryBudget] = UNSET,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
     ) -> None:
         r"""Instantiates the SDK configuring it with the provided parameters.
 
@@ -66,10 +111,64 @@ class LambdaDB(BaseSDK):
         :param async_client: The Async HTTP client to use for all asynchronous methods.
         :param retry_config: The retry configuration to use for all supported methods.
         :param timeout_ms: Optional request timeout applied to each operation in milliseconds.
+        :param json_codec: JSON backend for request and response bodies: "pydantic" (default), "orjson" or "json" (stdlib), or a JSONCodec instance.
+        :param response_mode: Default for query/fetch/list responses: "model" (validated models) or "raw" (plain JSON dicts, no validation). Methods accept response_mode= to override it per call.
+        :param query_cache: Optional QueryCache for Collection.query results; invalidated by this client's writes to the collection.
+        :param doc_cache: Optional DocCache for CollectionDocs.fetch: cached documents are served by ID and only the misses are fetched; invalidated like query_cache.
+        :param coalesce_reads: When True, an identical read request (query, fetch, list, get; same URL, headers and body) issued while one is in flight waits for that request's response instead of being sent again.
+        :param max_connections: Connection pool size of the default clients (default 100; None for no limit).
+        :param max_keepalive_connections: Idle connections kept open for reuse (default 100, i.e. the whole pool).
+        :param keepalive_expiry: Seconds an idle connection is kept open (default 30).
+        :param http2: Use HTTP/2 (one multiplexed connection carries many concurrent requests); needs the http2 extra.
+        :param connect_timeout: Seconds to establish a connection (default 5).
+        :param read_timeout: Seconds to wait for response data (default: no limit).
+        :param write_timeout: Seconds to send request data (default: no limit).
+        :param pool_timeout: Seconds to wait for a free connection from the pool (default: no limit).
+        The connection and timeout options configure the default clients only; they are ignored for a client / async_client you pass in.
+        A per-request timeout_ms (or the client-wide timeout_ms) overrides all four timeouts.
+        :param transfer_client: HTTP client for presigned object-storage transfers (docs_url downloads, bulk upload PUTs).
+        :param transfer_async_client: Async HTTP client for presigned transfers.
+        :param transfer_max_connections: Connection pool size of the default transfer clients, which caps concurrent transfers (default 16).
+        :param transfer_connect_timeout: Seconds to connect to object storage (default 5).
+        :param transfer_read_timeout: Seconds to wait for download data (default: no limit).
+        :param transfer_write_timeout: Seconds to send upload data (default: no limit).
+        :param transfer_pool_timeout: Seconds a transfer waits for a free transfer connection (default: no limit).
+        Without transfer_client / transfer_async_client, presigned transfers use a dedicated default client
+        (so large transfers do not take connections from API calls), or the client / async_client you
+        passed in, if any.
+        :param rate_limiter: Optional RateLimiter shared by every API request of this client; it slows down on 429 responses and Retry-After headers and speeds back up while requests succeed.
+        :param retry_budget: Client-wide cap on retries as a share of recent requests; defaults to RetryBudget() (20% of the last 10s plus 10 retries/s). Pass None to disable.
+        :param circuit_breaker: Optional CircuitBreaker; after repeated failures of an operation on a host, requests fail fast with errors.CircuitOpenError until a trial request succeeds.
+        :param hedge_policy: Optional HedgePolicy; read requests that are slow to answer are sent a second time and the first success is used.
         """
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(
+                f"Unknown response_mode {response_mode!r}; expected one of {list(RESPONSE_MODES)}"
+            )
+
+        http_options = client_options(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+        )
+
+        transfer_http_options = client_options(
+            max_connections=transfer_max_connections,
+            max_keepalive_connections=transfer_max_connections,
+            connect_timeout=transfer_connect_timeout,
+            read_timeout=transfer_read_timeout,
+            write_timeout=transfer_write_timeout,
+            pool_timeout=transfer_pool_timeout,
+        )
+
         client_supplied = True
         if client is None:
-            client = httpx.Client(follow_redirects=True)
+            client = sdk_created(httpx.Client(**http_options))
             client_supplied = False
 
         assert issubclass(
@@ -78,9 +177,19 @@ class LambdaDB(BaseSDK):
 
         async_client_supplied = True
         if async_client is None:
-            async_client = httpx.AsyncClient(follow_redirects=True)
+            async_client = sdk_created(httpx.AsyncClient(**http_options))
             async_client_supplied = False
 
+        transfer_client_supplied = True
+        if transfer_client is None and not client_supplied:
+            transfer_client = sdk_created(httpx.Client(**transfer_http_options))
+            transfer_client_supplied = False
+
+        transfer_async_client_supplied = True
+        if transfer_async_client is None and not async_client_supplied:
+            transfer_async_client = sdk_created(httpx.AsyncClient(**transfer_http_options))
+            transfer_async_client_supplied = False
+
         if debug_logger is None:
             debug_logger = get_default_logger()
 
@@ -141,6 +250,21 @@ class LambdaDB(BaseSDK):
                 retry_config=retry_config,
                 timeout_ms=timeout_ms,
                 debug_logger=debug_logger,
+                json_codec=utils.get_json_codec(json_codec),
+                response_mode=response_mode,
+                query_cache=query_cache,
+                doc_cache=doc_cache,
+                singleflight=SingleFlight() if coalesce_reads else None,
+                transfer_client=transfer_client,
+                transfer_client_supplied=transfer_client_supplied,
+                transfer_async_client=transfer_async_client,
+                transfer_async_client_supplied=transfer_async_client_supplied,
+                rate_limiter=rate_limiter,
+                retry_budget=(
+                    RetryBudget() if isinstance(retry_budget, Unset) else retry_budget
+                ),
+                circuit_breaker=circuit_breaker,
+                hedge_policy=hedge_policy,
             ),
             parent_ref=self,
         )
@@ -160,6 +284,10 @@ class LambdaDB(BaseSDK):
             self.sdk_configuration.client_supplied,
             self.sdk_configuration.async_client,
             self.sdk_configuration.async_client_supplied,
+            self.sdk_configuration.transfer_client,
+            self.sdk_configuration.transfer_client_supplied,
+            self.sdk_configuration.transfer_async_client,
+            self.sdk_configuration.transfer_async_client_supplied,
         )
 
     def collection(self, name: str) -> "Collection":
@@ -222,28 +350,30 @@ class LambdaDB(BaseSDK):
           SDK, you own their lifecycle and this method will not close them.
         - After closing, this SDK instance should not be used for further requests.
         """
-        sync_client = self.sdk_configuration.client
-        async_client = self.sdk_configuration.async_client
-
-        if (
-            sync_client is not None
-            and not self.sdk_configuration.client_supplied
+        config = self.sdk_configuration
+        for sync_client, supplied in (
+            (config.client, config.client_supplied),
+            (config.transfer_client, config.transfer_client_supplied),
         ):
-            sync_client.close()
+            if sync_client is not None and not supplied:
+                sync_client.close()
 
-        if (
-            async_client is not None
-            and not self.sdk_configuration.async_client_supplied
+        for async_client, supplied in (
+            (config.async_client, config.async_client_supplied),
+            (config.transfer_async_client, config.transfer_async_client_supplied),
         ):
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                asyncio.run(async_client.aclose())
-            else:
-                loop.create_task(async_client.aclose())
-
-        self.sdk_configuration.client = None
-        self.sdk_configuration.async_client = None
+            if async_client is not None and not supplied:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    asyncio.run(async_client.aclose())
+                else:
+                    loop.create_task(async_client.aclose())
+
+        config.client = None
+        config.async_client = None
+        config.transfer_client = None
+        config.transfer_async_client = None
 
     async def aclose(self) -> None:
         """
@@ -254,19 +384,25 @@ class LambdaDB(BaseSDK):
           SDK, you own their lifecycle and this method will not close them.
         - After closing, this SDK instance should not be used for further requests.
         """
-        if (
-            self.sdk_configuration.client is not None
-            and not self.sdk_configuration.client_supplied
+        config = self.sdk_configuration
+        for sync_client, supplied in (
+            (config.client, config.client_supplied),
+            (config.transfer_client, config.transfer_client_supplied),
         ):
-            self.sdk_configuration.client.close()
+            if sync_client is not None and not supplied:
+                sync_client.close()
 
-        if (
-            self.sdk_configuration.async_client is not None
-            and not self.sdk_configuration.async_client_supplied
+        for async_client, supplied in (
+            (config.async_client, config.async_client_supplied),
+            (config.transfer_async_client, config.transfer_async_client_supplied),
         ):
-            await self.sdk_configuration.async_client.aclose()
-        self.sdk_configuration.client = None
-        self.sdk_configuration.async_client = None
+            if async_client is not None and not supplied:
+                await async_client.aclose()
+
+        config.client = None
+        config.async_client = None
+        config.transfer_client = None
+        config.transfer_async_client = None
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
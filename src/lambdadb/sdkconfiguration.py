@@ -1,12 +1,20 @@
 """Originally generated by Speakeasy; now maintained manually."""
 
 from .httpclient import AsyncHttpClient, HttpClient
-from .utils import Logger, RetryConfig, remove_suffix
+from .utils.hedging import HedgePolicy
+from .utils.ratelimit import RateLimiter
+from .utils.resilience import CircuitBreaker, RetryBudget
+from .utils.singleflight import SingleFlight
+from .utils import JSONCodec, Logger, RetryConfig, default_json_codec, remove_suffix
 from .version import GEN_VERSION, OPENAPI_DOC_VERSION, get_user_agent, get_version
 from dataclasses import dataclass, field
 from lambdadb import models
 from lambdadb.types import OptionalNullable, UNSET
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .doccache import DocCache
+    from .querycache import QueryCache
 
 
 DEFAULT_BASE_URL = "https://api.lambdadb.ai"
@@ -18,6 +26,9 @@ SERVERS = [
 ]
 """Contains the list of servers available to the SDK"""
 
+RESPONSE_MODES = ("model", "raw")
+"""response_mode values: validated models (default) or plain JSON data without validation"""
+
 
 @dataclass
 class SDKConfiguration:
@@ -39,6 +50,43 @@ class SDKConfiguration:
     user_agent: str = field(default_factory=get_user_agent)
     retry_config: OptionalNullable[RetryConfig] = field(default_factory=lambda: UNSET)
     timeout_ms: Optional[int] = None
+    json_codec: JSONCodec = field(default_factory=default_json_codec)
+    response_mode: str = "model"
+    query_cache: Optional["QueryCache"] = None
+    doc_cache: Optional["DocCache"] = None
+    singleflight: Optional[SingleFlight] = None
+    """Set by LambdaDB(coalesce_reads=True): coalesces identical in-flight read requests."""
+    transfer_client: Union[HttpClient, None] = None
+    """Client for presigned object-storage transfers (docs_url downloads, bulk upload PUTs); None uses client."""
+    transfer_client_supplied: bool = True
+    transfer_async_client: Union[AsyncHttpClient, None] = None
+    """Async client for presigned transfers; None uses async_client."""
+    transfer_async_client_supplied: bool = True
+    rate_limiter: Optional[RateLimiter] = None
+    retry_budget: Optional[RetryBudget] = None
+    circuit_breaker: Optional[CircuitBreaker] = None
+    hedge_policy: Optional[HedgePolicy] = None
+
+    def get_transfer_client(self) -> Union[HttpClient, None]:
+        """Sync client for presigned transfers."""
+        return self.transfer_client if self.transfer_client is not None else self.client
+
+    def get_transfer_async_client(self) -> Union[AsyncHttpClient, None]:
+        """Async client for presigned transfers."""
+        return (
+            self.transfer_async_client
+            if self.transfer_async_client is not None
+            else self.async_client
+        )
+
+    def raw_responses(self, response_mode: Optional[str] = None) -> bool:
+        """Whether query/fetch/list responses are returned raw: response_mode, or the client default when None."""
+        mode = response_mode if response_mode is not None else self.response_mode
+        if mode not in RESPONSE_MODES:
+            raise ValueError(
+                f"Unknown response_mode {mode!r}; expected one of {list(RESPONSE_MODES)}"
+            )
+        return mode == "raw"
 
     def get_server_details(self) -> Tuple[str, Dict[str, str]]:
         if self.server_url is not None and self.server_url:
@@ -18,6 +18,15 @@ class BaseModel(PydanticBaseModel):
             return serialized[alias]
         return serialized.get(name)
 
+    @staticmethod
+    def _require_loaded(results: Any) -> None:
+        # Lazy results (lazy=True) serialize as an empty list until their docs_url is downloaded.
+        if getattr(results, "loaded", True) is False:
+            raise ValueError(
+                "results have not been downloaded from docs_url yet; call "
+                "response.results.load() or await response.results.load_async() before serializing"
+            )
+
 
 class Unset(BaseModel):
     @model_serializer(mode="plain")
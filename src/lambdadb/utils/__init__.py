@@ -35,10 +35,17 @@ if TYPE_CHECKING:
     )
     from .queryparams import get_query_params
     from .retries import BackoffStrategy, Retries, retry, retry_async, RetryConfig
+    from .jsoncodec import (
+        JSONCodec,
+        default_json_codec,
+        get_json_codec,
+        json_fallback,
+    )
     from .requestbodies import serialize_request_body, SerializedRequestBody
     from .security import get_security, get_security_from_env
 
     from .serializers import (
+        get_codec,
         get_pydantic_model,
         marshal_json,
         unmarshal,
@@ -63,26 +70,50 @@ if TYPE_CHECKING:
         match_response,
         cast_partial,
     )
-    from .logger import Logger, get_body_content, get_default_logger
+    from .logger import Logger, get_body_content, get_default_logger, get_response_content
+    from .deadlines import deadline
+    from .hedging import HedgePolicy, HedgeStats
+    from .ratelimit import RateLimiter, RateLimiterStats
+    from .resilience import (
+        Circuit,
+        CircuitBreaker,
+        CircuitState,
+        CircuitStats,
+        RetryBudget,
+        RetryBudgetStats,
+    )
 
 __all__ = [
     "BackoffStrategy",
+    "Circuit",
+    "CircuitBreaker",
+    "CircuitState",
+    "CircuitStats",
+    "default_json_codec",
     "FieldMetadata",
     "find_metadata",
     "FormMetadata",
     "generate_url",
     "get_body_content",
+    "get_response_content",
+    "get_codec",
     "get_default_logger",
     "get_discriminator",
     "parse_datetime",
     "get_global_from_env",
     "get_headers",
+    "get_json_codec",
     "get_pydantic_model",
     "get_query_params",
     "get_response_headers",
     "get_security",
     "get_security_from_env",
+    "deadline",
     "HeaderMetadata",
+    "HedgePolicy",
+    "HedgeStats",
+    "json_fallback",
+    "JSONCodec",
     "Logger",
     "marshal_json",
     "match_content_type",
@@ -92,10 +123,14 @@ __all__ = [
     "OpenEnumMeta",
     "PathParamMetadata",
     "QueryParamMetadata",
+    "RateLimiter",
+    "RateLimiterStats",
     "remove_suffix",
     "Retries",
     "retry",
     "retry_async",
+    "RetryBudget",
+    "RetryBudgetStats",
     "RetryConfig",
     "RequestMetadata",
     "SecurityMetadata",
@@ -120,11 +155,28 @@ __all__ = [
 
 _dynamic_imports: dict[str, str] = {
     "BackoffStrategy": ".retries",
+    "Circuit": ".resilience",
+    "CircuitBreaker": ".resilience",
+    "CircuitState": ".resilience",
+    "CircuitStats": ".resilience",
+    "RetryBudget": ".resilience",
+    "RetryBudgetStats": ".resilience",
     "FieldMetadata": ".metadata",
     "find_metadata": ".metadata",
     "FormMetadata": ".metadata",
     "generate_url": ".url",
     "get_body_content": ".logger",
+    "get_response_content": ".logger",
+    "deadline": ".deadlines",
+    "HedgePolicy": ".hedging",
+    "HedgeStats": ".hedging",
+    "RateLimiter": ".ratelimit",
+    "RateLimiterStats": ".ratelimit",
+    "get_codec": ".serializers",
+    "default_json_codec": ".jsoncodec",
+    "get_json_codec": ".jsoncodec",
+    "json_fallback": ".jsoncodec",
+    "JSONCodec": ".jsoncodec",
     "get_default_logger": ".logger",
     "get_discriminator": ".annotations",
     "parse_datetime": ".datetimes",
@@ -0,0 +1,103 @@
+"""Deadlines bounding a whole logical operation: RequestOptions(total_timeout_ms=...).
+
+timeout_ms applies to each HTTP attempt; a deadline bounds everything done
+under it: every attempt, the backoff sleeps between retries and the download
+of presigned docs_url bodies. The deadline is kept in a context variable, so
+it also covers requests made from threads or tasks that copy the caller's
+context. Each request's timeouts are shortened to the time left, backoff
+stops when the next sleep would outlast the deadline, and a request that
+would start after it raises errors.DeadlineExceededError instead. httpx
+timeouts apply to each socket operation rather than to a whole body, so
+presigned downloads are also checked against the deadline chunk by chunk.
+"""
+
+import asyncio
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterable, Iterator, Optional, TypeVar
+
+import httpx
+
+from lambdadb.errors.deadline_exceeded_error import DeadlineExceededError
+
+_T = TypeVar("_T")
+
+# time.monotonic() value after which no more requests may be sent.
+_deadline: ContextVar[Optional[float]] = ContextVar("lambdadb_deadline", default=None)
+
+
+@contextlib.contextmanager
+def deadline(total_timeout_ms: Optional[int]) -> Iterator[None]:
+    """Bound every SDK request made in the block to total_timeout_ms from now.
+
+    Nested deadlines can only shorten the enclosing one; None leaves it unchanged.
+    """
+    if total_timeout_ms is None:
+        yield
+        return
+    at = time.monotonic() + total_timeout_ms / 1000
+    current = _deadline.get()
+    token = _deadline.set(at if current is None else min(current, at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline (may be negative), or None without one."""
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def bound_request(request: httpx.Request, operation_id: str) -> None:
+    """Shorten the request's timeouts to the time left; raise DeadlineExceededError if none is left."""
+    left = remaining()
+    if left is None:
+        return
+    if left <= 0:
+        raise DeadlineExceededError(operation_id)
+    timeouts = request.extensions.get("timeout") or dict.fromkeys(
+        ("connect", "read", "write", "pool")
+    )
+    request.extensions = {
+        **request.extensions,
+        "timeout": {k: left if v is None else min(v, left) for k, v in timeouts.items()},
+    }
+
+
+def check_deadline(operation_id: str) -> None:
+    """Raise DeadlineExceededError if the current deadline has passed."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError(operation_id)
+
+
+def iter_within_deadline(chunks: Iterable[_T], operation_id: str) -> Iterator[_T]:
+    """Yield chunks, raising DeadlineExceededError once one arrives after the deadline.
+
+    A blocking read cannot be interrupted, but each one is bounded by the read
+    timeout that bound_request shortened to the time left.
+    """
+    for chunk in chunks:
+        check_deadline(operation_id)
+        yield chunk
+
+
+async def aiter_within_deadline(chunks: AsyncIterator[_T], operation_id: str) -> AsyncIterator[_T]:
+    """Async variant of iter_within_deadline; a read still pending at the deadline is cancelled."""
+    while True:
+        left = remaining()
+        try:
+            if left is None:
+                chunk = await chunks.__anext__()
+            else:
+                if left <= 0:
+                    raise DeadlineExceededError(operation_id)
+                chunk = await asyncio.wait_for(chunks.__anext__(), left)
+        except StopAsyncIteration:
+            return
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(operation_id) from None
+        yield chunk
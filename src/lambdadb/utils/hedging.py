@@ -0,0 +1,291 @@
+"""Hedged requests for read operations: LambdaDB(hedge_policy=HedgePolicy(...)).
+
+When a read request (query, fetch, list, get) has not answered after a delay,
+the same request is sent a second time and whichever succeeds first is used.
+The delay is either fixed or the observed latency percentile of the operation
+(p95 by default), so only the slowest few percent of requests are hedged.
+Hedges are paid for from a token bucket that every eligible request refills
+by max_ratio, which keeps the extra load at about max_ratio of the requests
+even when the server slows down as a whole.
+
+Async requests run as tasks and the losing one is cancelled. Sync requests run
+on a small thread pool owned by the policy; a thread blocked in a send cannot
+be interrupted, so the losing request finishes in the background and its
+response is discarded.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    AbstractSet,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+)
+
+import httpx
+
+from .singleflight import READ_OPERATIONS
+
+# Samples kept per operation for the latency percentile, and how often it is recomputed.
+_LATENCY_WINDOW = 512
+_RECOMPUTE_EVERY = 16
+# Hedge tokens that can be saved up during quiet periods.
+_MAX_HEDGE_TOKENS = 10.0
+
+
+@dataclass
+class HedgeStats:
+    """Counters of a HedgePolicy since it was created."""
+
+    requests: int = 0
+    """Eligible requests."""
+    hedged: int = 0
+    """Requests for which a second copy was sent."""
+    hedge_wins: int = 0
+    """Hedged requests answered by the second copy."""
+    rejected: int = 0
+    """Hedges not sent because the max_ratio budget was spent."""
+
+
+class _Latencies:
+    __slots__ = ("samples", "since_recompute", "value")
+
+    def __init__(self) -> None:
+        self.samples: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self.since_recompute = 0
+        self.value: Optional[float] = None
+
+
+class HedgePolicy:
+    """When and how often to hedge the read requests of a LambdaDB client.
+
+    :param delay: Seconds to wait for a response before hedging. When None, the `percentile` of the operation's observed latencies is used, once `min_samples` requests have completed (no hedging before that).
+    :param percentile: Latency percentile used as the adaptive delay, between 0 and 1.
+    :param min_delay: Lower bound of the adaptive delay, in seconds.
+    :param min_samples: Completed requests of an operation needed before its adaptive delay is used.
+    :param max_ratio: Upper bound on hedges as a share of eligible requests.
+    :param operations: Operation IDs to hedge (default: the read-only operations). Only idempotent operations should be listed.
+    :param max_workers: Size of the thread pool used by sync requests.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        min_delay: float = 0.005,
+        min_samples: int = 20,
+        max_ratio: float = 0.1,
+        operations: Optional[Iterable[str]] = None,
+        max_workers: int = 64,
+    ) -> None:
+        if delay is not None and delay < 0:
+            raise ValueError("delay must be >= 0")
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 <= max_ratio <= 1:
+            raise ValueError("max_ratio must be between 0 and 1")
+        self.delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_ratio = max_ratio
+        self.operations: AbstractSet[str] = (
+            READ_OPERATIONS if operations is None else frozenset(operations)
+        )
+        self.max_workers = max_workers
+        self._latencies: Dict[str, _Latencies] = {}
+        self._tokens = 1.0
+        self._stats = HedgeStats()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def applies(self, operation_id: str) -> bool:
+        return operation_id in self.operations
+
+    def current_delay(self, operation_id: str) -> Optional[float]:
+        """Seconds after which a request of operation_id is hedged, or None while there are too few samples."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            latencies = self._latencies.get(operation_id)
+            if latencies is None or len(latencies.samples) < self.min_samples:
+                return None
+            if latencies.value is None or latencies.since_recompute >= _RECOMPUTE_EVERY:
+                ordered = sorted(latencies.samples)
+                latencies.value = ordered[int(self.percentile * (len(ordered) - 1))]
+                latencies.since_recompute = 0
+            return max(self.min_delay, latencies.value)
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            s = self._stats
+            return HedgeStats(s.requests, s.hedged, s.hedge_wins, s.rejected)
+
+    def close(self) -> None:
+        """Shut down the thread pool used by sync requests (it is recreated if needed)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _start(self, operation_id: str) -> Optional[float]:
+        with self._lock:
+            self._stats.requests += 1
+            self._tokens = min(_MAX_HEDGE_TOKENS, self._tokens + self.max_ratio)
+        return self.current_delay(operation_id)
+
+    def _observe(self, operation_id: str, seconds: float) -> None:
+        # When the hedge wins, the time until then is a lower bound of the primary's latency.
+        with self._lock:
+            latencies = self._latencies.get(operation_id)
+            if latencies is None:
+                latencies = self._latencies[operation_id] = _Latencies()
+            latencies.samples.append(seconds)
+            latencies.since_recompute += 1
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                self._stats.rejected += 1
+                return False
+            self._tokens -= 1
+            self._stats.hedged += 1
+            return True
+
+    def _won(self) -> None:
+        with self._lock:
+            self._stats.hedge_wins += 1
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="lambdadb-hedge"
+                )
+            return self._executor
+
+    def call(self, operation_id: str, fn: Callable[[], httpx.Response]) -> httpx.Response:
+        """Run fn, and run it again if it has not returned after the hedge delay; the first success wins."""
+        delay = self._start(operation_id)
+        if delay is None:
+            start = time.monotonic()
+            res = fn()
+            self._observe(operation_id, time.monotonic() - start)
+            return res
+
+        executor = self._get_executor()
+        start = time.monotonic()
+        primary = executor.submit(contextvars.copy_context().run, fn)
+        try:
+            res = primary.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            pass
+        else:
+            self._observe(operation_id, time.monotonic() - start)
+            return res
+
+        if not self._take_token():
+            try:
+                return primary.result()
+            finally:
+                self._observe(operation_id, time.monotonic() - start)
+
+        hedge = executor.submit(contextvars.copy_context().run, fn)
+        pending: Set["concurrent.futures.Future[httpx.Response]"] = {primary, hedge}
+        first_failure: Optional["concurrent.futures.Future[httpx.Response]"] = None
+        try:
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in (f for f in (primary, hedge) if f in done):
+                    if _succeeded(future):
+                        if future is hedge:
+                            self._won()
+                        self._observe(operation_id, time.monotonic() - start)
+                        return future.result()
+                    if first_failure is None:
+                        first_failure = future
+            assert first_failure is not None
+            self._observe(operation_id, time.monotonic() - start)
+            return first_failure.result()
+        finally:
+            for future in pending:
+                if not future.cancel():
+                    future.add_done_callback(_discard)
+
+    async def call_async(
+        self, operation_id: str, fn: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Async variant of call(); the request that loses is cancelled."""
+        delay = self._start(operation_id)
+        start = time.monotonic()
+        if delay is None:
+            res = await fn()
+            self._observe(operation_id, time.monotonic() - start)
+            return res
+
+        primary: "asyncio.Future[httpx.Response]" = asyncio.ensure_future(fn())
+        pending: Set["asyncio.Future[httpx.Response]"] = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done or not self._take_token():
+                pending = set()  # awaiting the task directly cancels it if we are cancelled
+                res = await primary
+                self._observe(operation_id, time.monotonic() - start)
+                return res
+
+            hedge: "asyncio.Future[httpx.Response]" = asyncio.ensure_future(fn())
+            pending = {primary, hedge}
+            first_failure: Optional["asyncio.Future[httpx.Response]"] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in (t for t in (primary, hedge) if t in done):
+                    if _succeeded(task):
+                        if task is hedge:
+                            self._won()
+                        self._observe(operation_id, time.monotonic() - start)
+                        return task.result()
+                    if first_failure is None:
+                        first_failure = task
+            assert first_failure is not None
+            self._observe(operation_id, time.monotonic() - start)
+            return first_failure.result()
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_discard)
+
+    def __repr__(self) -> str:
+        return (
+            f"HedgePolicy(delay={self.delay}, percentile={self.percentile}, "
+            f"max_ratio={self.max_ratio})"
+        )
+
+
+def _succeeded(future: Any) -> bool:
+    """A response that settles the request: not an exception, 429 or 5XX."""
+    if future.cancelled() or future.exception() is not None:
+        return False
+    status = future.result().status_code
+    return status != 429 and status < 500
+
+
+def _discard(future: Any) -> None:
+    """Close the response of a request that lost the race (and consume its exception)."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    future.result().close()
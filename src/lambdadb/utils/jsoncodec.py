@@ -0,0 +1,159 @@
+"""Pluggable JSON backends for request/response bodies.
+
+A codec decides how JSON text is produced and parsed; pydantic still validates
+and shapes the data. Select one per client with LambdaDB(json_codec=...).
+"""
+
+import json
+import warnings
+from typing import Any, Callable, Dict, Union
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json, to_jsonable_python
+
+
+def json_fallback(val: Any) -> Any:
+    """Convert values pydantic cannot serialize natively into JSON-compatible ones.
+
+    NumPy arrays and scalars (e.g. embedding vectors) become lists and Python
+    numbers via a single ``tolist()`` call. NumPy is an optional dependency and
+    is never imported here; values are recognised by their type's module.
+    """
+    if type(val).__module__ == "numpy" and hasattr(val, "tolist"):
+        return val.tolist()
+    raise TypeError(f"Object of type {type(val).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """Base class for JSON backends. Subclasses implement dumps/loads and may
+    override marshal/unmarshal when the backend can skip an intermediate step."""
+
+    name = ""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode plain Python data as compact UTF-8 JSON."""
+        raise NotImplementedError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode JSON text into plain Python data."""
+        raise NotImplementedError
+
+    def marshal(self, adapter: TypeAdapter, val: Any) -> bytes:
+        """Serialize an already validated value of the adapter's type."""
+        return self.dumps(
+            adapter.dump_python(
+                val, by_alias=True, mode="json", exclude_none=True, fallback=json_fallback
+            )
+        )
+
+    def unmarshal(self, adapter: TypeAdapter, raw: Union[str, bytes]) -> Any:
+        """Parse and validate a JSON body into the adapter's type."""
+        return adapter.validate_python(self.loads(raw))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class PydanticJSONCodec(JSONCodec):
+    """Default backend: pydantic-core parses and serializes in one pass, without
+    building intermediate Python objects."""
+
+    name = "pydantic"
+
+    def dumps(self, obj: Any) -> bytes:
+        return to_json(obj, fallback=json_fallback)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return from_json(data)
+
+    def marshal(self, adapter: TypeAdapter, val: Any) -> bytes:
+        return adapter.dump_json(
+            val, by_alias=True, exclude_none=True, fallback=json_fallback
+        )
+
+    def unmarshal(self, adapter: TypeAdapter, raw: Union[str, bytes]) -> Any:
+        return adapter.validate_json(raw)
+
+
+class StdlibJSONCodec(JSONCodec):
+    """The standard library json module. Always available; the slowest backend."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=json_fallback).encode(
+            "utf-8"
+        )
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """orjson (optional dependency: pip install "lambdadb[orjson]"). Encodes NumPy
+    arrays natively, without converting them to Python lists first."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self._orjson = orjson
+        self._option = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=_orjson_default, option=self._option)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+    def marshal(self, adapter: TypeAdapter, val: Any) -> bytes:
+        # Python mode leaves arrays, datetimes and enums for orjson to encode natively.
+        return self.dumps(adapter.dump_python(val, by_alias=True, exclude_none=True))
+
+
+def _orjson_default(val: Any) -> Any:
+    try:
+        return json_fallback(val)
+    except TypeError:
+        return to_jsonable_python(val)
+
+
+_CODEC_FACTORIES: Dict[str, Callable[[], JSONCodec]] = {
+    "pydantic": PydanticJSONCodec,
+    "json": StdlibJSONCodec,
+    "stdlib": StdlibJSONCodec,
+    "orjson": OrjsonJSONCodec,
+}
+
+_DEFAULT_CODEC: JSONCodec = PydanticJSONCodec()
+
+
+def default_json_codec() -> JSONCodec:
+    """The codec used when none is configured (shared, stateless)."""
+    return _DEFAULT_CODEC
+
+
+def get_json_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """Resolve a codec name ("pydantic", "orjson", "json") or instance.
+    None selects the default. If orjson is requested but not installed, a
+    warning is issued and the default codec is used instead."""
+    if codec is None:
+        return _DEFAULT_CODEC
+    if isinstance(codec, JSONCodec):
+        return codec
+    factory = _CODEC_FACTORIES.get(codec)
+    if factory is None:
+        raise ValueError(
+            f"Unknown json_codec {codec!r}; expected one of {sorted(_CODEC_FACTORIES)} or a JSONCodec"
+        )
+    try:
+        return factory()
+    except ImportError:
+        warnings.warn(
+            f"json_codec={codec!r} is not installed; falling back to the default "
+            f"{_DEFAULT_CODEC.name!r} codec",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return _DEFAULT_CODEC
@@ -0,0 +1,117 @@
+"""Incremental parsing of JSON arrays (presigned docs_url bodies) as they download.
+
+The splitter finds element boundaries in the raw bytes (tracking nesting and
+skipping over strings) and hands each complete element to the JSON codec, so
+only the elements not yet consumed are held in memory.
+"""
+
+from typing import Dict, List, Tuple
+
+_QUOTE, _COMMA, _BACKSLASH = 0x22, 0x2C, 0x5C
+_OPEN, _CLOSE = b"[{", b"]}"
+_WHITESPACE = b" \t\r\n"
+# Bytes that can change the nesting state. Inside nested values commas do not
+# matter, so e.g. an embedding vector is skipped in one step.
+_TOP_LEVEL: Tuple[int, ...] = (_QUOTE, _COMMA, 0x5B, 0x5D, 0x7B, 0x7D)
+_NESTED: Tuple[int, ...] = (_QUOTE, 0x5B, 0x5D, 0x7B, 0x7D)
+
+
+class JSONArraySplitter:
+    """Splits a top-level JSON array fed in arbitrary chunks into the raw bytes
+    of its elements. Elements are not decoded or validated here."""
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0  # next byte to scan
+        self._start = 0  # start of the current element
+        self._depth = 0
+        self._started = False
+        self._count = 0  # elements handed out by earlier feed() calls
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Add a chunk of the body; returns the elements completed by it, in order."""
+        if self.done:
+            if chunk.strip(_WHITESPACE):
+                raise ValueError("Unexpected data after end of JSON array")
+            return []
+        buf = self._buf
+        buf += chunk
+        end = len(buf)
+        # Next position of each structural byte at or after the scan position
+        # (end when absent); bytearray.find is a memchr, far faster than a regex.
+        found: Dict[int, int] = {}
+
+        def next_of(byte: int, pos: int) -> int:
+            i = found.get(byte, -1)
+            if i < pos:
+                i = buf.find(byte, pos)
+                i = end if i < 0 else i
+                found[byte] = i
+            return i
+
+        out: List[bytes] = []
+        pos = self._pos
+        while not self.done:
+            i = min(next_of(b, pos) for b in (_NESTED if self._depth > 1 else _TOP_LEVEL))
+            if i == end:
+                pos = end
+                break
+            c = buf[i]
+            if not self._started:
+                if c != 0x5B or buf[:i].strip(_WHITESPACE):  # "["
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                self._depth = 1
+                self._start = i + 1
+            elif c == _QUOTE:
+                close = self._string_end(buf, i + 1)
+                if close < 0:
+                    pos = i  # string continues in the next chunk
+                    break
+                pos = close + 1
+                continue
+            elif c in _OPEN:
+                self._depth += 1
+            elif c in _CLOSE:
+                self._depth -= 1
+                if self._depth == 0:
+                    element = bytes(buf[self._start : i]).strip(_WHITESPACE)
+                    if element:
+                        out.append(element)
+                    elif self._count + len(out):
+                        raise ValueError("Trailing comma in JSON array")
+                    self.done = True
+                    if buf[i + 1 :].strip(_WHITESPACE):
+                        raise ValueError("Unexpected data after end of JSON array")
+            elif c == _COMMA:
+                out.append(bytes(buf[self._start : i]).strip(_WHITESPACE))
+                self._start = i + 1
+            pos = i + 1
+        if self._started and not self.done:
+            # Drop bytes of elements already handed out.
+            del buf[: self._start]
+            pos -= self._start
+            self._start = 0
+        self._pos = pos
+        self._count += len(out)
+        return out
+
+    @staticmethod
+    def _string_end(buf: bytearray, pos: int) -> int:
+        """Index of the quote closing a string whose contents start at pos, or -1 if not yet received."""
+        while True:
+            i = buf.find(_QUOTE, pos)
+            if i < 0:
+                return -1
+            escapes = 0
+            while buf[i - 1 - escapes] == _BACKSLASH:
+                escapes += 1
+            if not escapes % 2:
+                return i
+            pos = i + 1
+
+    def close(self) -> None:
+        """Check that the body ended with a complete array."""
+        if not self.done:
+            raise ValueError("Truncated JSON array")
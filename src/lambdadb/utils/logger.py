@@ -3,7 +3,7 @@
 import httpx
 import logging
 import os
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol
 
 
 class Logger(Protocol):
@@ -16,8 +16,29 @@ class NoOpLogger:
         pass
 
 
-def get_body_content(req: httpx.Request) -> str:
-    return "<streaming body>" if not hasattr(req, "_content") else str(req.content)
+class _Deferred:
+    """Log argument rendered only when a logger formats the message, so the
+    default NoOpLogger never decodes or copies (potentially large) bodies."""
+
+    __slots__ = ("_render",)
+
+    def __init__(self, render: Callable[[], str]) -> None:
+        self._render = render
+
+    def __str__(self) -> str:
+        return self._render()
+
+    __repr__ = __str__
+
+
+def get_body_content(req: httpx.Request) -> Any:
+    if not hasattr(req, "_content"):
+        return "<streaming body>"
+    return _Deferred(lambda: str(req.content))
+
+
+def get_response_content(res: httpx.Response) -> Any:
+    return _Deferred(lambda: res.text)
 
 
 def get_default_logger() -> Logger:
@@ -0,0 +1,181 @@
+"""Adaptive client-side rate limiting: LambdaDB(rate_limiter=RateLimiter(...)).
+
+Every API request made by the client first takes a token from a token bucket.
+The bucket's rate adapts AIMD-style to the server: each 429 response halves it
+(at most once per second, so one burst of 429s counts once) and a Retry-After
+header pauses the whole bucket for that long; every other response raises the
+rate again by a small step, back up to max_rate. Threads and asyncio tasks
+share the same bucket; waiting uses time.sleep or asyncio.sleep respectively.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+from .retries import _parse_retry_after_header
+
+
+@dataclass
+class RateLimiterStats:
+    """State of one bucket of a RateLimiter."""
+
+    rate: float
+    """Current rate in requests per second."""
+    throttles: int = 0
+    """429 responses seen."""
+    decreases: int = 0
+    """Times the rate was lowered."""
+    waits: int = 0
+    """Requests that had to wait for a token."""
+
+
+class _Bucket:
+    __slots__ = ("rate", "tokens", "updated", "paused_until", "last_decrease", "stats")
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.last_decrease = float("-inf")
+        self.stats = RateLimiterStats(rate)
+
+
+class RateLimiter:
+    """Shared AIMD token bucket for the requests of a LambdaDB client.
+
+    :param rate: Initial rate in requests per second.
+    :param burst: Bucket capacity, i.e. requests that may start at once after an idle period (default: one second's worth at max_rate).
+    :param min_rate: The rate is never lowered below this.
+    :param max_rate: The rate is never raised above this (default: rate).
+    :param additive_increase: Requests per second added to the rate per second of unthrottled traffic.
+    :param multiplicative_decrease: Factor applied to the rate on a 429.
+    :param per_operation: Keep a separate bucket per API operation (e.g. queryCollection, upsertDocs).
+    """
+
+    def __init__(
+        self,
+        rate: float = 100.0,
+        burst: Optional[float] = None,
+        min_rate: float = 1.0,
+        max_rate: Optional[float] = None,
+        additive_increase: float = 5.0,
+        multiplicative_decrease: float = 0.5,
+        per_operation: bool = False,
+    ) -> None:
+        max_rate = rate if max_rate is None else max_rate
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("rates must satisfy 0 < min_rate <= rate <= max_rate")
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError("multiplicative_decrease must be between 0 and 1")
+        self.initial_rate = rate
+        self.burst = burst if burst is not None else max(1.0, max_rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self.per_operation = per_operation
+        self._buckets: Dict[Optional[str], _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, operation_id: Optional[str]) -> _Bucket:
+        key = operation_id if self.per_operation else None
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.initial_rate, self.burst)
+        return bucket
+
+    def _reserve(self, operation_id: Optional[str], timeout: Optional[float] = None) -> Optional[float]:
+        """Take a token (possibly one not yet refilled) and return the seconds to wait before using it,
+        or None, taking nothing, if the wait would exceed timeout."""
+        with self._lock:
+            bucket = self._bucket(operation_id)
+            now = time.monotonic()
+            bucket.tokens = min(
+                self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate
+            )
+            bucket.updated = now
+            bucket.tokens -= 1
+            wait = max(
+                -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0,
+                bucket.paused_until - now,
+            )
+            if timeout is not None and wait > timeout:
+                bucket.tokens += 1  # give the token back
+                return None
+            if wait > 0:
+                bucket.stats.waits += 1
+            return wait
+
+    def acquire(
+        self, operation_id: Optional[str] = None, timeout: Optional[float] = None
+    ) -> bool:
+        """Block the calling thread until a request may be sent. Returns False, without
+        waiting, if that would take longer than timeout seconds."""
+        wait = self._reserve(operation_id, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(
+        self, operation_id: Optional[str] = None, timeout: Optional[float] = None
+    ) -> bool:
+        """Wait, without blocking the event loop, until a request may be sent. Returns
+        False, without waiting, if that would take longer than timeout seconds."""
+        wait = self._reserve(operation_id, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def record(self, operation_id: Optional[str], response: httpx.Response) -> None:
+        """Adapt the rate to a response: lower it on 429 (honouring Retry-After), raise it otherwise."""
+        if response.status_code == 429:
+            retry_after = _parse_retry_after_header(response)
+            self.throttled(operation_id, retry_after / 1000 if retry_after else None)
+        else:
+            self.succeeded(operation_id)
+
+    def throttled(self, operation_id: Optional[str] = None, retry_after: Optional[float] = None) -> None:
+        """Multiplicatively lower the rate, and pause for retry_after seconds if given."""
+        with self._lock:
+            bucket = self._bucket(operation_id)
+            now = time.monotonic()
+            bucket.stats.throttles += 1
+            if retry_after:
+                bucket.paused_until = max(bucket.paused_until, now + retry_after)
+            if now - bucket.last_decrease >= 1.0:
+                bucket.last_decrease = now
+                bucket.rate = max(self.min_rate, bucket.rate * self.multiplicative_decrease)
+                bucket.tokens = min(bucket.tokens, 0.0)
+                bucket.stats.decreases += 1
+            bucket.stats.rate = bucket.rate
+
+    def succeeded(self, operation_id: Optional[str] = None) -> None:
+        """Additively raise the rate: about additive_increase per second while requests succeed."""
+        with self._lock:
+            bucket = self._bucket(operation_id)
+            if bucket.rate < self.max_rate:
+                bucket.rate = min(
+                    self.max_rate, bucket.rate + self.additive_increase / bucket.rate
+                )
+                bucket.stats.rate = bucket.rate
+
+    def stats(self, operation_id: Optional[str] = None) -> RateLimiterStats:
+        """Snapshot of the bucket used for operation_id (the shared bucket unless per_operation)."""
+        with self._lock:
+            s = self._bucket(operation_id).stats
+            return RateLimiterStats(s.rate, s.throttles, s.decreases, s.waits)
+
+    def __repr__(self) -> str:
+        return (
+            f"RateLimiter(rate={self.initial_rate}, max_rate={self.max_rate}, "
+            f"min_rate={self.min_rate}, per_operation={self.per_operation})"
+        )
@@ -10,6 +10,7 @@ from typing import (
 
 from .forms import serialize_form_data, serialize_multipart_form
 
+from .jsoncodec import JSONCodec
 from .serializers import marshal_json
 
 SERIALIZATION_METHOD_TO_CONTENT_TYPE = {
@@ -35,6 +36,7 @@ def serialize_request_body(
     optional: bool,
     serialization_method: str,
     request_body_type,
+    json_codec: Optional[JSONCodec] = None,
 ) -> Optional[SerializedRequestBody]:
     if request_body is None:
         if not nullable and optional:
@@ -45,7 +47,9 @@ def serialize_request_body(
     serialized_request_body = SerializedRequestBody(media_type)
 
     if re.match(r"^(application|text)\/([^+]+\+)*json.*", media_type) is not None:
-        serialized_request_body.content = marshal_json(request_body, request_body_type)
+        serialized_request_body.content = marshal_json(
+            request_body, request_body_type, json_codec
+        )
     elif re.match(r"^multipart\/.*", media_type) is not None:
         (
             serialized_request_body.media_type,
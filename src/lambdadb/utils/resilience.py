@@ -0,0 +1,246 @@
+"""Client-wide limits on retrying: a retry budget and per-operation circuit breakers.
+
+RetryBudget caps retries at a fraction of the requests made in a sliding
+window (plus a small fixed allowance), so that during an outage retries do not
+multiply the load or keep calls blocked for the whole backoff period.
+CircuitBreaker tracks consecutive failures (5XX responses, connection errors
+and timeouts) per (operation, host). After failure_threshold of them the
+circuit opens and calls fail fast with errors.CircuitOpenError; after
+recovery_timeout seconds it lets a trial call through (half-open) and closes
+again if that call succeeds.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+import httpx
+
+from lambdadb.errors.circuit_open_error import CircuitOpenError
+from lambdadb.errors.no_response_error import NoResponseError
+
+
+@dataclass
+class RetryBudgetStats:
+    requests: int = 0
+    """Requests made (first attempts) since the budget was created."""
+    retries: int = 0
+    """Retries allowed by the budget."""
+    rejected: int = 0
+    """Retries refused because the budget was spent."""
+
+
+class RetryBudget:
+    """Allows at most `ratio` retries per request over the last `window` seconds,
+    plus `min_retries_per_second` so that low-traffic clients can still retry."""
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 10.0,
+        window: float = 10.0,
+    ) -> None:
+        if ratio < 0 or min_retries_per_second < 0 or window <= 0:
+            raise ValueError("ratio and min_retries_per_second must be >= 0 and window > 0")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._stats = RetryBudgetStats()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        for times in (self._requests, self._retries):
+            while times and times[0] < cutoff:
+                times.popleft()
+
+    def record_request(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+            self._stats.requests += 1
+
+    def try_retry(self) -> bool:
+        """Spend one retry from the budget; False when it is exhausted."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            allowed = self.min_retries_per_second * self.window + self.ratio * len(self._requests)
+            if len(self._retries) + 1 > allowed:
+                self._stats.rejected += 1
+                return False
+            self._retries.append(now)
+            self._stats.retries += 1
+            return True
+
+    def stats(self) -> RetryBudgetStats:
+        with self._lock:
+            s = self._stats
+            return RetryBudgetStats(s.requests, s.retries, s.rejected)
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryBudget(ratio={self.ratio}, min_retries_per_second={self.min_retries_per_second}, "
+            f"window={self.window})"
+        )
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitStats:
+    """State and counters of one circuit."""
+
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    rejected: int = 0
+    """Calls that failed fast while the circuit was open."""
+    transitions: Dict[Tuple[CircuitState, CircuitState], int] = field(default_factory=dict)
+    """Number of state changes, by (from, to)."""
+
+
+class Circuit:
+    """The breaker state of one (operation, host); obtained from CircuitBreaker.circuit()."""
+
+    def __init__(self, breaker: "CircuitBreaker", key: Tuple[str, str]) -> None:
+        self._breaker = breaker
+        self.key = key
+        self._stats = CircuitStats()
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        return self._stats.state
+
+    def _transition(self, new: CircuitState) -> None:
+        # Called with the breaker's lock held.
+        old = self._stats.state
+        if old is new:
+            return
+        self._stats.state = new
+        self._stats.transitions[(old, new)] = self._stats.transitions.get((old, new), 0) + 1
+        if new is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        self._breaker._notify(self.key, old, new)  # pylint: disable=protected-access
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if calls are not allowed right now."""
+        breaker = self._breaker
+        with breaker._lock:  # pylint: disable=protected-access
+            if self._stats.state is CircuitState.OPEN:
+                remaining = self._opened_at + breaker.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    self._stats.rejected += 1
+                    raise CircuitOpenError(self.key[0], self.key[1], remaining)
+                self._transition(CircuitState.HALF_OPEN)
+            if self._stats.state is CircuitState.HALF_OPEN:
+                if self._trial_in_flight:
+                    self._stats.rejected += 1
+                    raise CircuitOpenError(self.key[0], self.key[1], None)
+                self._trial_in_flight = True
+
+    def record(self, success: Optional[bool]) -> None:
+        """Record a call outcome; None for outcomes that say nothing about the server's health."""
+        breaker = self._breaker
+        with breaker._lock:  # pylint: disable=protected-access
+            was_trial = self._trial_in_flight
+            self._trial_in_flight = False
+            if success is None:
+                return
+            if success:
+                self._stats.consecutive_failures = 0
+                self._transition(CircuitState.CLOSED)
+                return
+            self._stats.consecutive_failures += 1
+            if was_trial or self._stats.consecutive_failures >= breaker.failure_threshold:
+                # A failed trial re-opens the circuit for another recovery_timeout.
+                self._transition(CircuitState.OPEN)
+
+    def call(self, func: Callable[[], httpx.Response]) -> httpx.Response:
+        self.before_call()
+        try:
+            res = func()
+        except BaseException as e:
+            self.record(False if _is_failure(e) else None)
+            raise
+        self.record(res.status_code < 500)
+        return res
+
+    async def call_async(self, func: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        self.before_call()
+        try:
+            res = await func()
+        except BaseException as e:
+            self.record(False if _is_failure(e) else None)
+            raise
+        self.record(res.status_code < 500)
+        return res
+
+    def stats(self) -> CircuitStats:
+        with self._breaker._lock:  # pylint: disable=protected-access
+            s = self._stats
+            return CircuitStats(s.state, s.consecutive_failures, s.rejected, dict(s.transitions))
+
+
+def _is_failure(e: BaseException) -> bool:
+    return isinstance(e, (httpx.TransportError, NoResponseError))
+
+
+class CircuitBreaker:
+    """Per-(operation, host) circuit breakers for the requests of a LambdaDB client.
+
+    :param failure_threshold: Consecutive failures (5XX, connection errors, timeouts) that open a circuit.
+    :param recovery_timeout: Seconds an open circuit fails fast before letting a trial call through.
+    :param on_state_change: Called as on_state_change((operation_id, host), old_state, new_state) on every transition.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        on_state_change: Optional[
+            Callable[[Tuple[str, str], CircuitState, CircuitState], Any]
+        ] = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.on_state_change = on_state_change
+        self._circuits: Dict[Tuple[str, str], Circuit] = {}
+        self._lock = threading.RLock()
+
+    def circuit(self, operation_id: str, host: str) -> Circuit:
+        key = (operation_id, host)
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = Circuit(self, key)
+            return circuit
+
+    def stats(self) -> Dict[Tuple[str, str], CircuitStats]:
+        """Snapshot of every circuit, by (operation_id, host)."""
+        with self._lock:
+            circuits = list(self._circuits.values())
+        return {c.key: c.stats() for c in circuits}
+
+    def _notify(self, key: Tuple[str, str], old: CircuitState, new: CircuitState) -> None:
+        if self.on_state_change is not None:
+            self.on_state_change(key, old, new)
+
+    def __repr__(self) -> str:
+        return (
+            f"CircuitBreaker(failure_threshold={self.failure_threshold}, "
+            f"recovery_timeout={self.recovery_timeout})"
+        )
@@ -5,10 +5,15 @@ import random
 import time
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import httpx
 
+from .deadlines import remaining
+
+if TYPE_CHECKING:
+    from .resilience import Circuit, RetryBudget
+
 
 class BackoffStrategy:
     initial_interval: int
@@ -45,10 +50,22 @@ class RetryConfig:
 class Retries:
     config: RetryConfig
     status_codes: List[str]
+    budget: Optional["RetryBudget"]
+    circuit: Optional["Circuit"]
 
-    def __init__(self, config: RetryConfig, status_codes: List[str]):
+    def __init__(
+        self,
+        config: RetryConfig,
+        status_codes: List[str],
+        budget: Optional["RetryBudget"] = None,
+        circuit: Optional["Circuit"] = None,
+    ):
         self.config = config
         self.status_codes = status_codes
+        self.budget = budget
+        """Client-wide retry budget; retrying stops early once it is spent."""
+        self.circuit = circuit
+        """Circuit breaker of the operation and host; every attempt goes through it."""
 
 
 class TemporaryError(Exception):
@@ -124,12 +141,19 @@ def _get_sleep_interval(
 
 
 def retry(func, retries: Retries):
+    circuit = retries.circuit
+
+    def guarded():
+        if circuit is not None:
+            return circuit.call(func)
+        return func()
+
     if retries.config.strategy == "backoff":
 
         def do_request() -> httpx.Response:
             res: httpx.Response
             try:
-                res = func()
+                res = guarded()
 
                 for code in retries.status_codes:
                     if "X" in code.upper():
@@ -167,18 +191,26 @@ def retry(func, retries: Retries):
             retries.config.backoff.max_interval,
             retries.config.backoff.exponent,
             retries.config.backoff.max_elapsed_time,
+            budget=retries.budget,
         )
 
-    return func()
+    return guarded()
 
 
 async def retry_async(func, retries: Retries):
+    circuit = retries.circuit
+
+    async def guarded():
+        if circuit is not None:
+            return await circuit.call_async(func)
+        return await func()
+
     if retries.config.strategy == "backoff":
 
         async def do_request() -> httpx.Response:
             res: httpx.Response
             try:
-                res = await func()
+                res = await guarded()
 
                 for code in retries.status_codes:
                     if "X" in code.upper():
@@ -216,9 +248,10 @@ async def retry_async(func, retries: Retries):
             retries.config.backoff.max_interval,
             retries.config.backoff.exponent,
             retries.config.backoff.max_elapsed_time,
+            budget=retries.budget,
         )
 
-    return await func()
+    return await guarded()
 
 
 def retry_with_backoff(
@@ -227,9 +260,12 @@ def retry_with_backoff(
     max_interval=60000,
     exponent=1.5,
     max_elapsed_time=3600000,
+    budget: Optional["RetryBudget"] = None,
 ):
     start = round(time.time() * 1000)
     retries = 0
+    if budget is not None:
+        budget.record_request()
 
     while True:
         try:
@@ -238,15 +274,21 @@ def retry_with_backoff(
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
             now = round(time.time() * 1000)
-            if now - start > max_elapsed_time:
+            sleep = _get_sleep_interval(
+                exception, initial_interval, max_interval, exponent, retries
+            )
+            left = remaining()
+            if (
+                now - start > max_elapsed_time
+                # The next attempt could not start before the deadline.
+                or (left is not None and sleep >= left)
+                or (budget is not None and not budget.try_retry())
+            ):
                 if isinstance(exception, TemporaryError):
                     return exception.response
 
                 raise
 
-            sleep = _get_sleep_interval(
-                exception, initial_interval, max_interval, exponent, retries
-            )
             time.sleep(sleep)
             retries += 1
 
@@ -257,9 +299,12 @@ async def retry_with_backoff_async(
     max_interval=60000,
     exponent=1.5,
     max_elapsed_time=3600000,
+    budget: Optional["RetryBudget"] = None,
 ):
     start = round(time.time() * 1000)
     retries = 0
+    if budget is not None:
+        budget.record_request()
 
     while True:
         try:
@@ -268,14 +313,20 @@ async def retry_with_backoff_async(
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
             now = round(time.time() * 1000)
-            if now - start > max_elapsed_time:
+            sleep = _get_sleep_interval(
+                exception, initial_interval, max_interval, exponent, retries
+            )
+            left = remaining()
+            if (
+                now - start > max_elapsed_time
+                # The next attempt could not start before the deadline.
+                or (left is not None and sleep >= left)
+                or (budget is not None and not budget.try_retry())
+            ):
                 if isinstance(exception, TemporaryError):
                     return exception.response
 
                 raise
 
-            sleep = _get_sleep_interval(
-                exception, initial_interval, max_interval, exponent, retries
-            )
             await asyncio.sleep(sleep)
             retries += 1
@@ -2,17 +2,18 @@
 
 from decimal import Decimal
 import functools
-import json
+import threading
 import typing
-from typing import Any, Dict, List, Tuple, Union, get_args
+from typing import Any, Dict, List, Optional, Tuple, Union, get_args
 import typing_extensions
 from typing_extensions import get_origin
 
 import httpx
-from pydantic import ConfigDict, create_model
-from pydantic_core import from_json
+from pydantic import ConfigDict, TypeAdapter
+from pydantic.errors import PydanticUserError
 
 from ..types.basemodel import BaseModel, Nullable, OptionalNullable, Unset
+from .jsoncodec import JSONCodec, default_json_codec
 
 
 def serialize_decimal(as_str: bool):
@@ -116,41 +117,62 @@ def validate_const(v):
     return validate
 
 
-def unmarshal_json(raw, typ: Any) -> Any:
-    return unmarshal(from_json(raw), typ)
+_CODEC_CONFIG = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
 
+_codecs: Dict[Any, TypeAdapter] = {}
+_codecs_lock = threading.Lock()
+
+
+def get_codec(typ: Any) -> TypeAdapter:
+    """Return the compiled codec for ``typ``, building it on first use.
+
+    Building a validator/serializer is far more expensive than running one, so
+    codecs are registered once per target type and shared by every request and
+    response that uses it. Unhashable types are compiled but not cached.
+    """
+    try:
+        return _codecs[typ]
+    except KeyError:
+        pass
+    except TypeError:
+        return _build_codec(typ)
+
+    with _codecs_lock:
+        codec = _codecs.get(typ)
+        if codec is None:
+            codec = _build_codec(typ)
+            _codecs[typ] = codec
+    return codec
 
-def unmarshal(val, typ: Any) -> Any:
-    unmarshaller = create_model(
-        "Unmarshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
 
-    m = unmarshaller(body=val)
+def _build_codec(typ: Any) -> TypeAdapter:
+    try:
+        return TypeAdapter(typ, config=_CODEC_CONFIG)
+    except PydanticUserError:
+        # Models, dataclasses and TypedDicts carry their own config.
+        return TypeAdapter(typ)
 
-    # pyright: ignore[reportAttributeAccessIssue]
-    return m.body  # type: ignore
 
+def unmarshal_json(raw, typ: Any, json_codec: Optional[JSONCodec] = None) -> Any:
+    return (json_codec or default_json_codec()).unmarshal(get_codec(typ), raw)
 
-def marshal_json(val, typ):
+
+def unmarshal(val, typ: Any) -> Any:
+    return get_codec(typ).validate_python(val)
+
+
+def marshal_json(val, typ, json_codec: Optional[JSONCodec] = None):
     if is_nullable(typ) and val is None:
         return "null"
 
-    marshaller = create_model(
-        "Marshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
-
-    m = marshaller(body=val)
+    codec = get_codec(typ)
 
-    d = m.model_dump(by_alias=True, mode="json", exclude_none=True)
+    out = (json_codec or default_json_codec()).marshal(codec, codec.validate_python(val))
 
-    if len(d) == 0:
+    if out == b"null":
         return ""
 
-    return json.dumps(d[next(iter(d))], separators=(",", ":"))
+    return out.decode("utf-8")
 
 
 def is_nullable(field):
@@ -0,0 +1,105 @@
+"""Coalescing of identical in-flight requests: LambdaDB(coalesce_reads=True).
+
+While a read-only request is in flight, identical requests (same operation,
+method, URL, headers and body) wait for its result instead of being sent again.
+The response (or exception) is shared by every caller that joined the call.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import httpx
+
+_T = TypeVar("_T")
+
+# Operations that only read, so one response can answer every identical request.
+READ_OPERATIONS = frozenset(
+    {
+        "queryCollection",
+        "fetchDocs",
+        "listDocs",
+        "getCollection",
+        "listCollections",
+    }
+)
+
+
+def request_key(operation_id: str, request: httpx.Request) -> Optional[Hashable]:
+    """Key identifying identical requests, or None when the request must not be coalesced."""
+    if operation_id not in READ_OPERATIONS:
+        return None
+    try:
+        body = request.content
+    except httpx.RequestNotRead:
+        return None  # streaming body
+    return (
+        operation_id,
+        request.method,
+        str(request.url),
+        tuple(sorted(request.headers.multi_items())),
+        body,
+    )
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers with the same key share its outcome."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+        """Number of calls answered by another caller's request."""
+
+    def do(self, key: Hashable, fn: Callable[[], _T]) -> _T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[_T]]) -> _T:
+        # Calls are shared only within one event loop.
+        loop_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._tasks.get(loop_key)
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._tasks[loop_key] = task
+                task.add_done_callback(lambda _: self._forget(loop_key, task))
+            else:
+                self.coalesced += 1
+        # Shielded, so a caller that is cancelled does not cancel the call the others wait for.
+        return await asyncio.shield(task)
+
+    def _forget(self, loop_key: Tuple[int, Hashable], task: "asyncio.Future[Any]") -> None:
+        with self._lock:
+            if self._tasks.get(loop_key) is task:
+                del self._tasks[loop_key]
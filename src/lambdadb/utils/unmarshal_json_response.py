@@ -4,6 +4,7 @@ from typing import Any, Optional, Type, TypeVar, overload
 
 import httpx
 
+from .jsoncodec import JSONCodec, default_json_codec
 from .serializers import unmarshal_json
 from lambdadb import errors
 
@@ -12,27 +13,42 @@ T = TypeVar("T")
 
 @overload
 def unmarshal_json_response(
-    typ: Type[T], http_res: httpx.Response, body: Optional[str] = None
+    typ: Type[T],
+    http_res: httpx.Response,
+    body: Optional[str] = None,
+    json_codec: Optional[JSONCodec] = None,
+    raw: bool = False,
 ) -> T: ...
 
 
 @overload
 def unmarshal_json_response(
-    typ: Any, http_res: httpx.Response, body: Optional[str] = None
+    typ: Any,
+    http_res: httpx.Response,
+    body: Optional[str] = None,
+    json_codec: Optional[JSONCodec] = None,
+    raw: bool = False,
 ) -> Any: ...
 
 
 def unmarshal_json_response(
-    typ: Any, http_res: httpx.Response, body: Optional[str] = None
+    typ: Any,
+    http_res: httpx.Response,
+    body: Optional[str] = None,
+    json_codec: Optional[JSONCodec] = None,
+    raw: bool = False,
 ) -> Any:
-    if body is None:
-        body = http_res.text
+    # Parse the raw bytes; decoding to text first would copy large bodies.
+    data = http_res.content if body is None else body
     try:
-        return unmarshal_json(body, typ)
+        if raw:
+            # response_mode="raw": plain JSON data, no model validation.
+            return (json_codec or default_json_codec()).loads(data)
+        return unmarshal_json(data, typ, json_codec)
     except Exception as e:
         raise errors.ResponseValidationError(
             "Response validation failed",
             http_res,
             e,
-            body,
+            http_res.text if body is None else body,
         ) from e
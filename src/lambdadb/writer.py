@@ -0,0 +1,375 @@
+"""Write-behind buffers for collection upserts: client.collection(name).docs.writer() / .writer_async().
+
+Docs written to a writer are buffered, coalesced by "id" (last write wins) and sent as
+batched upserts from a background thread (sync) or task (async). Writers block when the
+buffer is full and a batch is still being sent, and flush everything on close.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from lambdadb import models, utils
+from lambdadb.batching import (
+    BatchOutcome,
+    _BULK_BODY_PREFIX,
+    _BULK_BODY_SUFFIX,
+    _UPSERT_MAX_PAYLOAD_BYTES,
+    _encode_doc,
+)
+
+# Bytes of the {"docs":[...]} envelope around the buffered docs
+_BODY_OVERHEAD = len(_BULK_BODY_PREFIX) + len(_BULK_BODY_SUFFIX)
+
+
+class _WriteBuffer:
+    """Buffer state shared by the sync and async writers. Not thread-safe on its own."""
+
+    def __init__(
+        self,
+        max_docs: int,
+        max_bytes: int,
+        flush_interval: float,
+        json_codec: Optional[utils.JSONCodec],
+    ) -> None:
+        if max_docs < 1:
+            raise ValueError("max_docs must be at least 1")
+        if max_bytes <= _BODY_OVERHEAD:
+            raise ValueError(f"max_bytes must be greater than {_BODY_OVERHEAD}")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self.max_docs = max_docs
+        self.max_bytes = max_bytes
+        # Each doc is counted with its separating comma, so this bounds the whole request body.
+        self.budget = max_bytes - _BODY_OVERHEAD + 1
+        self.flush_interval = flush_interval
+        self.json_codec = json_codec
+        self.docs: Dict[Any, Tuple[Dict[str, Any], int]] = {}
+        self.num_bytes = 0
+        self.oldest: Optional[float] = None
+        self.written_seq = 0
+        self.sent_seq = 0
+        self.sending = False
+        self.space_wanted = False
+        self.flush_waiters = 0
+        self.closed = False
+        self.failures: List[BatchOutcome] = []
+        self.unreported_failures = 0
+        self.num_batches = 0
+
+    def size_of(self, doc: Dict[str, Any]) -> int:
+        """Encoded size of doc plus its separating comma."""
+        return len(_encode_doc(doc, self.json_codec)) + 1
+
+    @staticmethod
+    def key_of(doc: Dict[str, Any]) -> Any:
+        doc_id = doc.get("id")
+        if doc_id is None:
+            return object()  # docs without an id are never coalesced
+        try:
+            hash(doc_id)
+        except TypeError:
+            return object()
+        return ("id", doc_id)
+
+    def check_size(self, size: int) -> None:
+        if size > self.budget:
+            raise ValueError(
+                f"Document of {size} bytes exceeds writer max_bytes {self.max_bytes}"
+            )
+
+    def fits(self, key: Any, size: int) -> bool:
+        if not self.docs:
+            return True
+        old = self.docs.get(key)
+        count = len(self.docs) + (0 if old is not None else 1)
+        num_bytes = self.num_bytes - (old[1] if old is not None else 0) + size
+        return count <= self.max_docs and num_bytes <= self.budget
+
+    def put(self, key: Any, doc: Dict[str, Any], size: int) -> bool:
+        """Buffer a doc (replacing any pending doc with the same id). Returns True when the buffer is full."""
+        old = self.docs.pop(key, None)
+        if old is not None:
+            self.num_bytes -= old[1]
+        self.docs[key] = (doc, size)
+        self.num_bytes += size
+        self.written_seq += 1
+        if self.oldest is None:
+            self.oldest = time.monotonic()
+        return len(self.docs) >= self.max_docs or self.num_bytes >= self.budget
+
+    def ready_in(self) -> Optional[float]:
+        """Seconds until the buffer should be flushed: 0 for now, None when there is nothing to flush."""
+        if not self.docs:
+            return None
+        if (
+            self.closed
+            or self.space_wanted
+            or self.flush_waiters
+            or len(self.docs) >= self.max_docs
+            or self.num_bytes >= self.budget
+        ):
+            return 0.0
+        assert self.oldest is not None
+        return max(0.0, self.oldest + self.flush_interval - time.monotonic())
+
+    def take(self) -> Tuple[List[Dict[str, Any]], int]:
+        batch = [doc for doc, _ in self.docs.values()]
+        self.docs = {}
+        self.num_bytes = 0
+        self.oldest = None
+        self.space_wanted = False
+        self.sending = True
+        return batch, self.written_seq
+
+    def done(self, batch: List[Dict[str, Any]], seq: int, error: Optional[Exception]) -> None:
+        if error is not None:
+            self.failures.append(
+                BatchOutcome(self.num_batches, len(batch), error=error, items=batch)
+            )
+            self.unreported_failures += 1
+        self.num_batches += 1
+        self.sent_seq = seq
+        self.sending = False
+
+    def raise_failures(self) -> None:
+        """Raise the first failure not yet reported by flush()/close(). All failures stay in .failures."""
+        if not self.unreported_failures:
+            return
+        first = self.failures[len(self.failures) - self.unreported_failures]
+        self.unreported_failures = 0
+        assert first.error is not None
+        raise first.error
+
+
+class BufferedWriter:
+    """Buffers upserts and sends them in batches from a background thread.
+    Obtain with coll.docs.writer(...) and use as a context manager so pending docs are flushed on exit.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[Dict[str, Any]]], models.MessageResponse],
+        *,
+        max_docs: int = 1000,
+        max_bytes: int = _UPSERT_MAX_PAYLOAD_BYTES,
+        flush_interval: float = 1.0,
+        json_codec: Optional[utils.JSONCodec] = None,
+    ) -> None:
+        self._send = send
+        self._buf = _WriteBuffer(max_docs, max_bytes, flush_interval, json_codec)
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="lambdadb-buffered-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def failures(self) -> List[BatchOutcome]:
+        """Batches that failed to upsert; each keeps its docs in .items."""
+        with self._cond:
+            return list(self._buf.failures)
+
+    def write(self, doc: Dict[str, Any]) -> None:
+        """Buffer a doc for upsert. Blocks while the buffer is full and the previous batch is still being sent."""
+        size = self._buf.size_of(doc)
+        self._buf.check_size(size)
+        key = self._buf.key_of(doc)
+        with self._cond:
+            while True:
+                if self._buf.closed:
+                    raise ValueError("BufferedWriter is closed")
+                if self._buf.fits(key, size):
+                    break
+                self._buf.space_wanted = True
+                self._cond.notify_all()
+                self._cond.wait()
+            if self._buf.put(key, doc, size):
+                self._cond.notify_all()
+
+    def write_many(self, docs: Iterable[Dict[str, Any]]) -> None:
+        """Buffer several docs for upsert."""
+        for doc in docs:
+            self.write(doc)
+
+    def flush(self) -> None:
+        """Block until every doc written before this call has been sent.
+        Raises the first batch error since the last flush()/close(), if any."""
+        with self._cond:
+            target = self._buf.written_seq
+            self._buf.flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                while self._buf.sent_seq < target and self._thread.is_alive():
+                    self._cond.wait()
+            finally:
+                self._buf.flush_waiters -= 1
+            self._buf.raise_failures()
+
+    def close(self) -> None:
+        """Flush pending docs and stop the background thread.
+        Raises the first batch error since the last flush()/close(), if any."""
+        with self._cond:
+            self._buf.closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        with self._cond:
+            self._buf.raise_failures()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    wait = self._buf.ready_in()
+                    if wait == 0.0:
+                        break
+                    if wait is None and self._buf.closed:
+                        return
+                    self._cond.wait(wait)
+                batch, seq = self._buf.take()
+                self._cond.notify_all()
+            error: Optional[Exception] = None
+            try:
+                self._send(batch)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = e
+            with self._cond:
+                self._buf.done(batch, seq, error)
+                self._cond.notify_all()
+
+    def __enter__(self) -> "BufferedWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Let the exception leaving the block propagate; batch errors stay in .failures.
+        with contextlib.suppress(Exception):
+            self.close()
+
+
+class AsyncBufferedWriter:
+    """Buffers upserts and sends them in batches from a background task (async).
+    Obtain with coll.docs.writer_async(...) and use with `async with` so pending docs are flushed on exit.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[Dict[str, Any]]], Awaitable[models.MessageResponse]],
+        *,
+        max_docs: int = 1000,
+        max_bytes: int = _UPSERT_MAX_PAYLOAD_BYTES,
+        flush_interval: float = 1.0,
+        json_codec: Optional[utils.JSONCodec] = None,
+    ) -> None:
+        self._send = send
+        self._buf = _WriteBuffer(max_docs, max_bytes, flush_interval, json_codec)
+        self._cond: Optional[asyncio.Condition] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def failures(self) -> List[BatchOutcome]:
+        """Batches that failed to upsert; each keeps its docs in .items."""
+        return list(self._buf.failures)
+
+    def _start(self) -> asyncio.Condition:
+        # Created lazily so the writer binds to the loop it is first used on.
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+            self._task = asyncio.ensure_future(self._run(self._cond))
+        return self._cond
+
+    async def write(self, doc: Dict[str, Any]) -> None:
+        """Buffer a doc for upsert. Waits while the buffer is full and the previous batch is still being sent."""
+        size = self._buf.size_of(doc)
+        self._buf.check_size(size)
+        key = self._buf.key_of(doc)
+        cond = self._start()
+        async with cond:
+            while True:
+                if self._buf.closed:
+                    raise ValueError("AsyncBufferedWriter is closed")
+                if self._buf.fits(key, size):
+                    break
+                self._buf.space_wanted = True
+                cond.notify_all()
+                await cond.wait()
+            if self._buf.put(key, doc, size):
+                cond.notify_all()
+
+    async def write_many(self, docs: Iterable[Dict[str, Any]]) -> None:
+        """Buffer several docs for upsert."""
+        for doc in docs:
+            await self.write(doc)
+
+    async def flush(self) -> None:
+        """Wait until every doc written before this call has been sent.
+        Raises the first batch error since the last flush()/aclose(), if any."""
+        cond = self._start()
+        async with cond:
+            target = self._buf.written_seq
+            self._buf.flush_waiters += 1
+            cond.notify_all()
+            try:
+                while self._buf.sent_seq < target:
+                    assert self._task is not None
+                    if self._task.done():
+                        break
+                    await cond.wait()
+            finally:
+                self._buf.flush_waiters -= 1
+            self._buf.raise_failures()
+
+    async def aclose(self) -> None:
+        """Flush pending docs and stop the background task.
+        Raises the first batch error since the last flush()/aclose(), if any."""
+        if self._cond is None:
+            self._buf.closed = True
+            return
+        async with self._cond:
+            self._buf.closed = True
+            self._cond.notify_all()
+        assert self._task is not None
+        await self._task
+        self._buf.raise_failures()
+
+    async def _run(self, cond: asyncio.Condition) -> None:
+        while True:
+            async with cond:
+                while True:
+                    wait = self._buf.ready_in()
+                    if wait == 0.0:
+                        break
+                    if wait is None and self._buf.closed:
+                        return
+                    try:
+                        await asyncio.wait_for(cond.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                batch, seq = self._buf.take()
+                cond.notify_all()
+            error: Optional[Exception] = None
+            try:
+                await self._send(batch)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = e
+            async with cond:
+                self._buf.done(batch, seq, error)
+                cond.notify_all()
+
+    async def __aenter__(self) -> "AsyncBufferedWriter":
+        self._start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            await self.aclose()
+            return
+        # Let the exception leaving the block propagate; batch errors stay in .failures.
+        with contextlib.suppress(Exception):
+            await self.aclose()
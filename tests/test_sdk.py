@@ -5,6 +5,7 @@ Run: poetry run pytest tests/ -v
 from __future__ import annotations
 
 import asyncio
+import time
 
 import pytest
 
@@ -40,6 +41,8 @@ def test_client_collection_docs_has_convenience_methods() -> None:
 
     assert hasattr(docs, "list_pages")
     assert hasattr(docs, "iter_all")
+    assert hasattr(docs, "list_pages_async")
+    assert hasattr(docs, "iter_all_async")
     assert hasattr(docs, "bulk_upsert_docs")
     assert hasattr(docs, "bulk_upsert_docs_async")
     assert callable(docs.list_pages)
@@ -260,3 +263,1630 @@ def test_list_docs_response_has_is_docs_inline_and_docs_url() -> None:
     )
     assert resp_with_url.is_docs_inline is False
     assert resp_with_url.docs_url == "https://example.com/docs.json"
+
+
+def test_serializer_codecs_are_cached_per_type() -> None:
+    """marshal_json/unmarshal_json reuse one compiled codec per target type."""
+    from lambdadb.models import QueryCollectionResponse, UpsertDocsRequestBody
+    from lambdadb.utils.serializers import get_codec, marshal_json, unmarshal_json
+
+    assert get_codec(UpsertDocsRequestBody) is get_codec(UpsertDocsRequestBody)
+
+    body = UpsertDocsRequestBody(docs=[{"id": "1", "v": [0.5, 1.0]}])
+    assert marshal_json(body, UpsertDocsRequestBody) == '{"docs":[{"id":"1","v":[0.5,1.0]}]}'
+
+    resp = unmarshal_json(
+        '{"took": 1, "total": 1, "docs": [{"collection": "c", "doc": {"id": "1"}}],'
+        ' "isDocsInline": true}',
+        QueryCollectionResponse,
+    )
+    assert isinstance(resp, QueryCollectionResponse)
+    assert resp.documents == [{"id": "1"}]
+
+
+def _mock_client(handler):
+    """LambdaDB client whose sync and async HTTP clients are served by handler (no network)."""
+    import httpx
+    from lambdadb import LambdaDB
+
+    return LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def _bulk_upload_handler(uploads: list, size_limit: int):
+    """Fake bulk upsert endpoints + presigned PUT target that records uploaded objects."""
+    import json as _json
+    import httpx
+
+    counter = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "s3.test":
+            uploads.append(_json.loads(request.read()))
+            return httpx.Response(200)
+        if request.url.path.endswith("/docs/bulk-upsert") and request.method == "GET":
+            counter["n"] += 1
+            return httpx.Response(
+                200,
+                json={
+                    "url": f"https://s3.test/obj{counter['n']}",
+                    "objectKey": f"obj{counter['n']}",
+                    "sizeLimitBytes": size_limit,
+                },
+            )
+        if request.url.path.endswith("/docs/bulk-upsert") and request.method == "POST":
+            key = _json.loads(request.read())["objectKey"]
+            return httpx.Response(202, json={"message": key})
+        return httpx.Response(404, json={"message": "not found"})
+
+    return handler
+
+
+def test_bulk_load_streams_generator_into_size_limited_objects() -> None:
+    """bulk_load cuts a new object at the size limit and uploads each one."""
+    uploads: list = []
+    client = _mock_client(_bulk_upload_handler(uploads, size_limit=200))
+    docs = ({"id": str(i), "text": "x" * 20} for i in range(20))
+
+    res = client.collection("c").docs.bulk_load(docs, max_in_flight=3)
+
+    assert len(res) == len(uploads) > 1
+    assert sorted(d["id"] for u in uploads for d in u["docs"]) == sorted(
+        str(i) for i in range(20)
+    )
+
+
+def test_bulk_load_async_accepts_async_iterables() -> None:
+    """bulk_load_async consumes async generators with the same chunking."""
+    uploads: list = []
+    client = _mock_client(_bulk_upload_handler(uploads, size_limit=200))
+
+    async def gen():
+        for i in range(20):
+            yield {"id": str(i), "text": "x" * 20}
+
+    async def run():
+        return await client.collection("c").docs.bulk_load_async(gen(), max_in_flight=2)
+
+    res = asyncio.run(run())
+
+    assert [r.message for r in res] == [f"obj{i + 1}" for i in range(len(uploads))]
+    assert sum(len(u["docs"]) for u in uploads) == 20
+
+
+def test_bulk_upsert_docs_streams_body_with_content_length() -> None:
+    """bulk_upsert_docs streams the encoded payload with an explicit Content-Length."""
+    import httpx
+
+    uploads: list = []
+    seen: dict = {}
+    inner = _bulk_upload_handler(uploads, size_limit=10_000)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "s3.test":
+            seen["content-length"] = request.headers.get("content-length")
+            seen["transfer-encoding"] = request.headers.get("transfer-encoding")
+        return inner(request)
+
+    client = _mock_client(handler)
+    docs = [{"id": str(i), "v": [0.25, 0.5]} for i in range(10)]
+
+    client.collection("c").docs.bulk_upsert_docs(docs=docs)
+
+    assert uploads == [{"docs": docs}]
+    assert seen["transfer-encoding"] is None
+    assert int(seen["content-length"]) > 0
+
+
+def test_bulk_upsert_docs_rejects_oversized_payload_before_upload() -> None:
+    """The size limit is enforced while encoding, before anything is uploaded."""
+    uploads: list = []
+    client = _mock_client(_bulk_upload_handler(uploads, size_limit=100))
+    docs = [{"id": str(i), "text": "x" * 50} for i in range(10)]
+
+    with pytest.raises(ValueError, match="exceeds limit 100 bytes"):
+        client.collection("c").docs.bulk_upsert_docs(docs=docs)
+    with pytest.raises(ValueError, match="exceeds limit 100 bytes"):
+        asyncio.run(client.collection("c").docs.bulk_upsert_docs_async(docs={"docs": docs}))
+    assert uploads == []
+
+
+def _upsert_handler(requests_seen: list, fail_on_id: str = ""):
+    """Fake upsert endpoint recording each request's docs; fails batches containing fail_on_id."""
+    import json as _json
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        docs = _json.loads(request.read())["docs"]
+        requests_seen.append(docs)
+        if any(d["id"] == fail_on_id for d in docs):
+            return httpx.Response(400, json={"message": "bad doc"})
+        return httpx.Response(202, json={"message": "ok"})
+
+    return handler
+
+
+def test_upsert_many_splits_by_count_and_bytes_and_reports_failures() -> None:
+    """upsert_many splits batches by doc count and bytes; failed batches keep their docs."""
+    from lambdadb import BatchResult
+
+    seen: list = []
+    client = _mock_client(_upsert_handler(seen, fail_on_id="7"))
+    docs = [{"id": str(i), "text": "y" * 30} for i in range(25)]
+
+    res = client.collection("c").docs.upsert_many(
+        iter(docs), max_docs_per_request=4, max_bytes_per_request=150, concurrency=3
+    )
+
+    assert isinstance(res, BatchResult)
+    assert all(len(batch) <= 4 for batch in seen)
+    assert sorted(d["id"] for batch in seen for d in batch) == sorted(d["id"] for d in docs)
+    assert [b.index for b in res.batches] == list(range(len(res.batches)))
+    assert len(res.failures) == 1
+    assert {"id": "7", "text": "y" * 30} in res.failures[0].items
+    assert res.num_succeeded + res.num_failed == 25
+
+
+def test_upsert_many_async_runs_batches_concurrently() -> None:
+    """upsert_many_async returns per-batch outcomes in send order."""
+    seen: list = []
+    client = _mock_client(_upsert_handler(seen))
+    docs = [{"id": str(i)} for i in range(10)]
+
+    res = asyncio.run(
+        client.collection("c").docs.upsert_many_async(docs, max_docs_per_request=3)
+    )
+
+    assert res.ok
+    assert [b.num_items for b in res.batches] == [3, 3, 3, 1]
+
+
+def test_map_bounded_async_waits_for_cancelled_tasks() -> None:
+    """When the input fails, in-flight tasks are cancelled and finish before the error is raised."""
+    from lambdadb.collection import _map_bounded_async
+
+    unwound: list = []
+
+    async def fn(item: int) -> int:
+        try:
+            await asyncio.sleep(10)
+        finally:
+            await asyncio.sleep(0)
+            unwound.append(item)
+        return item
+
+    async def items():
+        yield 1
+        yield 2
+        await asyncio.sleep(0.01)  # let both tasks start
+        raise KeyError("input")
+
+    async def run() -> set:
+        with pytest.raises(KeyError):
+            await _map_bounded_async(fn, items(), concurrency=4)
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(run()) == set()
+    assert sorted(unwound) == [1, 2]
+
+
+def test_buffered_writer_coalesces_by_id_and_flushes_on_close() -> None:
+    """writer() keeps the last write per id, sends full batches and flushes the rest on exit."""
+    seen: list = []
+    client = _mock_client(_upsert_handler(seen))
+
+    with client.collection("c").docs.writer(max_docs=3, flush_interval=60) as w:
+        for i in range(7):
+            w.write({"id": str(i), "v": 0})
+        w.write({"id": "6", "v": 1})
+
+    sent = [d for batch in seen for d in batch]
+    assert all(len(batch) <= 3 for batch in seen)
+    assert sorted(d["id"] for d in sent) == [str(i) for i in range(7)]
+    assert {"id": "6", "v": 1} in sent and {"id": "6", "v": 0} not in sent
+    with pytest.raises(ValueError, match="closed"):
+        w.write({"id": "x"})
+
+
+def test_buffered_writer_flush_surfaces_batch_errors() -> None:
+    """flush() sends pending docs and raises a failed batch's error; the docs stay in failures."""
+    from lambdadb import errors
+
+    seen: list = []
+    client = _mock_client(_upsert_handler(seen, fail_on_id="bad"))
+    w = client.collection("c").docs.writer(flush_interval=60)
+    w.write({"id": "bad"})
+
+    with pytest.raises(errors.LambdaDBError):
+        w.flush()
+    assert w.failures[0].items == [{"id": "bad"}]
+    w.write({"id": "good"})
+    w.close()
+    assert seen[-1] == [{"id": "good"}]
+
+
+def test_buffered_writer_exit_keeps_the_block_exception() -> None:
+    """An exception leaving a writer block is not replaced by a batch error raised on close."""
+    seen: list = []
+    client = _mock_client(_upsert_handler(seen, fail_on_id="bad"))
+
+    with pytest.raises(KeyError):
+        with client.collection("c").docs.writer(flush_interval=60) as w:
+            w.write({"id": "bad"})
+            raise KeyError("caller")
+    assert w.failures[0].items == [{"id": "bad"}]
+
+    async def run():
+        async with client.collection("c").docs.writer_async(flush_interval=60) as aw:
+            await aw.write({"id": "bad"})
+            raise KeyError("caller")
+
+    with pytest.raises(KeyError):
+        asyncio.run(run())
+
+
+def test_async_buffered_writer_flushes_on_interval_and_exit() -> None:
+    """writer_async() flushes from a background task after flush_interval and on exit."""
+    seen: list = []
+    client = _mock_client(_upsert_handler(seen))
+
+    async def run():
+        async with client.collection("c").docs.writer_async(flush_interval=0.01) as w:
+            await w.write({"id": "1"})
+            await asyncio.sleep(0.2)
+            assert seen == [[{"id": "1"}]]
+            await w.write_many([{"id": "2"}, {"id": "3"}])
+
+    asyncio.run(run())
+
+    assert [d["id"] for batch in seen for d in batch] == ["1", "2", "3"]
+
+
+def test_numpy_vectors_serialize_in_upsert_query_and_bulk_payloads() -> None:
+    """ndarray values are accepted directly wherever docs or query dicts are sent."""
+    np = pytest.importorskip("numpy")
+    import json as _json
+    import httpx
+
+    bodies: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/query"):
+            bodies.append(_json.loads(request.read()))
+            return httpx.Response(
+                200, json={"took": 1, "total": 0, "docs": [], "isDocsInline": True}
+            )
+        return inner(request)
+
+    uploads: list = []
+    inner = _bulk_upload_handler(uploads, size_limit=10_000)
+    client = _mock_client(handler)
+    vec = np.array([0.5, 0.25, -1.0], dtype=np.float32)
+    coll = client.collection("c")
+
+    coll.query(query={"knn": {"field": "v", "queryVector": vec, "k": np.int64(3)}})
+    coll.docs.bulk_upsert_docs(docs=[{"id": "1", "v": vec}])
+
+    assert bodies[0]["query"]["knn"] == {"field": "v", "queryVector": [0.5, 0.25, -1.0], "k": 3}
+    assert uploads == [{"docs": [{"id": "1", "v": [0.5, 0.25, -1.0]}]}]
+
+    seen: list = []
+    client = _mock_client(_upsert_handler(seen))
+    client.collection("c").docs.upsert(docs=[{"id": "2", "v": np.arange(3, dtype=np.float64)}])
+    assert seen == [[{"id": "2", "v": [0.0, 1.0, 2.0]}]]
+
+
+@pytest.mark.parametrize("backend", ["pydantic", "json", "orjson"])
+def test_json_codec_is_used_for_bodies_and_presigned_results(backend: str) -> None:
+    """Every configured backend round-trips request bodies, responses and docs_url payloads."""
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    import json as _json
+    import httpx
+    from lambdadb import LambdaDB
+
+    bodies: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "s3.test":
+            return httpx.Response(
+                200, json=[{"collection": "c", "score": 0.5, "doc": {"id": "1"}}]
+            )
+        bodies.append(_json.loads(request.read()))
+        return httpx.Response(
+            200,
+            json={
+                "took": 1,
+                "total": 1,
+                "docs": [],
+                "isDocsInline": False,
+                "docsUrl": "https://s3.test/r",
+            },
+        )
+
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        json_codec=backend,
+    )
+    assert client.sdk_configuration.json_codec.name == backend
+
+    res = client.collection("c").query(query={"queryString": {"query": "é"}}, size=1)
+
+    assert bodies[0]["query"] == {"queryString": {"query": "é"}}
+    assert bodies[0]["size"] == 1
+    assert res.documents == [{"id": "1"}]
+
+
+def test_unknown_json_codec_is_rejected() -> None:
+    from lambdadb import LambdaDB
+
+    with pytest.raises(ValueError, match="Unknown json_codec"):
+        LambdaDB(project_api_key="test-key", json_codec="yaml")
+
+
+def _fetch_handler(requests_seen: list, stored: set, inline: bool = True):
+    """Fake fetch endpoint returning the stored subset of the requested IDs (in reverse order)."""
+    import json as _json
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "s3.test":
+            return httpx.Response(200, content=request.url.params["docs"])
+        ids = _json.loads(request.read())["ids"]
+        requests_seen.append(ids)
+        docs = [{"collection": "c", "doc": {"id": i}} for i in reversed(ids) if i in stored]
+        if inline:
+            body = {"total": len(docs), "took": 1, "docs": docs, "isDocsInline": True}
+        else:
+            url = str(httpx.URL("https://s3.test/r", params={"docs": _json.dumps(docs)}))
+            body = {
+                "total": len(docs),
+                "took": 1,
+                "docs": [],
+                "isDocsInline": False,
+                "docsUrl": url,
+            }
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+def test_fetch_many_shards_dedupes_and_preserves_input_order() -> None:
+    """fetch_many sends unique IDs in 100-ID requests and returns docs in input order."""
+    from lambdadb import FetchManyResult
+
+    seen: list = []
+    ids = [str(i) for i in range(250)] + ["3", "1"]
+    stored = {str(i) for i in range(250) if i % 7}
+    client = _mock_client(_fetch_handler(seen, stored))
+
+    res = client.collection("c").docs.fetch_many(ids, concurrency=3)
+
+    assert isinstance(res, FetchManyResult)
+    assert sorted(len(s) for s in seen) == [50, 100, 100]
+    assert [d["id"] for d in res.documents] == [str(i) for i in range(250) if i % 7]
+    assert res.missing == [str(i) for i in range(250) if not i % 7]
+
+
+def test_fetch_many_matches_ids_when_fields_leave_id_out() -> None:
+    """fetch_many asks for "id" even when the fields selector omits it, and strips it again."""
+    import json as _json
+    import httpx
+
+    bodies: list = []
+    stored = {"a": {"id": "a", "text": "A", "n": 1}, "b": {"id": "b", "text": "B", "n": 2}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = _json.loads(request.read())
+        bodies.append(body)
+        fields = body.get("fields") or {}
+        docs = []
+        for doc_id in body["ids"]:
+            if doc_id in stored:
+                doc = stored[doc_id]
+                if "include" in fields:
+                    doc = {k: v for k, v in doc.items() if k in fields["include"]}
+                doc = {k: v for k, v in doc.items() if k not in fields.get("exclude", [])}
+                docs.append({"collection": "c", "doc": doc})
+        return httpx.Response(200, json={"took": 1, "total": len(docs), "docs": docs, "isDocsInline": True})
+
+    client = _mock_client(handler)
+    docs = client.collection("c").docs
+    res = docs.fetch_many(["b", "x", "a"], fields={"include": ["text"]})
+    assert bodies[-1]["fields"] == {"include": ["text", "id"]}
+    assert res.documents == [{"text": "B"}, {"text": "A"}] and res.missing == ["x"]
+
+    res = docs.fetch_many(["a"], fields={"exclude": ["id", "n"]})
+    assert bodies[-1]["fields"] == {"exclude": ["n"]}
+    assert res.documents == [{"text": "A"}]
+    res = docs.fetch_many(["a"], fields={"include": ["id", "text"]})
+    assert res.documents == [{"id": "a", "text": "A"}]
+
+
+def test_fetch_many_async_resolves_presigned_results_per_shard() -> None:
+    """fetch_many_async follows docs_url for each shard."""
+    seen: list = []
+    client = _mock_client(_fetch_handler(seen, {"a", "c"}, inline=False))
+
+    res = asyncio.run(client.collection("c").docs.fetch_many_async(["c", "b", "a"]))
+
+    assert [d["id"] for d in res.documents] == ["c", "a"]
+    assert res.missing == ["b"]
+
+
+def _delete_handler(requests_seen: list, fail_on_id: str = ""):
+    """Fake delete + get-collection endpoints; the collection is partitioned on "tenant"."""
+    import json as _json
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            collection = {
+                "projectName": "p",
+                "collectionName": "c",
+                "indexConfigs": {"tenant": {"type": "keyword"}},
+                "partitionConfig": {"fieldName": "tenant", "dataType": "keyword"},
+                "numPartitions": 4,
+                "numDocs": 0,
+                "collectionStatus": "ACTIVE",
+                "createdAt": 1000000,
+                "updatedAt": 2000000,
+                "dataUpdatedAt": 3000000,
+            }
+            return httpx.Response(200, json={"collection": collection})
+        body = _json.loads(request.read())
+        requests_seen.append(body)
+        if fail_on_id in body["ids"]:
+            return httpx.Response(400, json={"message": "bad id"})
+        return httpx.Response(202, json={"message": "ok"})
+
+    return handler
+
+
+def test_delete_many_batches_ids_and_keeps_failed_batches() -> None:
+    """delete_many streams IDs into batch_size requests and reports failed batches."""
+    seen: list = []
+    client = _mock_client(_delete_handler(seen, fail_on_id="42"))
+
+    res = client.collection("c").docs.delete_many(
+        (str(i) for i in range(95)), batch_size=20, concurrency=3
+    )
+
+    assert sorted(len(b["ids"]) for b in seen) == [15, 20, 20, 20, 20]
+    assert all("partitionFilter" not in b for b in seen)
+    assert res.num_succeeded == 75 and res.num_failed == 20
+    assert "42" in res.failures[0].items
+
+
+def test_delete_many_async_groups_by_partition_config_field() -> None:
+    """With group_by_partition each batch targets one partition value of partition_config's field."""
+    seen: list = []
+    client = _mock_client(_delete_handler(seen))
+    pairs = [(str(i), "t%d" % (i % 2)) for i in range(7)]
+
+    res = asyncio.run(
+        client.collection("c").docs.delete_many_async(
+            pairs, batch_size=3, group_by_partition=True
+        )
+    )
+
+    assert res.ok and res.num_succeeded == 7
+    by_tenant = sorted(
+        (b["partitionFilter"]["in"], sorted(b["ids"])) for b in seen
+    )
+    assert by_tenant == [
+        (["t0"], ["0", "2", "4"]),
+        (["t0"], ["6"]),
+        (["t1"], ["1", "3", "5"]),
+    ]
+    assert all(b["partitionFilter"]["field"] == "tenant" for b in seen)
+
+
+def _partitioned_query_handler(requests_seen: list):
+    """Fake query endpoint: each partition value holds docs whose scores/prices derive from it."""
+    import json as _json
+    import httpx
+
+    data = {
+        "a": [("a1", 0.9, 5), ("a2", 0.4, 1)],
+        "b": [("b1", 0.7, 3), ("b2", 0.6, None)],
+        "c": [("c1", 0.95, 2)],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = _json.loads(request.read())
+        requests_seen.append(body)
+        hits = [h for v in body["partitionFilter"]["in"] for h in data[v]]
+        if body.get("sort"):
+            hits.sort(key=lambda h: (h[2] is None, -(h[2] or 0)))
+        else:
+            hits.sort(key=lambda h: -h[1])
+        docs = [
+            {"collection": "c", "score": sc, "doc": {"id": i, "price": p}}
+            for i, sc, p in hits[: body.get("size", 10)]
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "took": len(body["partitionFilter"]["in"]),
+                "total": len(hits),
+                "docs": docs,
+                "isDocsInline": True,
+                "maxScore": max(h[1] for h in hits),
+            },
+        )
+
+    return handler
+
+
+def test_delete_batcher_bounds_ids_buffered_across_partitions() -> None:
+    """Many distinct partition values do not pile up: past max_buffered the oldest group is sent early."""
+    from lambdadb.collection import _DeleteBatcher
+
+    batcher = _DeleteBatcher(3, "tenant", max_buffered=4)
+    items = [("a1", "a"), ("b1", "b"), ("c1", "c"), ("a2", "a"), ("d1", "d"), ("a3", "a"), ("e1", "e")]
+    sent = [batch for batch in map(batcher.add, items) if batch is not None]
+    assert [(ids, pf.in_) for ids, pf in sent] == [
+        ([("a1", "a"), ("a2", "a")], ["a"]),  # 4 IDs buffered: the oldest group goes out partial
+        ([("b1", "b")], ["b"]),
+        ([("c1", "c")], ["c"]),
+    ]
+    assert [ids for ids, _ in batcher.flush()] == [[("d1", "d")], [("a3", "a")], [("e1", "e")]]
+
+
+def test_query_partitions_fans_out_and_merges_top_k_by_score() -> None:
+    """query_partitions queries each partition concurrently and merges by score."""
+    seen: list = []
+    client = _mock_client(_partitioned_query_handler(seen))
+
+    res = client.collection("c").query_partitions(
+        query={"queryString": {"query": "x"}},
+        partition_values=["a", "b", "c"],
+        partition_field="tenant",
+        size=3,
+    )
+
+    assert sorted(b["partitionFilter"]["in"] for b in seen) == [["a"], ["b"], ["c"]]
+    assert all(b["partitionFilter"]["field"] == "tenant" for b in seen)
+    assert [d["id"] for d in res.documents] == ["c1", "a1", "b1"]
+    assert res.total == 5 and res.max_score == 0.95
+
+    with pytest.raises(ValueError, match="partition_values"):
+        client.collection("c").query_partitions(query={"queryString": {"query": "x"}}, partition_values=[])
+    with pytest.raises(ValueError, match="partition_values"):
+        asyncio.run(
+            client.collection("c").query_partitions_async(
+                query={"queryString": {"query": "x"}}, partition_values=iter(())
+            )
+        )
+    assert len(seen) == 3
+
+
+def test_query_partitions_async_merges_on_sort_keys() -> None:
+    """With sort, hits are merged on the sort keys; missing values go last."""
+    seen: list = []
+    client = _mock_client(_partitioned_query_handler(seen))
+
+    res = asyncio.run(
+        client.collection("c").query_partitions_async(
+            query={"queryString": {"query": "x"}},
+            partition_values=["a", "b", "c"],
+            partition_field="tenant",
+            partitions_per_request=2,
+            sort=[{"price": "desc"}],
+            size=10,
+        )
+    )
+
+    assert len(seen) == 2
+    assert [d["id"] for d in res.documents] == ["a1", "b1", "c1", "a2", "b2"]
+
+
+def _list_docs_handler(
+    requests_seen: list,
+    num_docs: int,
+    max_per_response: int,
+    fail_at: int = -1,
+    presigned: bool = False,
+):
+    """Fake list_docs endpoint paging through num_docs docs with numeric page tokens.
+    With presigned, every other response carries its docs behind a docsUrl."""
+    import json as _json
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "s3.test":
+            return httpx.Response(200, content=request.url.params["docs"])
+        start = int(request.url.params.get("pageToken", "0"))
+        requests_seen.append(start)
+        if start == fail_at:
+            return httpx.Response(400, json={"message": "bad page"})
+        end = min(num_docs, start + min(int(request.url.params["size"]), max_per_response))
+        docs = [{"collection": "c", "doc": {"id": str(i)}} for i in range(start, end)]
+        body = {"total": num_docs, "docs": docs, "isDocsInline": True}
+        if presigned and len(requests_seen) % 2 == 0:
+            url = httpx.URL("https://s3.test/l", params={"docs": _json.dumps(docs)})
+            body.update(docs=[], isDocsInline=False, docsUrl=str(url))
+        if end < num_docs:
+            body["nextPageToken"] = str(end)
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+def test_list_pages_prefetch_reads_ahead_in_token_order() -> None:
+    """With prefetch, responses are fetched ahead of the consumer and re-chunked into full pages."""
+    import time
+
+    seen: list = []
+    client = _mock_client(_list_docs_handler(seen, num_docs=25, max_per_response=7))
+    pages = client.collection("c").docs.list_pages(size=10, prefetch=2)
+
+    first = next(pages)
+    deadline = time.monotonic() + 2
+    while len(seen) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(seen) >= 3  # read ahead while the consumer holds the first page
+    rest = list(pages)
+
+    assert seen == [0, 7, 14, 21]
+    assert [len(p) for p in [first] + rest] == [10, 10, 5]
+    assert [d["id"] for p in [first] + rest for d in p] == [str(i) for i in range(25)]
+
+
+def test_iter_all_prefetch_surfaces_errors_in_order() -> None:
+    """A failed read-ahead request is raised after the docs fetched before it."""
+    from lambdadb import errors
+
+    seen: list = []
+    client = _mock_client(_list_docs_handler(seen, num_docs=30, max_per_response=10, fail_at=20))
+
+    got = []
+    with pytest.raises(errors.BadRequestError):
+        for doc in client.collection("c").docs.iter_all(page_size=10, prefetch=3):
+            got.append(doc["id"])
+    assert got == [str(i) for i in range(20)]
+    assert seen == [0, 10, 20]
+
+
+def test_prefetch_keeps_caller_context_and_cleans_up_abandoned_async_scans() -> None:
+    """Read-ahead runs in the caller's context; closing an async scan early leaves no task behind."""
+    import contextvars
+
+    import httpx
+
+    trace_id: contextvars.ContextVar = contextvars.ContextVar("trace_id", default=None)
+    seen: list = []
+    traced: list = []
+    inner = _list_docs_handler(seen, num_docs=30, max_per_response=10)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        traced.append(trace_id.get())
+        return inner(request)
+
+    client = _mock_client(handler)
+    trace_id.set("t-1")
+    assert len(list(client.collection("c").docs.iter_all(page_size=10, prefetch=2))) == 30
+    assert traced == ["t-1"] * 3
+
+    async def run() -> set:
+        pages = client.collection("c").docs.list_pages_async(size=10, prefetch=2)
+        await pages.__anext__()
+        await pages.aclose()
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(run()) == set()
+
+
+def test_list_pages_async_aggregates_presigned_pages_with_read_ahead() -> None:
+    """list_pages_async/iter_all_async resolve docs_url and re-chunk into full pages."""
+    seen: list = []
+    client = _mock_client(
+        _list_docs_handler(seen, num_docs=23, max_per_response=6, presigned=True)
+    )
+    docs = client.collection("c").docs
+
+    async def collect():
+        pages = [p async for p in docs.list_pages_async(size=8, prefetch=2)]
+        ids = [d["id"] async for d in docs.iter_all_async(page_size=8)]
+        return pages, ids
+
+    pages, ids = asyncio.run(collect())
+
+    assert [len(p) for p in pages] == [8, 8, 7]
+    assert [d["id"] for p in pages for d in p] == [str(i) for i in range(23)]
+    assert ids == [str(i) for i in range(23)]
+
+
+def _presigned_stream_handler(items: list, chunk_size: int, sent: list, truncate: bool = False):
+    """Fake query/fetch endpoints whose results are behind a docs_url served in small chunks."""
+    import json as _json
+    import httpx
+
+    body = _json.dumps(items).encode()
+    if truncate:
+        body = body[:-5]
+
+    class ChunkedBody(httpx.SyncByteStream, httpx.AsyncByteStream):
+        def __iter__(self):
+            for i in range(0, len(body), chunk_size):
+                sent.append(i)
+                yield body[i : i + chunk_size]
+
+        async def __aiter__(self):
+            for chunk in self:
+                yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "s3.test":
+            return httpx.Response(200, stream=ChunkedBody())
+        return httpx.Response(
+            200,
+            json={
+                "took": 1,
+                "total": len(items),
+                "docs": [],
+                "isDocsInline": False,
+                "docsUrl": "https://s3.test/results",
+            },
+        )
+
+    return handler
+
+
+def test_query_stream_yields_items_before_docs_url_download_finishes() -> None:
+    """query_stream parses the presigned body incrementally."""
+    from lambdadb import models
+
+    items = [
+        {"collection": "c", "score": 1.0 - i / 100, "doc": {"id": str(i), "text": "x" * 50}}
+        for i in range(40)
+    ]
+    sent: list = []
+    client = _mock_client(_presigned_stream_handler(items, chunk_size=64, sent=sent))
+
+    stream = client.collection("c").query_stream(query={"queryString": {"query": "x"}})
+    first = next(stream)
+    chunks_before_first = len(sent)
+    rest = list(stream)
+
+    assert isinstance(first, models.QueryCollectionDoc)
+    assert chunks_before_first < len(sent)
+    assert [r.doc["id"] for r in [first] + rest] == [str(i) for i in range(40)]
+    assert rest[-1].score == pytest.approx(0.61)
+
+
+def test_fetch_stream_async_streams_and_rejects_truncated_body() -> None:
+    """fetch_stream_async yields presigned items; a truncated body raises RuntimeError."""
+    items = [{"collection": "c", "doc": {"id": str(i)}} for i in range(10)]
+
+    async def collect(truncate: bool):
+        client = _mock_client(
+            _presigned_stream_handler(items, chunk_size=16, sent=[], truncate=truncate)
+        )
+        docs = client.collection("c").docs
+        return [r.doc["id"] async for r in docs.fetch_stream_async(ids=["x"])]
+
+    assert asyncio.run(collect(False)) == [str(i) for i in range(10)]
+    with pytest.raises(RuntimeError, match="Truncated"):
+        asyncio.run(collect(True))
+
+
+def test_lazy_query_defers_docs_url_download_until_results_are_read() -> None:
+    """With lazy=True, total/took need no download; results download once on first access."""
+    from lambdadb import LazyResults
+
+    items = [{"collection": "c", "score": 0.5, "doc": {"id": str(i)}} for i in range(5)]
+    sent: list = []
+    client = _mock_client(_presigned_stream_handler(items, chunk_size=1 << 16, sent=sent))
+
+    res = client.collection("c").query(query={"queryString": {"query": "x"}}, lazy=True)
+    assert res.total == 5 and sent == []
+    assert isinstance(res.results, LazyResults) and not res.results.loaded
+    with pytest.raises(Exception, match="load"):
+        res.model_dump()  # an unloaded proxy must not serialize as "docs": []
+    assert sent == []
+
+    assert len(res.results) == 5
+    assert [d["id"] for d in res.documents] == [str(i) for i in range(5)]
+    assert res.model_dump(by_alias=True)["docs"][0]["doc"] == {"id": "0"}
+    assert len(sent) == 1
+
+
+def test_lazy_results_list_methods_load_first() -> None:
+    """list methods implemented in C (count, copy, +, *, comparisons) load before reading."""
+    items = [{"collection": "c", "score": 0.5, "doc": {"id": str(i)}} for i in range(3)]
+    client = _mock_client(_presigned_stream_handler(items, chunk_size=1 << 16, sent=[]))
+    query = client.collection("c").query
+
+    def fresh():
+        return query(query={"queryString": {"query": "x"}}, lazy=True).results
+
+    first = fresh()[0]
+    assert fresh().count(first) == 1
+    assert len(fresh().copy()) == 3
+    assert fresh().index(first) == 0
+    assert len(fresh() + []) == 3 and len([] + fresh()) == 3
+    assert len(fresh() * 2) == 6 and len(2 * fresh()) == 6
+    assert fresh() != [] and not fresh() < []
+
+
+def test_lazy_fetch_async_loads_with_load_async() -> None:
+    """Async callers load lazy results with await results.load_async()."""
+    items = [{"collection": "c", "doc": {"id": str(i)}} for i in range(3)]
+    sent: list = []
+    client = _mock_client(_presigned_stream_handler(items, chunk_size=1 << 16, sent=sent))
+
+    async def run():
+        res = await client.collection("c").docs.fetch_async(ids=["0", "1", "2"], lazy=True)
+        assert sent == []
+        with pytest.raises(Exception, match="load"):
+            res.model_dump_json()
+        await res.results.load_async()
+        return res
+
+    res = asyncio.run(run())
+    assert [r.doc["id"] for r in res.results] == ["0", "1", "2"]
+    assert len(sent) == 1
+
+
+def test_raw_response_mode_per_call_returns_plain_dicts() -> None:
+    """response_mode="raw" returns the JSON body with presigned docs resolved, without models."""
+    items = [{"collection": "c", "score": 0.5, "doc": {"id": str(i)}} for i in range(3)]
+    client = _mock_client(_presigned_stream_handler(items, chunk_size=1 << 16, sent=[]))
+    coll = client.collection("c")
+
+    raw = coll.query(query={"queryString": {"query": "x"}}, response_mode="raw")
+    assert type(raw) is dict
+    assert raw["docs"] == items and raw["total"] == 3
+
+    lazy_raw = coll.query(query={"queryString": {"query": "x"}}, response_mode="raw", lazy=True)
+    assert lazy_raw["docs"] == [] and lazy_raw["docsUrl"] == "https://s3.test/results"
+
+    model = coll.query(query={"queryString": {"query": "x"}})
+    assert model.documents == [{"id": "0"}, {"id": "1"}, {"id": "2"}]
+    with pytest.raises(ValueError, match="response_mode"):
+        coll.query(query={"queryString": {"query": "x"}}, response_mode="bytes")  # type: ignore[call-overload]
+
+
+def test_raw_response_mode_client_default_keeps_helpers_on_models() -> None:
+    """A client-wide raw default applies to fetch; fetch_many still works on models."""
+    import httpx
+    from lambdadb import LambdaDB
+
+    seen: list = []
+    handler = _fetch_handler(seen, stored={"a", "b"})
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        response_mode="raw",
+    )
+    docs = client.collection("c").docs
+
+    raw = docs.fetch(ids=["a", "b"])
+    assert [d["doc"]["id"] for d in raw["docs"]] == ["b", "a"]
+    assert docs.fetch(ids=["a"], response_mode="model").documents == [{"id": "a"}]
+    assert [d["id"] for d in docs.fetch_many(["a", "x", "b"]).documents] == ["a", "b"]
+    with pytest.raises(ValueError, match="response_mode"):
+        LambdaDB(project_api_key="test-key", response_mode="dicts")
+
+
+def _counting_query_handler(requests_seen: list):
+    """Fake query endpoint echoing a hit per request, plus a write endpoint for upserts."""
+    import json as _json
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/docs/upsert"):
+            return httpx.Response(202, json={"message": "ok"})
+        body = _json.loads(request.read())
+        requests_seen.append((request.url.path, body))
+        return httpx.Response(
+            200,
+            json={
+                "took": 1,
+                "total": 1,
+                "docs": [{"collection": "c", "score": 1.0, "doc": {"id": str(len(requests_seen))}}],
+                "isDocsInline": True,
+            },
+        )
+
+    return handler
+
+
+def test_query_cache_hits_canonical_bodies_and_invalidates_on_writes() -> None:
+    """Equal bodies hit; consistent_read bypasses; writes to the collection invalidate it."""
+    import httpx
+    from lambdadb import LambdaDB, QueryCache, models
+
+    seen: list = []
+    handler = _counting_query_handler(seen)
+    cache = QueryCache(max_entries=10, ttl=60)
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        query_cache=cache,
+    )
+    coll, other = client.collection("c"), client.collection("other")
+    q = {"queryString": {"query": "x", "defaultField": "title"}}
+    q_reordered = {"queryString": {"defaultField": "title", "query": "x"}}
+
+    first = coll.query(query=q, size=5, fields={"include": ["id"]})
+    again = coll.query(query=q_reordered, size=5, fields=models.FieldsSelector1(include=["id"]))
+    assert again is first and len(seen) == 1
+
+    coll.query(query=q, size=5, fields={"include": ["id"]}, consistent_read=True)
+    assert len(seen) == 2
+
+    other.docs.upsert(docs=[{"id": "1"}])
+    assert coll.query(query=q, size=5, fields={"include": ["id"]}) is first
+    coll.docs.upsert(docs=[{"id": "1"}])
+    assert coll.query(query=q, size=5, fields={"include": ["id"]}) is not first
+    assert len(seen) == 3
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.invalidations, stats.size) == (2, 2, 1, 1)
+
+
+def test_query_cache_evicts_lru_and_expires_entries() -> None:
+    """Entries beyond max_entries are evicted least recently used first; old ones expire."""
+    import httpx
+    from lambdadb import LambdaDB, QueryCache
+
+    seen: list = []
+    cache = QueryCache(max_entries=2, ttl=0.2)
+    client = LambdaDB(
+        project_api_key="test-key",
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(_counting_query_handler(seen))),
+        query_cache=cache,
+    )
+    coll = client.collection("c")
+
+    async def query(text: str):
+        return await coll.query_async(query={"queryString": {"query": text}})
+
+    async def run():
+        await query("a")
+        await query("b")
+        await query("a")  # hit; "b" becomes least recently used
+        await query("c")  # evicts "b"
+        await query("a")  # hit
+        await query("b")  # miss
+        time.sleep(0.25)
+        await query("b")  # expired
+
+    asyncio.run(run())
+    stats = cache.stats()
+    assert len(seen) == 5
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations) == (2, 5, 2, 1)
+
+
+def _fetch_by_id_handler(requested: list):
+    """Fake fetch endpoint returning one doc per requested ID (except "missing"); accepts upserts."""
+    import json as _json
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/docs/upsert"):
+            return httpx.Response(202, json={"message": "ok"})
+        ids = _json.loads(request.read())["ids"]
+        requested.append(ids)
+        docs = [
+            {"collection": "c", "doc": {"id": i, "vector": [0.5] * 8}}
+            for i in ids
+            if i != "missing"
+        ]
+        return httpx.Response(
+            200, json={"total": len(docs), "took": 2, "docs": docs, "isDocsInline": True}
+        )
+
+    return handler
+
+
+def test_doc_cache_fetches_only_misses_and_invalidates_on_writes() -> None:
+    """Cached IDs are served locally, only misses hit the server, results keep the requested order."""
+    import httpx
+    from lambdadb import DocCache, LambdaDB
+
+    requested: list = []
+    cache = DocCache(max_bytes=1 << 20, ttl=60)
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(_fetch_by_id_handler(requested))),
+        doc_cache=cache,
+    )
+    docs = client.collection("c").docs
+
+    docs.fetch(ids=["a", "b"])
+    res = docs.fetch(ids=["c", "a", "missing", "b"])
+    assert requested == [["a", "b"], ["c", "missing"]]
+    assert [d["id"] for d in res.documents] == ["c", "a", "b"] and res.total == 3
+
+    assert docs.fetch(ids=["b", "a"]).documents == [{"id": "b", "vector": [0.5] * 8}, {"id": "a", "vector": [0.5] * 8}]
+    assert len(requested) == 2
+
+    # Other request shapes are cached separately or bypass the cache.
+    raw = docs.fetch(ids=["a"], response_mode="raw")
+    docs.fetch(ids=["a"], fields={"include": ["id"]})
+    docs.fetch(ids=["a"], consistent_read=True)
+    assert raw["docs"][0]["doc"]["id"] == "a" and len(requested) == 5
+
+    docs.upsert(docs=[{"id": "a"}])
+    docs.fetch(ids=["a", "b"])
+    assert requested[-1] == ["a", "b"]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.invalidations, stats.size) == (4, 5, 2)
+    assert stats.bytes > 0
+
+    # A repeated ID comes back once, as it does without the cache.
+    assert [d["id"] for d in docs.fetch(ids=["a", "d", "a"]).documents] == ["a", "d"]
+
+
+def test_doc_cache_respects_byte_budget() -> None:
+    """Least recently used documents are evicted to stay within max_bytes."""
+    import httpx
+    from lambdadb import DocCache, LambdaDB
+
+    requested: list = []
+    doc_bytes = len(b'{"id":"a","vector":[0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5]}')
+    cache = DocCache(max_bytes=2 * doc_bytes, ttl=60)
+    client = LambdaDB(
+        project_api_key="test-key",
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(_fetch_by_id_handler(requested))),
+        doc_cache=cache,
+    )
+    docs = client.collection("c").docs
+
+    async def run():
+        await docs.fetch_async(ids=["a", "b"])
+        await docs.fetch_async(ids=["a"])  # "b" becomes least recently used
+        await docs.fetch_async(ids=["c"])  # evicts "b"
+        await docs.fetch_async(ids=["a", "b"])
+
+    asyncio.run(run())
+    assert requested == [["a", "b"], ["c"], ["b"]]
+    stats = cache.stats()
+    assert stats.bytes <= 2 * doc_bytes and stats.evictions == 2
+
+
+def test_coalesce_reads_shares_identical_in_flight_requests() -> None:
+    """Concurrent identical queries send one request; different bodies and writes are not coalesced."""
+    import threading
+    import httpx
+    from lambdadb import LambdaDB
+
+    sent: list = []
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        if request.url.path.endswith("/query"):
+            release.wait(5)
+            return httpx.Response(
+                200, json={"took": 1, "total": 0, "docs": [], "isDocsInline": True}
+            )
+        return httpx.Response(202, json={"message": "ok"})
+
+    async def handler_async(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"took": 1, "total": 0, "docs": [], "isDocsInline": True})
+
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler_async)),
+        coalesce_reads=True,
+    )
+    coll = client.collection("c")
+    q = {"queryString": {"query": "x"}}
+
+    results: list = []
+    threads = [threading.Thread(target=lambda: results.append(coll.query(query=q))) for _ in range(5)]
+    for th in threads:
+        th.start()
+    deadline = time.monotonic() + 5
+    while client.sdk_configuration.singleflight.coalesced < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for th in threads:
+        th.join()
+    assert len(results) == 5 and sent.count(sent[0]) == 1
+
+    coll.docs.upsert(docs=[{"id": "1"}])
+    coll.docs.upsert(docs=[{"id": "1"}])
+    assert len(sent) == 3
+
+    async def run():
+        await asyncio.gather(
+            *(coll.query_async(query=q) for _ in range(4)),
+            coll.query_async(query={"queryString": {"query": "y"}}),
+        )
+
+    asyncio.run(run())
+    assert len(sent) == 5
+    assert client.sdk_configuration.singleflight.coalesced == 7
+
+
+def test_query_many_keeps_input_order_and_captures_errors() -> None:
+    """Outcomes follow input order; a failing query does not abort the others."""
+    import json as _json
+    import httpx
+    from lambdadb import LambdaDB, errors, models
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = _json.loads(request.read())
+        text = body["query"]["queryString"]["query"]
+        if text == "bad":
+            return httpx.Response(400, json={"message": "bad query"})
+        time.sleep(0.01 * (3 - int(text)))  # later queries finish first
+        return httpx.Response(
+            200,
+            json={
+                "took": 1,
+                "total": 1,
+                "docs": [{"collection": "c", "score": 1.0, "doc": {"id": text, "size": body.get("size")}}],
+                "isDocsInline": True,
+            },
+        )
+
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    coll = client.collection("c")
+    queries = [
+        {"query": {"queryString": {"query": "0"}}, "size": 5},
+        models.QueryCollectionRequestBody(query={"queryString": {"query": "1"}}),
+        {"query": {"queryString": {"query": "bad"}}},
+        {"query": {"queryString": {"query": "2"}}, "consistentRead": True},
+        {"size": 1},  # missing query
+    ]
+
+    res = coll.query_many(queries, concurrency=3)
+    assert [o.index for o in res.outcomes] == [0, 1, 2, 3, 4]
+    assert [r.documents[0]["id"] if r else None for r in res.responses] == ["0", "1", None, "2", None]
+    assert res.responses[0].documents[0]["size"] == 5
+    assert not res.ok and [o.index for o in res.failures] == [2, 4]
+    assert isinstance(res.outcomes[2].error, errors.BadRequestError)
+
+    res_async = asyncio.run(coll.query_many_async(queries, concurrency=2))
+    assert [o.ok for o in res_async.outcomes] == [o.ok for o in res.outcomes]
+    assert res_async.responses[3].documents[0]["id"] == "2"
+
+
+def test_connection_pool_and_timeout_options_apply_to_default_clients() -> None:
+    """Pool limits and per-phase timeouts configure both default clients; timeout_ms still overrides them.
+    A user-supplied client's own timeouts are not applied."""
+    import warnings
+    import httpx
+    from lambdadb import LambdaDB
+
+    client = LambdaDB(
+        project_api_key="test-key",
+        max_connections=8,
+        max_keepalive_connections=4,
+        keepalive_expiry=12.0,
+        connect_timeout=1.5,
+        read_timeout=20.0,
+        pool_timeout=2.0,
+    )
+    for http_client in (client.sdk_configuration.client, client.sdk_configuration.async_client):
+        pool = http_client._transport._pool  # pylint: disable=protected-access
+        assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (8, 4, 12.0)
+        assert http_client.timeout == httpx.Timeout(connect=1.5, read=20.0, write=None, pool=2.0)
+    client.close()
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            import h2  # noqa: F401  # pylint: disable=unused-import,import-outside-toplevel
+        except ImportError:
+            LambdaDB(project_api_key="test-key", http2=True).close()
+            assert any("h2" in str(w.message) for w in caught)
+
+    timeouts: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"collections": []})
+
+    supplied = httpx.Client(transport=httpx.MockTransport(handler), timeout=httpx.Timeout(7.0, connect=1.0))
+    client = LambdaDB(project_api_key="test-key", client=supplied)
+    client.collections.list()
+    client.collections.list(timeout_ms=2500)
+    # A user-supplied client keeps the SDK's historical behaviour: no timeout without timeout_ms.
+    assert timeouts[0] == {"connect": None, "read": None, "write": None, "pool": None}
+    assert timeouts[1] == {"connect": 2.5, "read": 2.5, "write": 2.5, "pool": 2.5}
+
+
+def test_presigned_transfers_use_the_transfer_client() -> None:
+    """docs_url downloads and bulk upload PUTs go through the transfer client, API calls do not."""
+    import json as _json
+    import httpx
+    from lambdadb import LambdaDB
+
+    api_hosts: list = []
+    transfer_calls: list = []
+    hits = [{"collection": "c", "score": 1.0, "doc": {"id": "1"}}]
+
+    def api(request: httpx.Request) -> httpx.Response:
+        api_hosts.append(request.url.host)
+        path = request.url.path
+        if path.endswith("/query"):
+            return httpx.Response(
+                200,
+                json={"took": 1, "total": 1, "docs": [], "isDocsInline": False, "docsUrl": "https://s3.test/r"},
+            )
+        if path.endswith("/bulk-upsert") and request.method == "GET":
+            return httpx.Response(
+                200, json={"url": "https://s3.test/upload", "type": "application/json", "httpMethod": "PUT", "objectKey": "k", "sizeLimitBytes": 1000}
+            )
+        return httpx.Response(202, json={"message": "ok"})
+
+    def transfer(request: httpx.Request) -> httpx.Response:
+        transfer_calls.append((request.method, request.url.host))
+        if request.method == "PUT":
+            return httpx.Response(200)
+        return httpx.Response(200, content=_json.dumps(hits).encode())
+
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(api)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(api)),
+        transfer_client=httpx.Client(transport=httpx.MockTransport(transfer)),
+        transfer_async_client=httpx.AsyncClient(transport=httpx.MockTransport(transfer)),
+    )
+    coll = client.collection("c")
+    assert coll.query(query={"queryString": {"query": "x"}}).documents == [{"id": "1"}]
+    assert asyncio.run(coll.query_async(query={"queryString": {"query": "x"}})).documents == [{"id": "1"}]
+    coll.docs.bulk_upsert_docs(docs=[{"id": "1"}])
+    assert "s3.test" not in api_hosts
+    assert transfer_calls == [("GET", "s3.test"), ("GET", "s3.test"), ("PUT", "s3.test")]
+
+    default = LambdaDB(project_api_key="test-key", max_connections=50, transfer_max_connections=4)
+    config = default.sdk_configuration
+    assert config.get_transfer_client() is not config.client
+    assert config.get_transfer_async_client() is not config.async_client
+    assert config.transfer_client._transport._pool._max_connections == 4  # pylint: disable=protected-access
+    assert config.client._transport._pool._max_connections == 50  # pylint: disable=protected-access
+    transfer_client = config.transfer_client
+    default.close()
+    assert transfer_client.is_closed and config.get_transfer_client() is None
+
+
+def test_rate_limiter_backs_off_on_429_and_recovers() -> None:
+    """A 429 halves the shared rate and Retry-After pauses every request; successes raise the rate again."""
+    import httpx
+    from lambdadb import LambdaDB
+    from lambdadb.utils import RateLimiter
+
+    statuses = [429]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if statuses and request.url.path.endswith("/collections"):
+            statuses.pop()
+            return httpx.Response(429, json={"message": "slow down"}, headers={"retry-after": "0.2"})
+        return httpx.Response(200, json={"collections": []})
+
+    async def handler_async(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    limiter = RateLimiter(rate=40, additive_increase=40, per_operation=True)
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler_async)),
+        rate_limiter=limiter,
+    )
+
+    start = time.monotonic()
+    client.collections.list()  # the 429 is retried after Retry-After
+    assert time.monotonic() - start >= 0.15
+    stats = limiter.stats("listCollections")
+    assert (stats.throttles, stats.decreases) == (1, 1)
+    assert stats.rate == 20 + 40 / 20  # halved, then one additive step for the successful retry
+    assert limiter.stats("getCollection").rate == 40  # separate bucket per operation
+
+    async def run():
+        await asyncio.gather(*(client.collections.list_async() for _ in range(10)))
+
+    asyncio.run(run())
+    stats = limiter.stats("listCollections")
+    assert 22 < stats.rate <= 40 and stats.waits >= 1
+
+
+def test_circuit_breaker_opens_fails_fast_and_recovers(monkeypatch) -> None:
+    """Consecutive 5XX open the operation's circuit; calls then fail fast until a trial succeeds."""
+    import httpx
+    from lambdadb import LambdaDB, errors
+    from lambdadb.utils import BackoffStrategy, CircuitBreaker, CircuitState, RetryConfig
+    from lambdadb.utils import retries as retries_module
+
+    monkeypatch.setattr(retries_module.random, "uniform", lambda a, b: 0.0)
+    healthy = []
+    sent: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        if healthy:
+            return httpx.Response(200, json={"collections": []})
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    transitions: list = []
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        recovery_timeout=0.2,
+        on_state_change=lambda key, old, new: transitions.append((key[0], old, new)),
+    )
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_config=RetryConfig("backoff", BackoffStrategy(1, 2, 1.1, 10000), False),
+        circuit_breaker=breaker,
+    )
+
+    with pytest.raises(errors.CircuitOpenError) as exc_info:
+        client.collections.list()  # second failed attempt opens the circuit, the retry fails fast
+    assert len(sent) == 2 and exc_info.value.operation_id == "listCollections"
+    with pytest.raises(errors.CircuitOpenError):
+        client.collections.list()
+    assert len(sent) == 2
+
+    time.sleep(0.25)
+    healthy.append(True)
+    client.collections.list()  # half-open trial succeeds
+    assert [(old, new) for _, old, new in transitions] == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+    stats = breaker.stats()[("listCollections", "api.lambdadb.ai")]
+    assert stats.state is CircuitState.CLOSED and stats.rejected == 2
+
+
+def test_retry_budget_caps_retries_across_calls(monkeypatch) -> None:
+    """Once the client-wide budget is spent, failures are returned without further retries."""
+    import httpx
+    from lambdadb import LambdaDB, errors
+    from lambdadb.utils import BackoffStrategy, RetryBudget, RetryConfig
+    from lambdadb.utils import retries as retries_module
+
+    monkeypatch.setattr(retries_module.random, "uniform", lambda a, b: 0.0)
+    sent: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        return httpx.Response(500, json={"message": "boom"})
+
+    budget = RetryBudget(ratio=0.0, min_retries_per_second=0.2, window=10.0)  # 2 retries per 10s
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_config=RetryConfig("backoff", BackoffStrategy(1, 2, 1.1, 10000), False),
+        retry_budget=budget,
+    )
+    for _ in range(2):
+        with pytest.raises(errors.InternalServerError):
+            client.collections.list()
+    assert len(sent) == 4  # 1 + 2 retries, then 1 without retries
+    stats = budget.stats()
+    assert (stats.requests, stats.retries, stats.rejected) == (2, 2, 2)
+    assert LambdaDB(project_api_key="test-key", retry_budget=None).sdk_configuration.retry_budget is None
+
+
+def test_hedge_policy_sends_second_copy_of_slow_reads() -> None:
+    """A read still unanswered after the delay is sent again; the first success wins and max_ratio caps hedges."""
+    import threading
+
+    import httpx
+    from lambdadb import LambdaDB
+    from lambdadb.utils import HedgePolicy
+
+    lock = threading.Lock()
+    sent: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            sent.append(request.method)
+            slow = len(sent) % 2 == 1  # every primary is slow, every hedge fast
+        if request.method == "GET" and slow:
+            time.sleep(0.4)
+        return httpx.Response(200, json={"collections": []})
+
+    policy = HedgePolicy(delay=0.05, max_ratio=0.0)  # one saved-up hedge, no refills
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        hedge_policy=policy,
+    )
+    start = time.monotonic()
+    client.collections.list()
+    assert time.monotonic() - start < 0.3
+    stats = policy.stats()
+    assert (stats.requests, stats.hedged, stats.hedge_wins) == (1, 1, 1)
+
+    start = time.monotonic()
+    client.collections.list()  # budget spent: waits for the slow primary
+    assert time.monotonic() - start >= 0.35
+    assert policy.stats().rejected == 1
+    policy.close()
+
+
+def test_hedge_policy_async_cancels_losing_request() -> None:
+    """In async code the slower copy is cancelled once the other one succeeds."""
+    import httpx
+    from lambdadb import LambdaDB
+    from lambdadb.utils import HedgePolicy
+
+    calls: list = []
+    cancelled: list = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        return httpx.Response(200, json={"collections": []})
+
+    policy = HedgePolicy(delay=0.05)
+
+    async def run() -> None:
+        async with LambdaDB(
+            project_api_key="test-key",
+            async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            hedge_policy=policy,
+        ) as client:
+            await client.collections.list_async()
+            await asyncio.sleep(0)
+
+    start = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - start < 0.5
+    assert len(calls) == 2 and cancelled == [True]
+    assert policy.stats().hedge_wins == 1
+    assert HedgePolicy().current_delay("queryCollection") is None  # adaptive: no samples yet
+
+
+def test_total_timeout_bounds_retries_and_presigned_fetch() -> None:
+    """total_timeout_ms shrinks every attempt's timeouts, stops backoff that would outlast it
+    and fails requests that would start after it."""
+    import httpx
+    from lambdadb import LambdaDB, RequestOptions, errors
+    from lambdadb.utils import deadline
+
+    timeouts: list = []
+    statuses = [503, 200]
+    retry_after = ["0.05"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append((request.url.host, request.extensions["timeout"]["read"]))
+        if request.url.host == "s3.test":
+            return httpx.Response(200, json=[{"collection": "c", "score": 1.0, "doc": {"id": "1"}}])
+        status = statuses.pop(0) if statuses else 503
+        if status == 503:
+            return httpx.Response(503, headers={"Retry-After": retry_after[0]}, json={"message": "busy"})
+        return httpx.Response(
+            200, json={"took": 1, "total": 1, "docs": [], "isDocsInline": False, "docsUrl": "https://s3.test/r"}
+        )
+
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        timeout_ms=5000,
+    )
+    coll = client.collection("c")
+    res = coll.query(query={"queryString": {"query": "x"}}, options=RequestOptions(total_timeout_ms=1000))
+    assert res.documents == [{"id": "1"}]
+    assert [host for host, _ in timeouts] == ["api.lambdadb.ai", "api.lambdadb.ai", "s3.test"]
+    reads = [read for _, read in timeouts]
+    assert reads[0] <= 1.0 and reads[0] > reads[1] > reads[2]  # the remaining time, not 5s
+
+    timeouts.clear()
+    retry_after[0] = "2"
+    start = time.monotonic()
+    with pytest.raises(errors.LambdaDBError):
+        coll.query(query={"queryString": {"query": "x"}}, options=RequestOptions(total_timeout_ms=500))
+    assert len(timeouts) == 1 and time.monotonic() - start < 0.5  # no 2s backoff past the deadline
+
+    timeouts.clear()
+    with deadline(10):
+        time.sleep(0.02)
+        with pytest.raises(errors.DeadlineExceededError):
+            coll.docs.fetch(ids=["1"])
+    assert timeouts == []
+
+
+def test_deadline_covers_prefetch_threads_and_slow_presigned_bodies() -> None:
+    """Read-ahead requests inherit the caller's deadline, and a presigned body that is still
+    arriving at the deadline raises DeadlineExceededError instead of running past it."""
+    import httpx
+    from lambdadb import LambdaDB, RequestOptions, errors
+    from lambdadb.utils import deadline
+    from lambdadb.utils.deadlines import remaining
+
+    seen: list = []
+    left: list = []
+    inner = _list_docs_handler(seen, num_docs=30, max_per_response=10)
+
+    def list_handler(request: httpx.Request) -> httpx.Response:
+        left.append(remaining())
+        return inner(request)
+
+    with deadline(5000):
+        docs = list(_mock_client(list_handler).collection("c").docs.iter_all(page_size=10, prefetch=2))
+    assert len(docs) == 30
+    assert len(left) == 3 and all(x is not None and 0 < x <= 5 for x in left)
+
+    class SlowBody(httpx.SyncByteStream, httpx.AsyncByteStream):
+        def __iter__(self):
+            yield b"["
+            for _ in range(20):
+                time.sleep(0.05)
+                yield b'{"collection": "c", "score": 1.0, "doc": {"id": "1"}},'
+
+        async def __aiter__(self):
+            yield b"["
+            await asyncio.sleep(10)
+            yield b"]"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "s3.test":
+            return httpx.Response(200, stream=SlowBody())
+        return httpx.Response(
+            200, json={"took": 1, "total": 1, "docs": [], "isDocsInline": False, "docsUrl": "https://s3.test/r"}
+        )
+
+    opts = RequestOptions(total_timeout_ms=200)
+    coll = _mock_client(handler).collection("c")
+    start = time.monotonic()
+    with pytest.raises(errors.DeadlineExceededError):
+        coll.query(query={"queryString": {"query": "x"}}, options=opts)
+    assert time.monotonic() - start < 0.5
+
+    async_client = LambdaDB(
+        project_api_key="test-key", async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    async def run() -> None:
+        await async_client.collection("c").query_async(query={"queryString": {"query": "x"}}, options=opts)
+
+    start = time.monotonic()
+    with pytest.raises(errors.DeadlineExceededError):
+        asyncio.run(run())
+    assert time.monotonic() - start < 0.5
+
+
+def test_total_timeout_fails_fast_instead_of_waiting_on_the_rate_limiter() -> None:
+    """A rate limiter pause longer than the time left raises DeadlineExceededError right away."""
+    import httpx
+    from lambdadb import LambdaDB, RequestOptions, errors
+    from lambdadb.utils import RateLimiter
+
+    sent: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        return httpx.Response(202, json={"message": "ok"})
+
+    limiter = RateLimiter(rate=10)
+    limiter.throttled(retry_after=5.0)  # pause every request for 5s
+    client = LambdaDB(
+        project_api_key="test-key",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=limiter,
+    )
+    start = time.monotonic()
+    with pytest.raises(errors.DeadlineExceededError):
+        client.collection("c").docs.upsert(docs=[{"id": "1"}], options=RequestOptions(total_timeout_ms=200))
+    assert time.monotonic() - start < 0.2 and sent == []
+    assert limiter.stats().waits == 0